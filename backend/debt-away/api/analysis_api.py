@@ -0,0 +1,10 @@
+"""
+Entry point of AnalysisApiFunction: job lookup, job-fit analysis and resume
+crafting. These are long LLM calls (up to ~40 s) and resume text extraction,
+kept apart from the quick profile reads and from PDF compiles.
+"""
+from app_factory import create_app, create_handler
+from routers import analysis, crafting, jobs
+
+app = create_app(jobs, crafting, analysis)
+handler = create_handler(app)
@@ -0,0 +1,437 @@
+"""
+Pooled access layer for the ``ambit-dashboard-application-data`` single table.
+
+Single-Table Design:
+- PK: Cognito subID (user identifier)
+- SK: METADATA | SUBSCRIPTION | USAGE | PROFILE#MAIN | KNOWLEDGE#<kind>[#<career_focus>]
+      | RESUME#<sha256> (see resume_store)
+
+One botocore client is created per container and reused across warm Lambda
+invocations, so handlers no longer pay for a new session, credential resolution
+and TLS handshake on every request. The low-level client is thread-safe; calls
+run on a dedicated executor sized to the connection pool and are exposed as
+coroutines so they never block the event loop.
+"""
+import asyncio
+import functools
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Optional
+
+import boto3
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+REGION = 'us-east-1'
+APP_DATA_TABLE = 'ambit-dashboard-application-data'
+
+KNOWLEDGE_ESTABLISHED = 'ESTABLISHED'
+KNOWLEDGE_EXPANDING = 'EXPANDING'
+
+DYNAMODB_MAX_POOL_CONNECTIONS = 32
+BATCH_GET_MAX_ATTEMPTS = 5
+BATCH_GET_RETRY_BASE_DELAY = 0.05  # seconds, doubled after every attempt with unprocessed keys
+
+_boto_config = Config(
+    region_name=REGION,
+    max_pool_connections=DYNAMODB_MAX_POOL_CONNECTIONS,
+    tcp_keepalive=True,
+    retries={'max_attempts': 3, 'mode': 'standard'},
+)
+
+_session = boto3.session.Session()
+_client = _session.client('dynamodb', config=_boto_config)
+_resource = _session.resource('dynamodb', config=_boto_config)
+_executor = ThreadPoolExecutor(
+    max_workers=DYNAMODB_MAX_POOL_CONNECTIONS,
+    thread_name_prefix='dynamodb',
+)
+
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+_table_verified = False
+
+
+class ConditionalCheckFailed(Exception):
+    """Raised when a conditional write is rejected by DynamoDB."""
+
+
+class UnprocessedKeys(Exception):
+    """Raised when a batch read still has unprocessed keys after every retry."""
+
+
+# ── Low-level helpers ────────────────────────────────────────────────────────
+
+def get_dynamodb_client():
+    """Shared, connection-pooled low-level DynamoDB client (thread-safe)."""
+    return _client
+
+
+def get_dynamodb_resource():
+    """
+    Shared resource-level handle for the auxiliary tables (career_analysis_data,
+    lead_email, jobCache). Resource objects are not thread-safe, so only use it
+    from the event loop thread.
+    """
+    return _resource
+
+
+def _serialize(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: _serializer.serialize(v) for k, v in item.items()}
+
+
+def _deserialize(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {k: _deserializer.deserialize(v) for k, v in item.items()}
+
+
+def _key(pk: str, sk: str) -> Dict[str, Any]:
+    return {'PK': {'S': pk}, 'SK': {'S': sk}}
+
+
+def _is_conditional_failure(error: ClientError) -> bool:
+    code = error.response.get('Error', {}).get('Code', '')
+    if code == 'ConditionalCheckFailedException':
+        return True
+    if code == 'TransactionCanceledException':
+        reasons = error.response.get('CancellationReasons', [])
+        return any(r.get('Code') == 'ConditionalCheckFailed' for r in reasons)
+    return False
+
+
+async def run_in_executor(fn, *args, **kwargs):
+    """Run a blocking boto call on the DynamoDB executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, functools.partial(fn, *args, **kwargs))
+
+
+# ── Generic item operations ──────────────────────────────────────────────────
+
+async def get_item(pk: str, sk: str) -> Optional[Dict[str, Any]]:
+    response = await run_in_executor(_client.get_item, TableName=APP_DATA_TABLE, Key=_key(pk, sk))
+    item = response.get('Item')
+    return _deserialize(item) if item else None
+
+
+async def put_item(item: Dict[str, Any], condition_expression: Optional[str] = None) -> None:
+    kwargs = {'TableName': APP_DATA_TABLE, 'Item': _serialize(item)}
+    if condition_expression:
+        kwargs['ConditionExpression'] = condition_expression
+    try:
+        await run_in_executor(_client.put_item, **kwargs)
+    except ClientError as e:
+        if _is_conditional_failure(e):
+            raise ConditionalCheckFailed(str(e)) from e
+        raise
+
+
+async def update_item(
+    pk: str,
+    sk: str,
+    update_expression: str,
+    values: Optional[Dict[str, Any]] = None,
+    names: Optional[Dict[str, str]] = None,
+    condition_expression: Optional[str] = None,
+    return_values: str = 'NONE',
+) -> Dict[str, Any]:
+    """
+    UpdateItem with plain Python values. Returns the deserialized attributes
+    selected by ``return_values`` (empty dict when nothing is returned).
+    """
+    kwargs = {
+        'TableName': APP_DATA_TABLE,
+        'Key': _key(pk, sk),
+        'UpdateExpression': update_expression,
+        'ReturnValues': return_values,
+    }
+    if values:
+        kwargs['ExpressionAttributeValues'] = _serialize(values)
+    if names:
+        kwargs['ExpressionAttributeNames'] = names
+    if condition_expression:
+        kwargs['ConditionExpression'] = condition_expression
+    try:
+        response = await run_in_executor(_client.update_item, **kwargs)
+    except ClientError as e:
+        if _is_conditional_failure(e):
+            raise ConditionalCheckFailed(str(e)) from e
+        raise
+    return _deserialize(response.get('Attributes', {}))
+
+
+async def update_item_if(
+    pk: str,
+    sk: str,
+    update_expression: str,
+    check_sk: str,
+    check_expression: str,
+    values: Optional[Dict[str, Any]] = None,
+    names: Optional[Dict[str, str]] = None,
+    check_values: Optional[Dict[str, Any]] = None,
+    check_names: Optional[Dict[str, str]] = None,
+) -> None:
+    """
+    UpdateItem of (pk, sk) that only applies while the item (pk, check_sk)
+    satisfies ``check_expression``, as one TransactWriteItems call. Raises
+    ConditionalCheckFailed when the check fails. Returns nothing: transactions
+    do not return item attributes.
+    """
+    update = {'TableName': APP_DATA_TABLE, 'Key': _key(pk, sk), 'UpdateExpression': update_expression}
+    if values:
+        update['ExpressionAttributeValues'] = _serialize(values)
+    if names:
+        update['ExpressionAttributeNames'] = names
+    check = {'TableName': APP_DATA_TABLE, 'Key': _key(pk, check_sk), 'ConditionExpression': check_expression}
+    if check_values:
+        check['ExpressionAttributeValues'] = _serialize(check_values)
+    if check_names:
+        check['ExpressionAttributeNames'] = check_names
+    try:
+        await run_in_executor(_client.transact_write_items,
+                              TransactItems=[{'ConditionCheck': check}, {'Update': update}])
+    except ClientError as e:
+        if _is_conditional_failure(e):
+            raise ConditionalCheckFailed(str(e)) from e
+        raise
+
+
+async def batch_get_user_items(pk: str, sort_keys: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch several items of one user in a single BatchGetItem, keyed by SK.
+
+    Unprocessed keys (throttling) are retried with exponential backoff and
+    full jitter, up to BATCH_GET_MAX_ATTEMPTS calls in total; after that
+    UnprocessedKeys is raised rather than returning a partial result.
+    """
+    keys = [_key(pk, sk) for sk in dict.fromkeys(sort_keys)]
+    items: Dict[str, Dict[str, Any]] = {}
+    request = {APP_DATA_TABLE: {'Keys': keys}}
+    for attempt in range(BATCH_GET_MAX_ATTEMPTS):
+        if attempt:
+            await asyncio.sleep(random.uniform(0, BATCH_GET_RETRY_BASE_DELAY * (2 ** (attempt - 1))))
+        response = await run_in_executor(_client.batch_get_item, RequestItems=request)
+        for raw in response.get('Responses', {}).get(APP_DATA_TABLE, []):
+            item = _deserialize(raw)
+            items[item['SK']] = item
+        request = response.get('UnprocessedKeys')
+        if not request:
+            return items
+    remaining = len(request.get(APP_DATA_TABLE, {}).get('Keys', []))
+    raise UnprocessedKeys(f"{remaining} of {len(keys)} keys still unprocessed after {BATCH_GET_MAX_ATTEMPTS} attempts")
+
+
+async def _upsert_data(pk: str, sk: str, data: Dict[str, Any], timestamp: str) -> bool:
+    """
+    Write the ``data`` attribute of an item in one round trip, creating the item
+    when it does not exist. Returns True when the item was newly created.
+    """
+    old = await update_item(
+        pk, sk,
+        'SET #data = :data, updatedAt = :updatedAt, createdAt = if_not_exists(createdAt, :updatedAt)',
+        values={':data': data, ':updatedAt': timestamp},
+        names={'#data': 'data'},
+        return_values='UPDATED_OLD',
+    )
+    return 'updatedAt' not in old
+
+
+# ── Table bootstrap ──────────────────────────────────────────────────────────
+
+async def ensure_table() -> None:
+    """
+    Make sure the single table exists (PK/SK schema plus GSI1 for email lookups).
+    Checked once per container; later calls return immediately.
+    """
+    global _table_verified
+    if _table_verified:
+        return
+
+    try:
+        await run_in_executor(_client.describe_table, TableName=APP_DATA_TABLE)
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') != 'ResourceNotFoundException':
+            # Most likely missing DescribeTable permission — assume it exists.
+            _table_verified = True
+            return
+        await run_in_executor(
+            _client.create_table,
+            TableName=APP_DATA_TABLE,
+            KeySchema=[
+                {'AttributeName': 'PK', 'KeyType': 'HASH'},
+                {'AttributeName': 'SK', 'KeyType': 'RANGE'},
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'PK', 'AttributeType': 'S'},
+                {'AttributeName': 'SK', 'AttributeType': 'S'},
+                {'AttributeName': 'GSI1PK', 'AttributeType': 'S'},
+                {'AttributeName': 'GSI1SK', 'AttributeType': 'S'},
+            ],
+            GlobalSecondaryIndexes=[
+                {
+                    'IndexName': 'GSI1',
+                    'KeySchema': [
+                        {'AttributeName': 'GSI1PK', 'KeyType': 'HASH'},
+                        {'AttributeName': 'GSI1SK', 'KeyType': 'RANGE'},
+                    ],
+                    'Projection': {'ProjectionType': 'ALL'},
+                }
+            ],
+            BillingMode='PAY_PER_REQUEST',
+        )
+        waiter = _client.get_waiter('table_exists')
+        await run_in_executor(waiter.wait, TableName=APP_DATA_TABLE)
+    _table_verified = True
+
+
+# ── METADATA ─────────────────────────────────────────────────────────────────
+
+async def get_metadata(cognito_sub: str) -> Optional[Dict[str, Any]]:
+    return await get_item(cognito_sub, 'METADATA')
+
+
+async def touch_last_login(cognito_sub: str, timestamp: str) -> None:
+    await update_item(
+        cognito_sub, 'METADATA',
+        'SET updatedAt = :updatedAt, lastLoginAt = :lastLoginAt',
+        values={':updatedAt': timestamp, ':lastLoginAt': timestamp},
+    )
+
+
+async def create_user(cognito_sub: str, email: str, timestamp: str) -> bool:
+    """
+    Create METADATA, SUBSCRIPTION (free plan) and USAGE items in one transaction.
+    Returns False when the user already exists (concurrent registration).
+    """
+    metadata_item = {
+        'PK': cognito_sub,
+        'SK': 'METADATA',
+        'GSI1PK': f'EMAIL#{email}',
+        'GSI1SK': cognito_sub,
+        'email': email,
+        'createdAt': timestamp,
+        'updatedAt': timestamp,
+        'lastLoginAt': timestamp,
+        'data': {
+            'accountStatus': 'active',
+            'registrationSource': 'cognito',
+        },
+    }
+    subscription_item = {
+        'PK': cognito_sub,
+        'SK': 'SUBSCRIPTION',
+        'plan': 'free',
+        'SUB_ID': '',
+        'createdAt': timestamp,
+        'updatedAt': timestamp,
+    }
+    usage_item = new_usage_item(cognito_sub, timestamp)
+
+    try:
+        await run_in_executor(
+            _client.transact_write_items,
+            TransactItems=[
+                {'Put': {
+                    'TableName': APP_DATA_TABLE,
+                    'Item': _serialize(metadata_item),
+                    'ConditionExpression': 'attribute_not_exists(PK) AND attribute_not_exists(SK)',
+                }},
+                {'Put': {'TableName': APP_DATA_TABLE, 'Item': _serialize(subscription_item)}},
+                {'Put': {'TableName': APP_DATA_TABLE, 'Item': _serialize(usage_item)}},
+            ],
+        )
+    except ClientError as e:
+        if _is_conditional_failure(e):
+            return False
+        raise
+    return True
+
+
+# ── SUBSCRIPTION ─────────────────────────────────────────────────────────────
+
+async def get_plan(cognito_sub: str) -> str:
+    item = await get_item(cognito_sub, 'SUBSCRIPTION') or {}
+    return item.get('plan', 'free')
+
+
+async def mark_subscription_cancelled(cognito_sub: str) -> None:
+    await update_item(
+        cognito_sub, 'SUBSCRIPTION',
+        'SET #p = :free, cancel_at_period_end = :v',
+        values={':free': 'free', ':v': True},
+        names={'#p': 'plan'},
+    )
+
+
+# ── USAGE ────────────────────────────────────────────────────────────────────
+
+USAGE_COUNTERS = ('craft_count', 'analysis_count', 'download_count')
+
+
+def new_usage_item(cognito_sub: str, timestamp: str) -> Dict[str, Any]:
+    item = {'PK': cognito_sub, 'SK': 'USAGE', 'createdAt': timestamp, 'updatedAt': timestamp}
+    item.update({counter: 0 for counter in USAGE_COUNTERS})
+    return item
+
+
+async def get_usage(cognito_sub: str) -> Dict[str, int]:
+    item = await get_item(cognito_sub, 'USAGE') or {}
+    return {counter: int(item.get(counter, 0)) for counter in USAGE_COUNTERS}
+
+
+# ── PROFILE#MAIN ─────────────────────────────────────────────────────────────
+
+async def get_profile(cognito_sub: str) -> Optional[Dict[str, Any]]:
+    return await get_item(cognito_sub, 'PROFILE#MAIN')
+
+
+async def save_profile(cognito_sub: str, data: Dict[str, Any], timestamp: str) -> bool:
+    """Create or replace the profile data. Returns True when newly created."""
+    return await _upsert_data(cognito_sub, 'PROFILE#MAIN', data, timestamp)
+
+
+# ── KNOWLEDGE#* ──────────────────────────────────────────────────────────────
+
+def knowledge_sort_key(kind: str, career_focus: Optional[str] = None) -> str:
+    """KNOWLEDGE#<kind>#<career_focus>, or the legacy KNOWLEDGE#<kind> when no focus."""
+    return f'KNOWLEDGE#{kind}#{career_focus}' if career_focus else f'KNOWLEDGE#{kind}'
+
+
+async def get_knowledge(cognito_sub: str, kind: str, career_focus: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    return await get_item(cognito_sub, knowledge_sort_key(kind, career_focus))
+
+
+async def save_knowledge(cognito_sub: str, kind: str, career_focus: str, data: Dict[str, Any], timestamp: str) -> bool:
+    """Create or replace one career-focus knowledge item. Returns True when newly created."""
+    return await _upsert_data(cognito_sub, knowledge_sort_key(kind, career_focus), data, timestamp)
+
+
+# ── RESUME#<sha256> ──────────────────────────────────────────────────────────
+
+def resume_sort_key(content_hash: str) -> str:
+    return f'RESUME#{content_hash}'
+
+
+async def get_resume(owner: str, content_hash: str) -> Optional[Dict[str, Any]]:
+    return await get_item(owner, resume_sort_key(content_hash))
+
+
+async def save_resume_text(owner: str, content_hash: str, text: str, filename: str, timestamp: str) -> None:
+    await update_item(
+        owner, resume_sort_key(content_hash),
+        'SET #text = :text, filename = :filename, updatedAt = :updatedAt, '
+        'createdAt = if_not_exists(createdAt, :updatedAt)',
+        values={':text': text, ':filename': filename, ':updatedAt': timestamp},
+        names={'#text': 'text'},
+    )
+
+
+async def save_resume_parse(owner: str, content_hash: str, attribute: str, data: Dict[str, Any],
+                            timestamp: str) -> None:
+    """Store one structured parse of the resume in its own attribute."""
+    await update_item(
+        owner, resume_sort_key(content_hash),
+        'SET #parse = :data, updatedAt = :updatedAt, createdAt = if_not_exists(createdAt, :updatedAt)',
+        values={':data': data, ':updatedAt': timestamp},
+        names={'#parse': attribute},
+    )
@@ -0,0 +1,106 @@
+"""
+Builds the FastAPI application and its Mangum handler for a set of routers.
+
+app.py serves every router. The other entry points each serve one endpoint
+group and import only that group's routers, so every Lambda function in
+template.yaml can have its own package, memory size, timeout and
+provisioned concurrency:
+
+    read_api.py       profile, knowledge and billing (zip package)
+    chat_api.py       /ai-chat, buffered (handler) and streamed (app, uvicorn)
+    analysis_api.py   job lookup, analysis and resume crafting
+    app.py            everything; the LaTeX image also serves PDFs and landing forms
+
+All of them share the CORS policy, request logging and validation error
+handling set up here, and warm the external clients their routers declare in
+RESOURCES before the first request (see resources).
+"""
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from types import ModuleType
+from typing import Callable
+
+from aws_lambda_powertools import Logger
+from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from mangum import Mangum  # type: ignore
+
+import resources
+from upload_queue import drain_uploads
+
+logger = Logger()
+
+
+def create_app(*router_modules: ModuleType) -> FastAPI:
+    """An application serving the ``router`` of each of the given router modules."""
+    required = resources.required(router_modules)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Only runs under uvicorn: Mangum is created with lifespan="off"
+        if resources.WARM_RESOURCES == resources.LIFESPAN:
+            await resources.warm_async(required)
+        yield
+        if 'openai' in required:
+            from llm_gateway import close_llm_client
+
+            await close_llm_client()
+        # Loaded only by routers that fetch web pages; otherwise it has no client to close
+        http_client = sys.modules.get('http_client')
+        if http_client is not None:
+            await http_client.close_http_client()
+
+    app = FastAPI(lifespan=lifespan)
+    app.state.resources = required
+
+    @app.exception_handler(RequestValidationError)
+    async def validation_exception_handler(request: Request, exc: RequestValidationError):
+        logger.error(f"422 Validation Error on {request.method} {request.url}: {exc.errors()}")
+        return JSONResponse(status_code=422, content={"detail": exc.errors()})
+
+    # Add CORS middleware
+    app.add_middleware(
+        CORSMiddleware,
+        # allow_origins=["*"],
+        allow_origins=["http://localhost:3000",
+                       "https://ambitology.com",
+                       "https://www.ambitology.com",
+                       "https://main.d3a19hn400g7xw.amplifyapp.com"],
+        allow_credentials=True,
+        allow_methods=["OPTIONS", "POST", "GET"],  # Ensure OPTIONS is included
+        # Include necessary headers
+        allow_headers=["Content-Type", "Authorization"],
+        # allow_methods=["*"],
+        # allow_headers=["*"],
+    )
+
+    @app.middleware("http")
+    async def log_requests(request, call_next):
+        logger.info(f"Incoming request: {request.method} {request.url}")
+        response = await call_next(request)
+        return response
+
+    for module in router_modules:
+        app.include_router(module.router)
+    return app
+
+
+def create_handler(app: FastAPI) -> Callable:
+    """The Lambda handler for an application built by create_app()."""
+    # Mangum would run a lifespan around every invocation; warm the clients once, at init
+    mangum_handler = Mangum(app, lifespan="off")
+    if resources.WARM_RESOURCES == resources.INIT:
+        # Mangum serves every invocation on the loop it set up in its constructor
+        resources.warm(app.state.resources, asyncio.get_event_loop())
+
+    def handler(event, context):
+        try:
+            return mangum_handler(event, context)
+        finally:
+            # Lambda may freeze the container once we return: finish queued S3 uploads first
+            drain_uploads()
+
+    return handler
@@ -0,0 +1,10 @@
+"""
+Entry point of ChatApiFunction (the buffered /ai-chat endpoint, through
+handler) and of AiChatStreamFunction (streaming clients, app served by uvicorn
+behind the Lambda Web Adapter).
+"""
+from app_factory import create_app, create_handler
+from routers import chat
+
+app = create_app(chat)
+handler = create_handler(app)
@@ -1,13 +1,13 @@
 import json
-import requests
+import httpx
 from aws_lambda_powertools import Logger
-from requests.exceptions import RequestException
 from config import EXPERIAN_USERNAME, EXPERIAN_PASSWORD, EXPERIAN_CLIENT_ID, EXPERIAN_SECRET
+from http_client import fetch
 
 logger = Logger()
 
 
-def experian_token_handler():
+async def experian_token_handler():
     """
     AWS Lambda function to call Experian's token endpoint and retrieve an access token.
     """
@@ -28,11 +28,12 @@ def experian_token_handler():
 
     try:
         # Make the POST request to Experian
-        response = requests.post(url, headers=headers, json=payload)
-        response.raise_for_status()
+        response = await fetch(url, method="POST", headers=headers, json=payload)
+        if not response.ok:
+            raise httpx.HTTPError(f"HTTP {response.status_code} from Experian token endpoint")
 
         # Parse the JSON response
-        data = response.json()
+        data = json.loads(response.content)
         logger.info("experian data: ", data)
 
         return {
@@ -41,7 +42,7 @@ def experian_token_handler():
             "token_type": data.get("token_type"),
             "refresh_token": data.get("refresh_token"),
         }
-    except RequestException as e:
+    except httpx.HTTPError as e:
         # Handle any errors in the request
         return {
             "error": str(e),
@@ -49,7 +50,7 @@ def experian_token_handler():
         }
 
 
-def credit_report_handler():
+async def credit_report_handler():
     url = "https://sandbox-us-api.experian.com/oauth2/v1/token"
     headers = {
         "Accept": "application/json",
@@ -65,11 +66,12 @@ def credit_report_handler():
     }
 
     # Make the POST request to Experian
-    response = requests.post(url, headers=headers, json=payload)
-    response.raise_for_status()
+    response = await fetch(url, method="POST", headers=headers, json=payload)
+    if not response.ok:
+        raise httpx.HTTPError(f"HTTP {response.status_code} from Experian token endpoint")
 
     # Parse the JSON response
-    data = response.json()
+    data = json.loads(response.content)
     authorization_token = data.get("access_token")
     logger.info(f"authorization_token: {authorization_token}")
 
@@ -102,11 +104,12 @@ def credit_report_handler():
     }
 
     try:
-        response = requests.post(url, headers=headers, json=payload)
-        logger.info("credit report : ", json.dumps(response.json()))
+        response = await fetch(url, method="POST", headers=headers, json=payload)
+        report = json.loads(response.content)
+        logger.info("credit report : ", json.dumps(report))
 
-        return response.json()
-    except RequestException as e:
+        return report
+    except httpx.HTTPError as e:
         logger.error("error:", str(e))
         return {
             "error": str(e),
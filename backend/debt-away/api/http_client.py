@@ -0,0 +1,169 @@
+"""
+Shared async HTTP client for outbound web fetches.
+
+Job page scraping, robots.txt checks, job URL reachability probes, project URL
+fetches in /ai-chat and the Experian calls all go through fetch(). That gives
+them one pooled httpx.AsyncClient with:
+
+- keep-alive connections reused across requests and warm invocations
+- HTTP/2 where the server negotiates it
+- a per-host concurrency cap, so one slow job board cannot take the whole pool
+- a response size cap; bodies are streamed and cut off at max_bytes
+
+Like llm_gateway, the client is rebuilt (and the old one closed) when the
+running event loop changes, because httpx connections are bound to the loop
+that opened them.
+"""
+import asyncio
+from dataclasses import dataclass
+from typing import Dict, Optional, Set
+from urllib.parse import urlsplit
+
+import httpx
+from aws_lambda_powertools import Logger
+
+logger = Logger()
+
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_KEEPALIVE_EXPIRY = 60.0  # seconds
+HTTP_MAX_CONNECTIONS_PER_HOST = 8
+HTTP_DEFAULT_TIMEOUT = httpx.Timeout(15.0, connect=5.0)
+HTTP_MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+HTTP_MAX_REDIRECTS = 5
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_host_slots: Dict[str, asyncio.Semaphore] = {}
+_closing: Set[asyncio.Task] = set()  # aclose() tasks of replaced clients, referenced until done
+
+
+@dataclass
+class FetchResult:
+    status_code: int
+    headers: httpx.Headers
+    content: bytes
+    url: str
+    encoding: Optional[str] = None
+    truncated: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+
+def _build_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=True,
+        follow_redirects=True,
+        max_redirects=HTTP_MAX_REDIRECTS,
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=HTTP_KEEPALIVE_EXPIRY,
+        ),
+        timeout=HTTP_DEFAULT_TIMEOUT,
+    )
+
+
+async def _close_quietly(client: httpx.AsyncClient) -> None:
+    try:
+        await client.aclose()
+    except Exception as e:
+        logger.warning(f"Could not close replaced HTTP client: {str(e)}")
+
+
+def _retire(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop) -> None:
+    """Close a client built on another event loop, so its pooled connections are not leaked."""
+    if loop.is_running():
+        # Still serving in another thread: close it there
+        asyncio.run_coroutine_threadsafe(_close_quietly(client), loop)
+        return
+    task = asyncio.get_running_loop().create_task(_close_quietly(client))
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the process-wide pooled client (call from a running event loop)."""
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        if _client is not None:
+            logger.info("Event loop changed, rebuilding HTTP client")
+            _retire(_client, _client_loop)
+        _client = _build_client()
+        _client_loop = loop
+        _host_slots.clear()
+    return _client
+
+
+def _host_slot(url: str) -> asyncio.Semaphore:
+    host = urlsplit(url).netloc.lower()
+    slot = _host_slots.get(host)
+    if slot is None:
+        slot = _host_slots[host] = asyncio.Semaphore(HTTP_MAX_CONNECTIONS_PER_HOST)
+    return slot
+
+
+async def fetch(
+    url: str,
+    *,
+    method: str = 'GET',
+    headers: Optional[Dict[str, str]] = None,
+    json: Optional[dict] = None,
+    timeout: Optional[float] = None,
+    max_bytes: int = HTTP_MAX_RESPONSE_BYTES,
+) -> FetchResult:
+    """
+    Perform a request and read at most ``max_bytes`` of the body.
+
+    ``max_bytes=0`` skips the body entirely (reachability checks). Transport
+    errors propagate as httpx exceptions (httpx.TimeoutException,
+    httpx.ConnectError, ...); HTTP error statuses are returned, not raised.
+    """
+    client = get_http_client()
+    request_timeout = httpx.Timeout(timeout, connect=min(timeout, 5.0)) if timeout else HTTP_DEFAULT_TIMEOUT
+
+    async with _host_slot(url):
+        async with client.stream(method, url, headers=headers, json=json, timeout=request_timeout) as response:
+            chunks = []
+            size = 0
+            truncated = False
+            if max_bytes > 0:
+                async for chunk in response.aiter_bytes():
+                    remaining = max_bytes - size
+                    if len(chunk) > remaining:
+                        chunks.append(chunk[:remaining])
+                        size = max_bytes
+                        truncated = True
+                        break
+                    chunks.append(chunk)
+                    size += len(chunk)
+            if truncated:
+                logger.warning(f"Response from {url} truncated at {max_bytes} bytes")
+
+            return FetchResult(
+                status_code=response.status_code,
+                headers=response.headers,
+                content=b''.join(chunks),
+                url=str(response.url),
+                encoding=response.charset_encoding,
+                truncated=truncated,
+            )
+
+
+async def close_http_client() -> None:
+    """Close the pooled connections (called from the application lifespan on shutdown)."""
+    global _client, _client_loop
+
+    if _client is not None:
+        await _client.aclose()
+    _client = None
+    _client_loop = None
+    _host_slots.clear()
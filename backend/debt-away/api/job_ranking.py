@@ -0,0 +1,234 @@
+"""
+Deterministic ranking engine for /job-recommendations.
+
+The whole pool of listings for a position is scored in one vectorized NumPy
+pass, combining:
+
+- skill match: cosine similarity between the user's skills / career focus and
+  each listing's title + required skills, using TF-IDF weights computed over
+  the pool (a term present in every title, like "engineer", counts little)
+- company tier: a static prestige table seeded from TARGET_COMPANIES of the
+  jobCache refresh
+- base rank: the order precomputed by the refresh (see
+  job_listing_cache/handler.py build_base_rankings), used as a weak prior
+- diversity: every further listing from the same company is penalised, so a
+  single employer cannot fill the list
+
+The vectorized pool (JobIndex) is cached per (position, batch_id), so warm
+requests only build the user vector and do one matrix-vector product.
+"""
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, Tuple
+
+import numpy as np
+
+RECOMMENDATION_LIMIT = 20
+
+# Score weights (each signal is scaled to 0..1)
+SKILL_WEIGHT = 0.5
+COMPANY_WEIGHT = 0.3
+BASE_RANK_WEIGHT = 0.2
+DIVERSITY_PENALTY = 0.15  # per earlier listing from the same company
+TIE_EPSILON = 0.01        # scores this close to the cutoff count as tied
+
+JOB_INDEX_CACHE_MAX_ENTRIES = 64
+
+# Seeded from TARGET_COMPANIES in job_listing_cache/handler.py; keep in sync.
+COMPANY_TIERS: Dict[str, float] = {
+    **dict.fromkeys((
+        'google', 'apple', 'meta', 'amazon', 'microsoft', 'nvidia', 'openai', 'anthropic',
+        'netflix', 'jane street', 'citadel securities', 'hudson river trading', 'two sigma',
+        'jump trading',
+    ), 1.0),
+    **dict.fromkeys((
+        'databricks', 'stripe', 'snowflake', 'xai', 'perplexity', 'waymo', 'coreweave',
+        'harvey', 'airbnb', 'uber', 'salesforce', 'adobe', 'bloomberg', 'optiver',
+        'imc trading', 'tower research capital',
+    ), 0.85),
+    **dict.fromkeys((
+        'oracle', 'jpmorganchase', 'jpmorgan', 'goldman sachs', 'capital one',
+        'american express', 'clean',
+    ), 0.7),
+}
+UNLISTED_COMPANY_SCORE = 0.3
+
+_TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+_STOPWORDS = frozenset({'a', 'an', 'and', 'for', 'in', 'of', 'on', 'the', 'to', 'with', 'not', 'specified'})
+# Company names match on whole words, so "Clean" does not match "Cleanlab"
+_COMPANY_PATTERNS = [
+    (re.compile(r'\b' + re.escape(name) + r'\b'), score)
+    for name, score in sorted(COMPANY_TIERS.items(), key=lambda item: -len(item[0]))
+]
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in (t.rstrip('.') for t in _TOKEN_RE.findall((text or '').lower()))
+            if token and token not in _STOPWORDS]
+
+
+def user_tokens(user_skills: Iterable[str], career_focus: str = '') -> Set[str]:
+    tokens = set(tokenize(career_focus))
+    for skill in user_skills or []:
+        if isinstance(skill, str):
+            tokens.update(tokenize(skill))
+    return tokens
+
+
+@lru_cache(maxsize=4096)
+def company_score(company_name: str) -> float:
+    name = (company_name or '').lower()
+    for pattern, score in _COMPANY_PATTERNS:
+        if pattern.search(name):
+            return score
+    return UNLISTED_COMPANY_SCORE
+
+
+# ── Pool vectorization ───────────────────────────────────────────────────────
+
+@dataclass
+class JobIndex:
+    jobs: List[Dict]
+    vocabulary: Dict[str, int]
+    idf: np.ndarray             # (V,)
+    tfidf: np.ndarray           # (n, V), rows L2-normalised
+    company_scores: np.ndarray  # (n,)
+    company_ids: np.ndarray     # (n,) integer id per distinct company
+    base_prior: np.ndarray      # (n,) 1.0 for the first stored listing -> ~0 for the last
+
+
+def build_index(jobs: List[Dict]) -> JobIndex:
+    n = len(jobs)
+    vocabulary: Dict[str, int] = {}
+    rows: List[int] = []
+    cols: List[int] = []
+    for row, job in enumerate(jobs):
+        text = ' '.join([job.get('job_title') or '', *(job.get('job_skills') or [])])
+        for token in tokenize(text):
+            rows.append(row)
+            cols.append(vocabulary.setdefault(token, len(vocabulary)))
+
+    counts = np.zeros((n, max(len(vocabulary), 1)), dtype=np.float32)
+    np.add.at(counts, (np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)), 1.0)
+
+    document_frequency = np.count_nonzero(counts, axis=0)
+    idf = (np.log((1.0 + n) / (1.0 + document_frequency)) + 1.0).astype(np.float32)
+    tfidf = counts * idf
+    norms = np.linalg.norm(tfidf, axis=1, keepdims=True)
+    tfidf /= np.where(norms > 0, norms, 1.0)
+
+    company_keys = [(job.get('company_name') or '').strip().lower() for job in jobs]
+    _, company_ids = np.unique(np.asarray(company_keys, dtype=object), return_inverse=True)
+
+    return JobIndex(
+        jobs=jobs,
+        vocabulary=vocabulary,
+        idf=idf,
+        tfidf=tfidf,
+        company_scores=np.fromiter((company_score(job.get('company_name') or '') for job in jobs),
+                                   dtype=np.float32, count=n),
+        company_ids=company_ids.astype(np.intp),
+        base_prior=1.0 - np.arange(n, dtype=np.float32) / max(n, 1),
+    )
+
+
+_indexes: 'OrderedDict[Tuple[str, str], JobIndex]' = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def get_index(position: str, batch_id: str, jobs: List[Dict]) -> JobIndex:
+    """Cached build_index() for one refresh batch of a position's pool."""
+    key = (position, batch_id)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is not None:
+            _indexes.move_to_end(key)
+            return index
+    index = build_index(jobs)
+    with _indexes_lock:
+        _indexes[key] = index
+        while len(_indexes) > JOB_INDEX_CACHE_MAX_ENTRIES:
+            _indexes.popitem(last=False)
+    return index
+
+
+# ── Ranking ──────────────────────────────────────────────────────────────────
+
+@dataclass
+class Ranking:
+    order: np.ndarray   # indices into JobIndex.jobs, best first
+    scores: np.ndarray  # final score of each entry of ``order`` (non-increasing)
+
+
+def _occurrence_within_group(group_ids: np.ndarray) -> np.ndarray:
+    """For each element, how many earlier elements share its group id."""
+    n = len(group_ids)
+    by_group = np.argsort(group_ids, kind='stable')
+    sorted_ids = group_ids[by_group]
+    starts = np.flatnonzero(np.r_[True, sorted_ids[1:] != sorted_ids[:-1]])
+    run_lengths = np.diff(np.r_[starts, n])
+    occurrence = np.empty(n, dtype=np.intp)
+    occurrence[by_group] = np.arange(n) - np.repeat(starts, run_lengths)
+    return occurrence
+
+
+def skill_similarity(index: JobIndex, user_skills: Iterable[str], career_focus: str = '') -> np.ndarray:
+    query = np.zeros(index.tfidf.shape[1], dtype=np.float32)
+    for token in user_tokens(user_skills, career_focus):
+        column = index.vocabulary.get(token)
+        if column is not None:
+            query[column] = index.idf[column]
+    norm = np.linalg.norm(query)
+    if norm == 0:
+        return np.zeros(len(index.jobs), dtype=np.float32)
+    return index.tfidf @ (query / norm)
+
+
+def rank(index: JobIndex, user_skills: Iterable[str], career_focus: str = '') -> Ranking:
+    """Score and order the whole pool; deterministic for the same inputs."""
+    n = len(index.jobs)
+    if n == 0:
+        return Ranking(np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32))
+
+    positions = np.arange(n)
+    score = (SKILL_WEIGHT * skill_similarity(index, user_skills, career_focus)
+             + COMPANY_WEIGHT * index.company_scores
+             + BASE_RANK_WEIGHT * index.base_prior)
+
+    # Order by score (stored position breaks ties), then penalise repeats of a
+    # company in that order and re-sort
+    order = np.lexsort((positions, -score))
+    adjusted = score[order] - DIVERSITY_PENALTY * _occurrence_within_group(index.company_ids[order])
+    resorted = np.lexsort((positions, -adjusted))
+    return Ranking(order=order[resorted], scores=adjusted[resorted])
+
+
+def tie_window(ranking: Ranking, limit: int = RECOMMENDATION_LIMIT,
+               epsilon: float = TIE_EPSILON) -> Tuple[int, int]:
+    """
+    Slice [start, end) of ``ranking.order`` whose scores are within ``epsilon``
+    of the score at the cutoff position, i.e. the listings whose inclusion in
+    the top ``limit`` is effectively a coin flip. Empty when nothing is tied.
+    """
+    n = len(ranking.order)
+    if n <= limit:
+        return (0, 0)
+    cutoff = ranking.scores[limit - 1]
+    descending = -ranking.scores
+    start = int(np.searchsorted(descending, -(cutoff + epsilon), side='left'))
+    end = int(np.searchsorted(descending, -(cutoff - epsilon), side='right'))
+    if end - start < 2:
+        return (0, 0)
+    return (start, end)
+
+
+def public_job(job: Dict) -> Dict[str, str]:
+    """Response shape of /job-recommendations entries."""
+    return {
+        'job_title': job.get('job_title', ''),
+        'company_name': job.get('company_name', ''),
+        'job_url': job.get('job_url', ''),
+    }
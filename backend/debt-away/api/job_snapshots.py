@@ -0,0 +1,106 @@
+"""
+Process-level cache of the materialized jobCache position snapshots.
+
+The jobCache refresh (job_listing_cache/handler.py) writes one item per
+position into the ``#ranking`` partition: the ranked listings as
+zlib-compressed JSON, tagged with the refresh batch_id. Then it points the
+``#current`` item at that batch. Listings change only twice a month, so:
+
+- snapshots are cached in memory per (position, batch_id)
+- the current batch_id is re-read at most every CURRENT_BATCH_CHECK_SECONDS
+
+Warm containers therefore serve /job-recommendations with no DynamoDB round
+trip. After a refresh they pick up the new batch within one check interval.
+"""
+import json
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from aws_lambda_powertools import Logger
+
+from app_data_repository import get_dynamodb_client, run_in_executor
+
+logger = Logger()
+
+JOB_CACHE_TABLE = 'jobCache'
+SNAPSHOT_PARTITION = '#ranking'
+CURRENT_BATCH_SK = '#current'
+CURRENT_BATCH_CHECK_SECONDS = 300
+SNAPSHOT_CACHE_MAX_ENTRIES = 128
+
+
+@dataclass
+class PositionSnapshot:
+    position: str
+    batch_id: str
+    jobs: List[Dict[str, Any]]
+
+
+_snapshots: 'OrderedDict[Tuple[str, str], Optional[PositionSnapshot]]' = OrderedDict()
+_lock = threading.Lock()
+_current_batch: Dict[str, Any] = {'batch_id': None, 'checked_at': 0.0}
+
+
+def decode_snapshot(position: str, item: Dict[str, Any]) -> PositionSnapshot:
+    """Decode a low-level DynamoDB snapshot item."""
+    batch_id = item.get('batch_id', {}).get('S', '')
+    if 'snapshot' in item:
+        jobs = json.loads(zlib.decompress(item['snapshot']['B']))
+    else:
+        # Items written before snapshots were compressed
+        jobs = json.loads(item['jobs']['S'])
+    return PositionSnapshot(position, batch_id, jobs)
+
+
+async def _get_item(sort_key: str, projection: str,
+                    names: Optional[Dict[str, str]] = None) -> Optional[Dict[str, Any]]:
+    params = {
+        'TableName': JOB_CACHE_TABLE,
+        'Key': {'job_type': {'S': SNAPSHOT_PARTITION}, 'sk': {'S': sort_key}},
+        'ProjectionExpression': projection,
+    }
+    if names:
+        params['ExpressionAttributeNames'] = names
+    response = await run_in_executor(get_dynamodb_client().get_item, **params)
+    return response.get('Item')
+
+
+async def current_batch_id() -> str:
+    """Latest refresh batch_id, re-read from DynamoDB at most every check interval."""
+    now = time.monotonic()
+    if _current_batch['batch_id'] is not None and now - _current_batch['checked_at'] < CURRENT_BATCH_CHECK_SECONDS:
+        return _current_batch['batch_id']
+
+    item = await _get_item(CURRENT_BATCH_SK, 'batch_id')
+    batch_id = item['batch_id']['S'] if item else ''
+    if batch_id != _current_batch['batch_id']:
+        logger.info(f"jobCache batch is now '{batch_id or 'unknown'}'")
+    _current_batch.update(batch_id=batch_id, checked_at=now)
+    return batch_id
+
+
+async def get_snapshot(position: str) -> Optional[PositionSnapshot]:
+    """
+    Snapshot for a normalized position name, or None when the refresh has not
+    materialized one. Both outcomes are cached for the current batch.
+    """
+    key = (position, await current_batch_id())
+    with _lock:
+        if key in _snapshots:
+            _snapshots.move_to_end(key)
+            return _snapshots[key]
+
+    # SNAPSHOT is a DynamoDB reserved word
+    item = await _get_item(position, '#snap, jobs, batch_id', {'#snap': 'snapshot'})
+    snapshot = decode_snapshot(position, item) if item else None
+
+    with _lock:
+        _snapshots[key] = snapshot
+        _snapshots.move_to_end(key)
+        while len(_snapshots) > SNAPSHOT_CACHE_MAX_ENTRIES:
+            _snapshots.popitem(last=False)
+    return snapshot
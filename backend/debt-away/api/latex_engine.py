@@ -0,0 +1,151 @@
+"""
+pdflatex compile engine for the resume PDF.
+
+Three changes against a plain "run pdflatex twice" compile:
+
+- The fixed part of the resume preamble (RESUME_PREAMBLE: document class and
+  packages) is dumped once per container into a format file. Compiles whose
+  source starts with that preamble load the format instead of re-reading
+  every package. Other sources, or a failed dump, compile normally.
+- One pass. pdflatex runs again only when the log asks for it (the resume
+  template has no cross-references, so in practice it never does).
+- The compile directory lives on tmpfs (/dev/shm) when the host has one,
+  otherwise under /tmp. Lambda has no /dev/shm, so there it is /tmp.
+"""
+import hashlib
+import os
+import re
+import subprocess
+import threading
+import time
+from typing import List, Optional
+
+from aws_lambda_powertools import Logger
+
+logger = Logger()
+
+PDFLATEX = os.environ.get('PDFLATEX', '/usr/local/bin/pdflatex')
+COMPILE_TIMEOUT_SECONDS = 30
+MAX_PASSES = 3
+
+# Fixed preamble shared by every generated resume; keep generate_latex_content()
+# in routers/pdf.py starting with exactly this text
+RESUME_PREAMBLE = """\\documentclass[10pt,a4paper]{article}
+
+% ATS-Optimized packages
+\\usepackage{geometry}
+\\usepackage{enumitem}
+\\usepackage{setspace}
+\\usepackage{titlesec}
+"""
+
+_RERUN_RE = re.compile(r'Rerun to get|Label\(s\) may have changed|Please rerun|\(rerunfilecheck\)')
+
+_format_lock = threading.Lock()
+_format_state = {'path': None, 'failed': False}
+
+
+def compile_root() -> str:
+    """Directory for compile jobs: LATEX_COMPILE_ROOT, else tmpfs when present, else /tmp."""
+    configured = os.environ.get('LATEX_COMPILE_ROOT')
+    if configured:
+        return configured
+    for candidate in ('/dev/shm', '/tmp'):
+        if os.path.isdir(candidate) and os.access(candidate, os.W_OK):
+            return candidate
+    return '/tmp'
+
+
+def needs_rerun(log_text: str) -> bool:
+    return bool(_RERUN_RE.search(log_text))
+
+
+def split_preamble(latex_content: str) -> Optional[str]:
+    """The document after RESUME_PREAMBLE, or None if it does not start with it."""
+    if latex_content.startswith(RESUME_PREAMBLE):
+        return latex_content[len(RESUME_PREAMBLE):]
+    return None
+
+
+def _run(cmd: List[str], cwd: str) -> subprocess.CompletedProcess:
+    return subprocess.run(cmd, cwd=cwd, capture_output=True, timeout=COMPILE_TIMEOUT_SECONDS, text=True)
+
+
+def preamble_format() -> Optional[str]:
+    """
+    Path of the dumped preamble format (without the .fmt suffix), built on
+    first use. None when dumping failed; not retried in this container.
+    """
+    if _format_state['path'] or _format_state['failed']:
+        return _format_state['path']
+    with _format_lock:
+        if _format_state['path'] or _format_state['failed']:
+            return _format_state['path']
+
+        started = time.perf_counter()
+        digest = hashlib.sha256(RESUME_PREAMBLE.encode('utf-8')).hexdigest()[:12]
+        format_dir = os.path.join(compile_root(), 'latex-format')
+        name = f"resume-preamble-{digest}"
+        os.makedirs(format_dir, exist_ok=True)
+        with open(os.path.join(format_dir, f"{name}.tex"), 'w', encoding='utf-8') as f:
+            f.write(RESUME_PREAMBLE + '\\dump\n')
+
+        try:
+            result = _run([PDFLATEX, '-ini', '-interaction=nonstopmode', f'-jobname={name}',
+                           '&pdflatex', f"{name}.tex"], cwd=format_dir)
+            format_file = os.path.join(format_dir, f"{name}.fmt")
+            if result.returncode != 0 or not os.path.exists(format_file):
+                raise RuntimeError(result.stdout[-2000:])
+        except Exception as e:
+            logger.warning(f"Could not dump resume preamble format, compiling without it: {str(e)}")
+            _format_state['failed'] = True
+            return None
+
+        _format_state['path'] = os.path.join(format_dir, name)
+        logger.info("Resume preamble format dumped",
+                    extra={"duration_ms": round((time.perf_counter() - started) * 1000, 1)})
+        return _format_state['path']
+
+
+def compile_pdf(latex_content: str, output_dir: str, use_format: bool = True) -> str:
+    """
+    Compile a LaTeX document into ``output_dir``/resume.pdf.
+
+    Raises:
+        RuntimeError: If pdflatex fails or produces no PDF
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    started = time.perf_counter()
+
+    body = split_preamble(latex_content) if use_format else None
+    format_path = preamble_format() if body is not None else None
+    if format_path is None:
+        body = latex_content
+
+    with open(os.path.join(output_dir, "resume.tex"), 'w', encoding='utf-8') as f:
+        f.write(body)
+
+    cmd = [PDFLATEX, '-interaction=nonstopmode', '-halt-on-error']
+    if format_path:
+        cmd.append(f'-fmt={format_path}')
+    cmd.append('resume.tex')
+
+    passes = 0
+    while True:
+        passes += 1
+        result = _run(cmd, cwd=output_dir)
+        if result.returncode != 0 or passes >= MAX_PASSES or not needs_rerun(result.stdout):
+            break
+
+    pdf_file = os.path.join(output_dir, "resume.pdf")
+    if result.returncode != 0:
+        logger.error(f"pdflatex compilation failed with return code {result.returncode}")
+        logger.error(f"pdflatex stdout: {result.stdout}")
+        logger.error(f"pdflatex stderr: {result.stderr}")
+        raise RuntimeError(f"PDF compilation failed: {result.stderr}")
+    if not os.path.exists(pdf_file):
+        raise RuntimeError("PDF file was not generated")
+
+    logger.info("PDF compiled", extra={"passes": passes, "preamble_format": bool(format_path),
+                                       "duration_ms": round((time.perf_counter() - started) * 1000, 1)})
+    return pdf_file
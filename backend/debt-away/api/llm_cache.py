@@ -0,0 +1,162 @@
+"""
+Content-addressed cache for deterministic structured-output LLM calls.
+
+Endpoints whose prompt depends only on the request text (fetch_with_job_title,
+parse_job_description, validate_and_fetch_job_url) call cached_parse() instead
+of llm.responses.parse(). Results are keyed by a SHA-256 of
+(endpoint, model, input messages, output JSON schema), so a prompt or schema
+change naturally invalidates old entries.
+
+Two tiers:
+- in-process LRU with TTL, reused across warm invocations of one container
+- DynamoDB table ``llmResponseCache`` with a TTL attribute, shared by all
+  containers
+
+Cache failures are logged and never fail the request.
+"""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Type, TypeVar
+
+from aws_lambda_powertools import Logger
+from pydantic import BaseModel
+
+from app_data_repository import get_dynamodb_client, run_in_executor
+
+logger = Logger()
+
+LLM_CACHE_TABLE = 'llmResponseCache'
+LLM_CACHE_TTL_SECONDS = 7 * 24 * 3600
+LLM_CACHE_LOCAL_MAX_ENTRIES = 512
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+_local: 'OrderedDict[str, tuple]' = OrderedDict()  # key -> (expires_at, payload dict)
+_local_lock = threading.Lock()
+
+
+def cache_key(endpoint: str, model: str, input: List[Dict[str, Any]], text_format: Type[BaseModel]) -> str:
+    material = json.dumps(
+        {
+            'endpoint': endpoint,
+            'model': model,
+            'input': input,
+            'schema': text_format.model_json_schema(),
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+
+# ── Tier 1: in-process LRU ───────────────────────────────────────────────────
+
+def _local_get(key: str) -> Optional[Dict[str, Any]]:
+    with _local_lock:
+        entry = _local.get(key)
+        if entry is None:
+            return None
+        expires_at, payload = entry
+        if expires_at <= time.time():
+            del _local[key]
+            return None
+        _local.move_to_end(key)
+        return payload
+
+
+def _local_set(key: str, payload: Dict[str, Any], expires_at: float) -> None:
+    with _local_lock:
+        _local[key] = (expires_at, payload)
+        _local.move_to_end(key)
+        while len(_local) > LLM_CACHE_LOCAL_MAX_ENTRIES:
+            _local.popitem(last=False)
+
+
+# ── Tier 2: DynamoDB ─────────────────────────────────────────────────────────
+
+async def _remote_get(key: str) -> Optional[tuple]:
+    try:
+        response = await run_in_executor(
+            get_dynamodb_client().get_item,
+            TableName=LLM_CACHE_TABLE,
+            Key={'cache_key': {'S': key}},
+        )
+    except Exception as e:
+        logger.warning(f"LLM cache read failed: {str(e)}")
+        return None
+    item = response.get('Item')
+    if not item:
+        return None
+    # DynamoDB TTL deletion is lazy, so expired items may still be returned
+    expires_at = int(item['expires_at']['N'])
+    if expires_at <= time.time():
+        return None
+    return expires_at, json.loads(item['payload']['S'])
+
+
+async def _remote_set(key: str, endpoint: str, model: str, payload: Dict[str, Any], expires_at: int) -> None:
+    try:
+        await run_in_executor(
+            get_dynamodb_client().put_item,
+            TableName=LLM_CACHE_TABLE,
+            Item={
+                'cache_key': {'S': key},
+                'endpoint': {'S': endpoint},
+                'model': {'S': model},
+                'payload': {'S': json.dumps(payload, ensure_ascii=False)},
+                'expires_at': {'N': str(expires_at)},
+            },
+        )
+    except Exception as e:
+        logger.warning(f"LLM cache write failed: {str(e)}")
+
+
+# ── Public API ───────────────────────────────────────────────────────────────
+
+async def cached_parse(
+    llm,
+    endpoint: str,
+    *,
+    model: str,
+    input: List[Dict[str, Any]],
+    text_format: Type[ModelT],
+    ttl: int = LLM_CACHE_TTL_SECONDS,
+) -> ModelT:
+    """
+    Drop-in replacement for ``llm.responses.parse(...).output_parsed`` that
+    serves repeated prompts from the cache.
+    """
+    key = cache_key(endpoint, model, input, text_format)
+
+    payload = _local_get(key)
+    if payload is not None:
+        logger.info(f"LLM cache hit (memory) for {endpoint}")
+        return text_format.model_validate(payload)
+
+    remote = await _remote_get(key)
+    if remote is not None:
+        expires_at, payload = remote
+        try:
+            result = text_format.model_validate(payload)
+        except Exception as e:
+            logger.warning(f"Discarding incompatible LLM cache entry for {endpoint}: {str(e)}")
+        else:
+            logger.info(f"LLM cache hit (dynamodb) for {endpoint}")
+            _local_set(key, payload, expires_at)
+            return result
+
+    response = await llm.responses.parse(
+        model=model,
+        input=input,
+        text_format=text_format,
+    )
+    result = response.output_parsed
+
+    expires_at = int(time.time()) + ttl
+    payload = result.model_dump(mode='json')
+    _local_set(key, payload, expires_at)
+    await _remote_set(key, endpoint, model, payload, expires_at)
+    return result
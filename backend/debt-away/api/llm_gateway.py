@@ -0,0 +1,106 @@
+"""
+Shared async OpenAI gateway.
+
+Every endpoint reaches OpenAI through get_llm_client(), which returns a single
+openai.AsyncOpenAI instance backed by one pooled httpx connection set. Calls are
+awaited, so a slow completion no longer blocks the event loop and concurrent
+requests (and asyncio.gather fan-outs) overlap for real.
+
+The client is reused across warm Lambda invocations. It is rebuilt only when the
+running event loop changes, because httpx connections are bound to the loop that
+opened them.
+
+The openai package takes about half a second to import, so it is imported when
+the first client is built rather than with this module.
+"""
+import asyncio
+from typing import TYPE_CHECKING, Optional, Set
+
+import httpx
+from aws_lambda_powertools import Logger
+
+from config import OPENAI_APIKEY
+
+if TYPE_CHECKING:
+    import openai
+
+logger = Logger()
+
+# Connection pool sizing for api.openai.com. A single Lambda container rarely
+# has more than a handful of in-flight completions, but local uvicorn runs and
+# gather() fan-outs can open several at once.
+LLM_MAX_CONNECTIONS = 50
+LLM_MAX_KEEPALIVE_CONNECTIONS = 20
+LLM_KEEPALIVE_EXPIRY = 60.0  # seconds
+
+# Structured-output calls on large prompts can take 40+ seconds.
+LLM_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+LLM_MAX_RETRIES = 2
+
+_client: Optional['openai.AsyncOpenAI'] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+_closing: Set[asyncio.Task] = set()  # close() tasks of replaced clients, referenced until done
+
+
+def _build_client() -> 'openai.AsyncOpenAI':
+    import openai
+
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=LLM_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=LLM_KEEPALIVE_EXPIRY,
+        ),
+        timeout=LLM_TIMEOUT,
+    )
+    return openai.AsyncOpenAI(
+        api_key=OPENAI_APIKEY,
+        http_client=http_client,
+        max_retries=LLM_MAX_RETRIES,
+    )
+
+
+def get_llm_client() -> 'openai.AsyncOpenAI':
+    """
+    Return the process-wide AsyncOpenAI client, creating it on first use.
+
+    Must be called from inside a running event loop (i.e. from an async handler).
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client_loop is not loop:
+        if _client is not None:
+            logger.info("Event loop changed, rebuilding OpenAI client")
+            _retire(_client, _client_loop)
+        _client = _build_client()
+        _client_loop = loop
+    return _client
+
+
+async def _close_quietly(client: 'openai.AsyncOpenAI') -> None:
+    try:
+        await client.close()
+    except Exception as e:
+        logger.warning(f"Could not close replaced OpenAI client: {str(e)}")
+
+
+def _retire(client: 'openai.AsyncOpenAI', loop: asyncio.AbstractEventLoop) -> None:
+    """Close a client built on another event loop, so its pooled connections are not leaked."""
+    if loop.is_running():
+        # Still serving in another thread: close it there
+        asyncio.run_coroutine_threadsafe(_close_quietly(client), loop)
+        return
+    task = asyncio.get_running_loop().create_task(_close_quietly(client))
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+async def close_llm_client() -> None:
+    """Close the pooled connections (called from the application lifespan on shutdown)."""
+    global _client, _client_loop
+
+    if _client is not None:
+        await _client.close()
+    _client = None
+    _client_loop = None
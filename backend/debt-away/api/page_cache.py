@@ -0,0 +1,104 @@
+"""
+URL-keyed cache of cleaned job posting text for fetch_web_page_content.
+
+Entries keep the extracted text together with the ETag / Last-Modified
+validators the server sent. Within PAGE_CACHE_FRESH_SECONDS an entry is served
+directly, with no network round trip and no HTML parsing. After that the
+caller revalidates with a conditional GET. A 304 refreshes the entry, so only
+changed pages are downloaded and parsed again.
+
+The cache lives in process memory, so it is reused across warm invocations of
+the same container.
+"""
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from aws_lambda_powertools import Logger
+
+logger = Logger()
+
+PAGE_CACHE_FRESH_SECONDS = 15 * 60
+PAGE_CACHE_MAX_AGE_SECONDS = 24 * 3600  # drop entries that were never revalidated
+PAGE_CACHE_MAX_ENTRIES = 256
+
+
+@dataclass
+class CachedPage:
+    text: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    validated_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() - self.validated_at < PAGE_CACHE_FRESH_SECONDS
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+_entries: 'OrderedDict[str, CachedPage]' = OrderedDict()
+_lock = threading.Lock()
+_stats = {'fresh_hits': 0, 'revalidated_hits': 0, 'misses': 0, 'stores': 0}
+
+
+def lookup(url: str) -> Optional[CachedPage]:
+    """Return the cached page for ``url`` (fresh or stale), or None."""
+    with _lock:
+        entry = _entries.get(url)
+        if entry is None:
+            return None
+        if time.time() - entry.validated_at > PAGE_CACHE_MAX_AGE_SECONDS:
+            del _entries[url]
+            return None
+        _entries.move_to_end(url)
+        return entry
+
+
+def store(url: str, text: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+    with _lock:
+        _entries[url] = CachedPage(text, etag, last_modified, time.time())
+        _entries.move_to_end(url)
+        while len(_entries) > PAGE_CACHE_MAX_ENTRIES:
+            _entries.popitem(last=False)
+        _stats['stores'] += 1
+
+
+def mark_revalidated(url: str) -> None:
+    """Server answered 304 Not Modified: the cached text is current again."""
+    with _lock:
+        entry = _entries.get(url)
+        if entry is not None:
+            entry.validated_at = time.time()
+
+
+def record(outcome: str) -> None:
+    """Count a lookup outcome: 'fresh_hits', 'revalidated_hits' or 'misses'."""
+    with _lock:
+        _stats[outcome] += 1
+        stats = _snapshot()
+    logger.info(f"Page cache {outcome.replace('_', ' ')}", extra={'page_cache': stats})
+
+
+def _snapshot() -> Dict[str, float]:
+    lookups = _stats['fresh_hits'] + _stats['revalidated_hits'] + _stats['misses']
+    hits = _stats['fresh_hits'] + _stats['revalidated_hits']
+    return {
+        **_stats,
+        'entries': len(_entries),
+        'hit_rate': round(hits / lookups, 4) if lookups else 0.0,
+    }
+
+
+def stats() -> Dict[str, float]:
+    """Counters since container start, including the overall hit rate."""
+    with _lock:
+        return _snapshot()
@@ -0,0 +1,161 @@
+"""
+Content-addressed cache of rendered resume PDFs for /generate_resume_pdf.
+
+The key is a SHA-256 of the LaTeX produced by generate_latex_content(), so a
+re-download of an unchanged resume skips pdflatex, whatever else changed in
+the UI. Lookups go through two tiers:
+
+- a small LRU of PDF files under /tmp, reused by warm invocations of the
+  same container
+- S3 (UPLOAD_BUCKET, under RENDER_CACHE_PREFIX), shared by all containers.
+  Writes go through upload_queue, so they never delay the response.
+
+Bump RENDER_CACHE_VERSION when the compile itself changes (engine, fonts) in
+a way that the LaTeX source does not reflect.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import boto3
+from aws_lambda_powertools import Logger
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from app_data_repository import run_in_executor
+from upload_queue import UPLOAD_BUCKET, enqueue_upload
+
+logger = Logger()
+
+RENDER_CACHE_VERSION = 1
+RENDER_CACHE_PREFIX = 'resume-pdf-cache'
+LOCAL_CACHE_DIR = '/tmp/pdf-render-cache'
+LOCAL_CACHE_MAX_ENTRIES = 32
+
+_s3 = boto3.client(
+    's3',
+    config=Config(region_name='us-east-1', retries={'max_attempts': 2, 'mode': 'standard'}),
+)
+
+_local: 'OrderedDict[str, str]' = OrderedDict()  # key -> PDF path, least recently used first
+_lock = threading.Lock()
+_stats = {'local_hits': 0, 's3_hits': 0, 'misses': 0, 'stores': 0}
+
+
+def get_s3_client():
+    """The S3 client rendered PDFs are read through (thread-safe)."""
+    return _s3
+
+
+def render_key(latex_content: str) -> str:
+    return hashlib.sha256(f"v{RENDER_CACHE_VERSION}\n{latex_content}".encode('utf-8')).hexdigest()
+
+
+def s3_key(key: str) -> str:
+    return f"{RENDER_CACHE_PREFIX}/{key}.pdf"
+
+
+def _local_get(key: str) -> Optional[bytes]:
+    with _lock:
+        path = _local.get(key)
+        if path is None:
+            return None
+        _local.move_to_end(key)
+    try:
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        with _lock:
+            _local.pop(key, None)
+        return None
+
+
+def _local_put(key: str, pdf: bytes) -> None:
+    os.makedirs(LOCAL_CACHE_DIR, exist_ok=True)
+    path = os.path.join(LOCAL_CACHE_DIR, f"{key}.pdf")
+    # Write then rename, so a concurrent reader never sees a partial file
+    partial = f"{path}.{threading.get_ident()}.part"
+    with open(partial, 'wb') as f:
+        f.write(pdf)
+    os.replace(partial, path)
+
+    evicted = []
+    with _lock:
+        _local[key] = path
+        _local.move_to_end(key)
+        while len(_local) > LOCAL_CACHE_MAX_ENTRIES:
+            evicted.append(_local.popitem(last=False)[1])
+    for old_path in evicted:
+        try:
+            os.remove(old_path)
+        except OSError:
+            pass
+
+
+def _s3_get(key: str) -> Optional[bytes]:
+    try:
+        response = _s3.get_object(Bucket=UPLOAD_BUCKET, Key=s3_key(key))
+    except ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('NoSuchKey', '404'):
+            return None
+        raise
+    return response['Body'].read()
+
+
+async def get(key: str) -> Optional[bytes]:
+    """Cached PDF bytes for a render key, or None. S3 errors count as a miss."""
+    pdf = _local_get(key)
+    if pdf is not None:
+        _record('local_hits')
+        return pdf
+
+    try:
+        pdf = await run_in_executor(_s3_get, key)
+    except Exception as e:
+        logger.warning(f"PDF render cache read failed for {key}: {str(e)}")
+        pdf = None
+    if pdf is None:
+        _record('misses')
+        return None
+
+    _record('s3_hits')
+    try:
+        _local_put(key, pdf)
+    except OSError as e:
+        logger.warning(f"Could not keep PDF {key} in the local cache: {str(e)}")
+    return pdf
+
+
+def put(key: str, pdf: bytes) -> None:
+    """Keep a freshly rendered PDF locally and upload it to S3 in the background."""
+    _record('stores')
+    try:
+        _local_put(key, pdf)
+    except OSError as e:
+        logger.warning(f"Could not keep PDF {key} in the local cache: {str(e)}")
+    enqueue_upload(s3_key(key), pdf, 'application/pdf')
+
+
+def _record(outcome: str) -> None:
+    with _lock:
+        _stats[outcome] += 1
+        stats = _snapshot()
+    logger.info(f"PDF render cache {outcome.replace('_', ' ')}", extra={'pdf_render_cache': stats})
+
+
+def _snapshot() -> Dict[str, float]:
+    lookups = _stats['local_hits'] + _stats['s3_hits'] + _stats['misses']
+    hits = _stats['local_hits'] + _stats['s3_hits']
+    return {
+        **_stats,
+        'local_entries': len(_local),
+        'hit_rate': round(hits / lookups, 4) if lookups else 0.0,
+    }
+
+
+def stats() -> Dict[str, float]:
+    """Counters since container start, including the overall hit rate."""
+    with _lock:
+        return _snapshot()
@@ -0,0 +1,11 @@
+"""
+Entry point of ReadApiFunction: profile, knowledge and billing endpoints.
+They only read and write DynamoDB and call Stripe, so the function ships as a
+small zip package (Makefile, requirements-read.txt) with little memory and a
+short timeout.
+"""
+from app_factory import create_app, create_handler
+from routers import billing, profile
+
+app = create_app(profile, billing)
+handler = create_handler(app)
@@ -0,0 +1,204 @@
+"""
+External clients of the API, warmed in the Lambda init phase.
+
+Lambda runs module init with a full CPU burst before the first request (ahead
+of time under provisioned concurrency), but Mangum runs with lifespan="off",
+so until now the first request on every container paid for the SDK imports
+and the TLS handshakes to DynamoDB, S3, OpenAI and Stripe. Each router lists
+the resources its endpoints use in RESOURCES, create_app() collects them and
+they are warmed:
+
+    WARM_RESOURCES=init       by create_handler(), on Mangum's event loop (default in Lambda)
+    WARM_RESOURCES=lifespan   by the FastAPI lifespan, for uvicorn (the chat-stream image, chat_api:app)
+    WARM_RESOURCES=off        never (default outside Lambda, so tests and local imports stay lazy)
+
+Warming builds the client, and with WARM_CONNECTIONS=1 (the default) also
+makes one cheap call through it so a pooled keep-alive connection is already
+open (except Stripe, see _warm_stripe). Every warmer is bounded by
+WARM_TIMEOUT. Failures are logged and never fail init; the request path
+builds or reconnects the client as it always has.
+
+Handlers get the clients through the FastAPI dependencies at the bottom of
+this module, e.g. ``stripe=Depends(stripe_sdk)``.
+"""
+import asyncio
+import importlib
+import os
+import time
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple, Union
+
+from aws_lambda_powertools import Logger
+
+logger = Logger()
+
+INIT = 'init'
+LIFESPAN = 'lifespan'
+OFF = 'off'
+WARM_RESOURCES = os.environ.get('WARM_RESOURCES', INIT if os.environ.get('AWS_LAMBDA_FUNCTION_NAME') else OFF)
+WARM_CONNECTIONS = os.environ.get('WARM_CONNECTIONS', '1') == '1'
+WARM_CONNECT_TIMEOUT = 3.0  # seconds per warm-up call
+WARM_TIMEOUT = 8.0  # seconds per resource; Lambda's init phase is limited to 10 s
+
+# Key of the DynamoDB item read by the warm-up call; it never exists
+WARM_PROBE_KEY = {'PK': {'S': 'WARMUP'}, 'SK': {'S': 'WARMUP'}}
+
+
+# ── Warmers ──────────────────────────────────────────────────────────────────
+# An error response from the service still means the connection is open, so
+# the warm-up calls only need to reach it: their errors are ignored.
+
+def _warm_dynamodb(connect: bool) -> None:
+    from botocore.exceptions import ClientError
+
+    import app_data_repository as app_data
+
+    if connect:
+        # The low-level client and the resource have separate connection pools
+        for client in (app_data.get_dynamodb_client(), app_data.get_dynamodb_resource().meta.client):
+            try:
+                client.get_item(TableName=app_data.APP_DATA_TABLE, Key=WARM_PROBE_KEY)
+            except ClientError:
+                pass
+
+
+def _warm_s3(connect: bool) -> None:
+    from botocore.exceptions import ClientError
+
+    import pdf_render_cache
+    import upload_queue
+
+    if connect:
+        for client in (upload_queue.get_s3_client(), pdf_render_cache.get_s3_client()):
+            try:
+                client.head_bucket(Bucket=upload_queue.UPLOAD_BUCKET)
+            except ClientError:
+                pass
+
+
+async def _warm_openai(connect: bool) -> None:
+    import openai
+
+    from llm_gateway import get_llm_client
+
+    client = get_llm_client()
+    if connect:
+        # with_options() shares the pooled httpx client, so the connection stays open for requests
+        try:
+            await client.with_options(max_retries=0, timeout=WARM_CONNECT_TIMEOUT).models.list()
+        except openai.APIStatusError:
+            pass
+
+
+def _warm_stripe(connect: bool) -> None:
+    from routers.shared import get_stripe
+
+    # Import only, no connection: Stripe's requests session is per thread, so
+    # a probe would have to run on the loop thread, where WARM_TIMEOUT cannot
+    # interrupt it and the SDK's own 80 s timeout would overrun Lambda init.
+    get_stripe()
+
+
+def _warm_latex(connect: bool) -> None:
+    import latex_engine
+
+    latex_engine.preamble_format()
+
+
+def _warm_documents(connect: bool) -> None:
+    import resume_text
+
+    # The libraries resume_text imports on first use
+    libraries = ['docx', 'PyPDF2'] + (['pypdfium2'] if resume_text.PDF_BACKEND == resume_text.PDFIUM else [])
+    for name in libraries:
+        importlib.import_module(name)
+
+
+def _warm_html(connect: bool) -> None:
+    importlib.import_module('bs4')
+
+
+# Async warmers run on the event loop, blocking ones in a worker thread
+WARMERS: Dict[str, Callable[[bool], Union[None, Awaitable[None]]]] = {
+    'dynamodb': _warm_dynamodb,
+    's3': _warm_s3,
+    'openai': _warm_openai,
+    'stripe': _warm_stripe,
+    'latex': _warm_latex,
+    'documents': _warm_documents,
+    'html': _warm_html,
+}
+
+
+async def _warm_one(name: str, connect: bool) -> Tuple[str, Optional[float]]:
+    warmer = WARMERS[name]
+    started = time.perf_counter()
+    try:
+        if asyncio.iscoroutinefunction(warmer):
+            await asyncio.wait_for(warmer(connect), timeout=WARM_TIMEOUT)
+        else:
+            await asyncio.wait_for(asyncio.to_thread(warmer, connect), timeout=WARM_TIMEOUT)
+    except Exception as e:
+        logger.warning(f"Could not warm {name}, it will be set up on first use: {str(e)}")
+        return name, None
+    return name, round((time.perf_counter() - started) * 1000, 1)
+
+
+async def warm_async(names: Iterable[str], connect: bool = WARM_CONNECTIONS) -> Dict[str, Optional[float]]:
+    """
+    Warm the named resources concurrently on the running event loop. Returns
+    each resource's warm-up time in ms, or None where warming failed.
+    """
+    names = set(names)
+    unknown = names - set(WARMERS)
+    if unknown:
+        raise ValueError(f"Unknown resources: {sorted(unknown)}")
+
+    started = time.perf_counter()
+    timings = dict(await asyncio.gather(*(_warm_one(name, connect) for name in sorted(names))))
+    logger.info("Resources warmed", extra={"duration_ms": round((time.perf_counter() - started) * 1000, 1),
+                                           "connect": connect, "resources": timings})
+    return timings
+
+
+def warm(names: Iterable[str], loop: asyncio.AbstractEventLoop,
+         connect: bool = WARM_CONNECTIONS) -> Dict[str, Optional[float]]:
+    """
+    Warm the named resources from synchronous code (Lambda init) on ``loop``,
+    which must be the loop the handler serves requests on: the OpenAI client
+    is bound to the loop it was built on.
+    """
+    return loop.run_until_complete(warm_async(names, connect))
+
+
+def required(router_modules: Iterable) -> Tuple[str, ...]:
+    """The resources declared in RESOURCES by the given router modules."""
+    names = {name for module in router_modules for name in getattr(module, 'RESOURCES', ())}
+    unknown = names - set(WARMERS)
+    if unknown:
+        raise ValueError(f"Unknown resources: {sorted(unknown)}")
+    return tuple(sorted(names))
+
+
+# ── Dependencies ─────────────────────────────────────────────────────────────
+# Async, so FastAPI resolves them on the event loop rather than in its thread
+# pool (get_llm_client() needs the running loop).
+
+async def stripe_sdk():
+    """The Stripe SDK with the default API key set."""
+    from routers.shared import get_stripe
+
+    return get_stripe()
+
+
+async def llm_client():
+    """The pooled AsyncOpenAI client of the running event loop."""
+    from llm_gateway import get_llm_client
+
+    return get_llm_client()
+
+
+async def dynamodb_resource():
+    """The shared DynamoDB resource for the auxiliary tables (event loop thread only)."""
+    from app_data_repository import get_dynamodb_resource
+
+    return get_dynamodb_resource()
@@ -0,0 +1,207 @@
+"""
+Deterministic parts of resume crafting.
+
+The knowledge-base craft request already carries structured profile data, so
+the header, education, professional history and achievements, plus the
+name / dates / location / work experience of every project, are assembled
+here without a model call. Only the creative content of the projects
+(overview, tech, achievement, technologies) and the technical skills are
+generated, by concurrent LLM calls in routers/crafting.py, and merged back with
+merge_project_content(). The result has the CraftResumeResponse shape.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+CONTENT_MAX_CHARS = 250
+PROJECT_MEMBERS = ('personal_projects', 'professional_projects')
+TECH_CONTENT_MAX_ITEMS = 2
+
+
+def month_year(month: Optional[str], year: Optional[str]) -> str:
+    """'Jan', '2024' -> 'Jan 2024'; either part may be missing."""
+    return ' '.join(part.strip() for part in (month or '', year or '') if part and part.strip())
+
+
+def _month_index(month: Optional[str]) -> int:
+    prefix = (month or '').strip()[:3].title()
+    return MONTHS.index(prefix) + 1 if prefix in MONTHS else 0
+
+
+def _recency_key(end_month: Optional[str], end_year: Optional[str], ongoing: bool) -> Tuple[int, int]:
+    """Sort key, most recent first when sorted in reverse. Ongoing entries lead."""
+    if ongoing or not (end_year or '').strip():
+        return (10_000, 13)
+    try:
+        year = int(str(end_year).strip())
+    except ValueError:
+        year = 0
+    return (year, _month_index(end_month))
+
+
+# ── Passthrough sections ─────────────────────────────────────────────────────
+
+def format_links(raw_links: Sequence[Any]) -> List[str]:
+    """Links as "Name: url" strings; entries may be strings or {name, url} objects."""
+    formatted: List[str] = []
+    for link in raw_links or []:
+        if isinstance(link, dict):
+            name = link.get('name') or link.get('label') or 'Link'
+            url = link.get('url') or ''
+            if url:
+                formatted.append(f"{name}: {url}")
+        elif link:
+            formatted.append(str(link))
+    return formatted
+
+
+def header(basic_info: Dict[str, Any]) -> Dict[str, Any]:
+    names = (basic_info.get('firstName'), basic_info.get('middleName'), basic_info.get('lastName'))
+    region = ' '.join(part.strip() for part in (basic_info.get('addressState') or '',
+                                                basic_info.get('addressZip') or '') if part.strip())
+    address = ', '.join(part for part in ((basic_info.get('addressStreet') or '').strip(), region) if part)
+    return {
+        'full_name': ' '.join(name.strip() for name in names if name and name.strip()),
+        'email_address': (basic_info.get('email') or '').strip(),
+        'phone_number': (basic_info.get('phone') or '').strip() or None,
+        'home_address': address or None,
+        'links': format_links(basic_info.get('links', [])),
+    }
+
+
+def education_history(colleges: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """One entry per degree, most recent first."""
+    entries = []
+    for college in colleges or []:
+        for degree in college.get('degrees') or []:
+            coursework = [course.strip() for course in (degree.get('coursework') or '').split(',') if course.strip()]
+            entry = {
+                'college_name': college.get('collegeName') or '',
+                'degree': degree.get('degree') or '',
+                'major': degree.get('major') or None,
+                'coursework': coursework,
+                'location': college.get('location') or None,
+                'start_date': month_year(degree.get('startMonth'), degree.get('startYear')),
+                'end_date': month_year(degree.get('endMonth'), degree.get('endYear')),
+            }
+            entries.append((_recency_key(degree.get('endMonth'), degree.get('endYear'), False), entry))
+    entries.sort(key=lambda item: item[0], reverse=True)
+    return [entry for _, entry in entries]
+
+
+def professional_history(companies: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Work history, most recent first."""
+    entries = []
+    for company in companies or []:
+        ongoing = bool(company.get('isPresent'))
+        entry = {
+            'company_name': company.get('companyName') or '',
+            'job_title': company.get('jobTitle') or '',
+            'location': company.get('location') or None,
+            'start_date': month_year(company.get('startMonth'), company.get('startYear')),
+            'end_date': 'Present' if ongoing else month_year(company.get('endMonth'), company.get('endYear')),
+        }
+        entries.append((_recency_key(company.get('endMonth'), company.get('endYear'), ongoing), entry))
+    entries.sort(key=lambda item: item[0], reverse=True)
+    return [entry for _, entry in entries]
+
+
+def achievements(items: Sequence[Dict[str, Any]]) -> List[Dict[str, str]]:
+    return [{'type': item.get('type') or '', 'value': item.get('value') or ''}
+            for item in items or [] if item.get('value')]
+
+
+# ── Projects ─────────────────────────────────────────────────────────────────
+
+def project_technologies(project: Dict[str, Any]) -> List[str]:
+    return [*(project.get('selectedTechnologies') or []), *(project.get('selectedFrameworks') or [])]
+
+
+def project_brief(project: Dict[str, Any]) -> Dict[str, Any]:
+    """The part of a project the model needs to write its content."""
+    description = project.get('projectDescription') or {}
+    return {
+        'project_name': project.get('projectName') or '',
+        'overview': description.get('overview') or '',
+        'tech_and_teamwork': description.get('techAndTeamwork') or '',
+        'achievement': description.get('achievement') or '',
+        'technologies': project_technologies(project),
+    }
+
+
+def project_skeleton(project: Dict[str, Any], professional: bool = False) -> Dict[str, Any]:
+    """Project fields copied from the input as they are."""
+    skeleton = {
+        'project_name': project.get('projectName') or '',
+        'location': project.get('location') or None,
+    }
+    if professional:
+        skeleton['work_experience'] = project.get('selectedWorkExperience') or ''
+    else:
+        skeleton['start_date'] = month_year(project.get('projectStartMonth'), project.get('projectStartYear'))
+        skeleton['end_date'] = month_year(project.get('projectEndMonth'), project.get('projectEndYear'))
+    return skeleton
+
+
+def _clip(text: str) -> str:
+    text = (text or '').strip()
+    return text if len(text) <= CONTENT_MAX_CHARS else text[:CONTENT_MAX_CHARS - 1].rstrip() + '…'
+
+
+def fallback_content(project: Dict[str, Any]) -> Dict[str, Any]:
+    """Project content taken from the input, for projects the model left out."""
+    brief = project_brief(project)
+    tech = _clip(brief['tech_and_teamwork'])
+    return {
+        'overview_content': _clip(brief['overview']),
+        'tech_content': [{'content': tech}] if tech else [],
+        'achievement_content': _clip(brief['achievement']),
+        'technologies': brief['technologies'],
+    }
+
+
+def merge_project_content(
+    projects: Sequence[Dict[str, Any]],
+    contents: Sequence[Dict[str, Any]],
+    professional: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Combine input projects with generated content, matched by position (the
+    prompt lists projects in input order and asks for one item each).
+    """
+    merged = []
+    for position, project in enumerate(projects):
+        content = contents[position] if position < len(contents) else fallback_content(project)
+        merged.append({
+            **project_skeleton(project, professional),
+            'overview_content': content.get('overview_content', ''),
+            'tech_content': list(content.get('tech_content') or [])[:TECH_CONTENT_MAX_ITEMS],
+            'achievement_content': content.get('achievement_content', ''),
+            'technologies': list(content.get('technologies') or []),
+        })
+    return merged
+
+
+def dedupe_technologies(*project_lists: List[Dict[str, Any]],
+                        skills: Optional[Dict[str, List[str]]] = None) -> None:
+    """
+    Drop technologies already listed in the technical skills (by category) or
+    by an earlier project (case-insensitive), in place.
+    """
+    seen = {keyword.strip().lower() for keywords in (skills or {}).values() for keyword in keywords}
+    for projects in project_lists:
+        for project in projects:
+            unique = []
+            for technology in project.get('technologies') or []:
+                key = technology.strip().lower()
+                if key and key not in seen:
+                    seen.add(key)
+                    unique.append(technology)
+            project['technologies'] = unique
+
+
+def dedupe_crafted_technologies(members: Dict[str, Any]) -> None:
+    """
+    dedupe_technologies() over the projects and technical_skills of a crafted
+    resume (CraftResumeResponse members), which come from separate calls.
+    """
+    dedupe_technologies(*(members[key] for key in PROJECT_MEMBERS), skills=members['technical_skills'])
@@ -0,0 +1,363 @@
+"""
+Deterministic rule engine for /resume-sanity-check.
+
+Most sanity rules are mechanical string checks, so they are evaluated locally
+with precompiled regexes over a ResumeSanityCheckRequest:
+
+- H1-H5: missing or placeholder name and contact fields
+- H7-H13: location / duration years of experiences, education and projects
+- H14: no projects and no work bullets
+- H15: repeated spaces
+- H19/H20: education college name / degree
+- M1/L1: coursework and GPA
+- M2: link length
+- M3, M4, M6, M7: project technologies and bullets
+- M5: duplicate skill keywords
+
+Only the semantic rules (H6 page length, H16 incomplete sentence, H17 syntax
+error) need the model. SEMANTIC_RULES_PROMPT and format_for_semantic_check()
+build that one small call.
+
+The engine duck-types the request models, so it has no FastAPI/pydantic
+dependency. Issues are dicts {"rule", "severity", "message"}, and
+sort_issues() puts them in rule order.
+"""
+import re
+from collections import Counter
+from typing import Dict, List
+
+SEVERITY_HIGH = "High"
+SEVERITY_MID = "Mid"
+SEVERITY_LOW = "Low"
+
+RULE_ORDER = [
+    "H1", "H2", "H3", "H4", "H5", "H6", "H7", "H8", "H9", "H10", "H11", "H12", "H13",
+    "H14", "H15", "H16", "H17", "H19", "H20",
+    "M1", "M2", "M3", "M4", "M5", "M6", "M7",
+    "L1",
+]
+SEMANTIC_RULES = ("H6", "H16", "H17")
+
+LINK_MAX_LENGTH = 35
+PROJECT_BULLET_MAX_WORDS = 30
+PROJECT_MAX_BULLETS = 5
+PROJECT_MIN_TECHNOLOGIES = 4
+SNIPPET_RADIUS = 30
+
+_PLACEHOLDER_NAMES = {"", "your name", "full name", "name", "first last", "firstname lastname"}
+_PLACEHOLDER_UNIVERSITIES = {"", "university name", "university", "college name", "school name"}
+_PLACEHOLDER_DEGREES = {"", "degree name", "degree", "major"}
+_PLACEHOLDER_PROJECTS = {"", "project name", "project"}
+_PLACEHOLDER_LOCATIONS = {"", "city, state, country", "city, state", "city, country", "city", "address"}
+_PLACEHOLDER_PHONE_DIGITS = {"15551234567", "5551234567", "1234567890"}
+
+_EMAIL_LABEL_RE = re.compile(r"e-?mail", re.IGNORECASE)
+_PHONE_LABEL_RE = re.compile(r"phone|mobile|cell|tel", re.IGNORECASE)
+_LOCATION_LABEL_RE = re.compile(r"location|address|city", re.IGNORECASE)
+_LINK_LABEL_RE = re.compile(r"link|website|web site|github|portfolio|linkedin|url|site|blog", re.IGNORECASE)
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[A-Za-z]{2,}$")
+_PLACEHOLDER_EMAIL_RE = re.compile(r"@example\.(com|org|net)$|^your[._]?e?mail@|^email@", re.IGNORECASE)
+_DIGIT_RE = re.compile(r"\d")
+
+_YEAR_RE = re.compile(r"\b(?:19|20)\d{2}\b")
+_DATE_WORDS_RE = re.compile(
+    r"\b(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?|"
+    r"sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?|present|current|now|today|"
+    r"to|till|until|expected|since|spring|summer|fall|autumn|winter)\b\.?",
+    re.IGNORECASE,
+)
+_WORD_RE = re.compile(r"[^\W\d_]{2,}")
+
+_MULTI_SPACE_RE = re.compile(r"\S( {2,})\S")
+_COURSEWORK_RE = re.compile(r"course\s*work|courses", re.IGNORECASE)
+_GPA_RE = re.compile(r"\bgpa\b", re.IGNORECASE)
+_KEYWORD_SPLIT_RE = re.compile(r"[,;|\n]")
+
+
+def _issue(rule: str, severity: str, message: str) -> Dict[str, str]:
+    return {"rule": rule, "severity": severity, "message": message}
+
+
+def _norm(text: str) -> str:
+    return " ".join((text or "").split()).lower()
+
+
+def _has_location(date_field: str) -> bool:
+    """True when the Date/Location field has any text besides dates."""
+    return bool(_WORD_RE.search(_DATE_WORDS_RE.sub(" ", date_field or "")))
+
+
+def _has_year(date_field: str) -> bool:
+    return bool(_YEAR_RE.search(date_field or ""))
+
+
+def _non_empty(items) -> List[str]:
+    return [item for item in items or [] if item and item.strip()]
+
+
+def _real_educations(req) -> list:
+    return [edu for edu in req.education if _norm(edu.university) not in _PLACEHOLDER_UNIVERSITIES]
+
+
+def _real_projects(req) -> list:
+    return [proj for proj in req.projects_established + req.projects_expanding
+            if _norm(proj.name) not in _PLACEHOLDER_PROJECTS]
+
+
+def _snippet(text: str, start: int, end: int) -> str:
+    left = max(0, start - SNIPPET_RADIUS)
+    right = min(len(text), end + SNIPPET_RADIUS)
+    return ("..." if left else "") + text[left:right] + ("..." if right < len(text) else "")
+
+
+# ── High severity ────────────────────────────────────────────────────────────
+
+def _contact_rules(req) -> List[Dict[str, str]]:
+    issues = []
+    if _norm(req.name) in _PLACEHOLDER_NAMES:
+        issues.append(_issue("H1", SEVERITY_HIGH,
+                             "You are missing name at the top of the resume, please kindly add your name."))
+
+    emails = [f.value.strip() for f in req.contact_fields
+              if _EMAIL_LABEL_RE.search(f.label) or "@" in (f.value or "")]
+    real_emails = [e for e in emails if e and not _PLACEHOLDER_EMAIL_RE.search(e)]
+    if not real_emails:
+        issues.append(_issue("H2", SEVERITY_HIGH,
+                             "You are missing email address in the resume, please kindly add your email address."))
+    elif not any(_EMAIL_RE.match(e) for e in real_emails):
+        issues.append(_issue("H3", SEVERITY_HIGH,
+                             "Your email address format is invalid, please check and correct."))
+
+    phones = ["".join(_DIGIT_RE.findall(f.value or "")) for f in req.contact_fields if _PHONE_LABEL_RE.search(f.label)]
+    if not any(len(digits) >= 7 and digits not in _PLACEHOLDER_PHONE_DIGITS for digits in phones):
+        issues.append(_issue("H4", SEVERITY_HIGH,
+                             "You are missing phone number in the resume, please kindly add your phone number."))
+
+    locations = [_norm(f.value) for f in req.contact_fields if _LOCATION_LABEL_RE.search(f.label)]
+    if not any(loc not in _PLACEHOLDER_LOCATIONS for loc in locations):
+        issues.append(_issue("H5", SEVERITY_HIGH,
+                             "You are missing home address in the resume, please kindly add your home address."))
+    return issues
+
+
+def _location_and_duration_rules(req) -> List[Dict[str, str]]:
+    missing_location = []
+    missing_duration = []
+
+    for exp in req.professional_experiences:
+        for jt in exp.job_titles:
+            if not (jt.title.strip() or exp.company.strip()):
+                continue
+            if not _has_location(jt.date):
+                missing_location.append(_issue("H7", SEVERITY_HIGH,
+                    f"The work experience '{jt.title}' at '{exp.company}' is missing a location city, please add it."))
+            if not _has_year(jt.date):
+                missing_duration.append(_issue("H10", SEVERITY_HIGH,
+                    f"The work experience '{jt.title}' at '{exp.company}' is missing a duration, please add it."))
+
+    for edu in _real_educations(req):
+        if not _has_location(edu.date):
+            missing_location.append(_issue("H8", SEVERITY_HIGH,
+                f"The education at '{edu.university}' is missing a location city, please add it."))
+        if not _has_year(edu.date):
+            missing_duration.append(_issue("H11", SEVERITY_HIGH,
+                f"The education at '{edu.university}' is missing a duration, please add it."))
+
+    for proj in _real_projects(req):
+        if not _has_location(proj.date):
+            missing_location.append(_issue("H9", SEVERITY_HIGH,
+                f"The project '{proj.name}' is missing a location city, please add it."))
+        if not _has_year(proj.date):
+            missing_duration.append(_issue("H12", SEVERITY_HIGH,
+                f"The project '{proj.name}' is missing a duration, please add it."))
+
+    return missing_location + missing_duration
+
+
+def _section_rules(req) -> List[Dict[str, str]]:
+    issues = []
+    if not _real_educations(req):
+        issues.append(_issue("H13", SEVERITY_HIGH,
+            "Your resume doesn't include any education experience, please add at least one education experience."))
+
+    work_bullets = [b for exp in req.professional_experiences for jt in exp.job_titles for b in _non_empty(jt.bullets)]
+    if not _real_projects(req) and not work_bullets:
+        issues.append(_issue("H14", SEVERITY_HIGH,
+            "Your resume doesn't include any project experience, please add at least one project experience "
+            "to demonstrate your professional skills."))
+
+    for edu in req.education:
+        has_other_content = edu.date.strip() or any(d.degree.strip() or d.description.strip() for d in edu.degrees)
+        if _norm(edu.university) in _PLACEHOLDER_UNIVERSITIES:
+            if has_other_content:
+                issues.append(_issue("H19", SEVERITY_HIGH,
+                    "One of the education experiences is missing a college name, please add it."))
+        elif not edu.degrees or any(_norm(d.degree) in _PLACEHOLDER_DEGREES for d in edu.degrees):
+            issues.append(_issue("H20", SEVERITY_HIGH,
+                f"The education at '{edu.university}' is missing a college degree, please add it."))
+    return issues
+
+
+def _double_space_rules(req) -> List[Dict[str, str]]:
+    issues = []
+    for text in iter_sentences(req):
+        stripped = text.strip()
+        match = _MULTI_SPACE_RE.search(stripped)
+        if match:
+            snippet = _snippet(stripped, match.start(1), match.end(1))
+            issues.append(_issue("H15", SEVERITY_HIGH,
+                f"The following text has multiple continuous spaces, please remove the duplicated ones: '{snippet}'"))
+    return issues
+
+
+# ── Mid / low severity ───────────────────────────────────────────────────────
+
+def _education_detail_rules(req) -> List[Dict[str, str]]:
+    issues = []
+    real = _real_educations(req)
+    if not real:
+        return issues
+    descriptions = [d.description for edu in real for d in edu.degrees]
+    if not any(_COURSEWORK_RE.search(text) for text in descriptions):
+        issues.append(_issue("M1", SEVERITY_MID,
+            "Recommend to have some coursework listed for the college major, which doesn't have the coursework."))
+    if not any(_GPA_RE.search(text) for text in descriptions):
+        issues.append(_issue("L1", SEVERITY_LOW, "Recommend to have GPA if it's over 3.5."))
+    return issues
+
+
+def _link_rules(req) -> List[Dict[str, str]]:
+    return [
+        _issue("M2", SEVERITY_MID,
+               f"The link '{f.label}: {f.value}' is too long (over {LINK_MAX_LENGTH} characters), "
+               "recommend to use a shorter URL.")
+        for f in req.contact_fields
+        if _LINK_LABEL_RE.search(f.label) and len(f.value.strip()) > LINK_MAX_LENGTH
+    ]
+
+
+def _project_rules(req) -> List[Dict[str, str]]:
+    issues = []
+    for proj in _real_projects(req):
+        technologies = [t.strip() for t in proj.technologies if t and t.strip()]
+        unique = list(dict.fromkeys(t.lower() for t in technologies))
+        if 0 < len(unique) < PROJECT_MIN_TECHNOLOGIES:
+            issues.append(_issue("M3", SEVERITY_MID,
+                f"The project '{proj.name}' has fewer than {PROJECT_MIN_TECHNOLOGIES} technologies listed "
+                f"({', '.join(technologies)}), recommend adding more technical keywords to demonstrate "
+                "your skills in the project."))
+
+        bullets = _non_empty(proj.bullets)
+        for bullet in bullets:
+            words = len(bullet.split())
+            if words > PROJECT_BULLET_MAX_WORDS:
+                issues.append(_issue("M4", SEVERITY_MID,
+                    f"The project '{proj.name}' has a bullet point with {words} words, recommend shortening it "
+                    f"or splitting it into multiple: '{bullet.strip()}'"))
+
+        counts = Counter(t.lower() for t in technologies)
+        dupes = list({t.lower(): t for t in technologies if counts[t.lower()] > 1}.values())
+        if dupes:
+            issues.append(_issue("M6", SEVERITY_MID,
+                f"The project '{proj.name}' has duplicate technical keywords in its bullet points. "
+                f"Recommend listing unique technical keywords: {', '.join(dupes)}."))
+
+        if len(bullets) > PROJECT_MAX_BULLETS:
+            issues.append(_issue("M7", SEVERITY_MID,
+                f"The project '{proj.name}' has {len(bullets)} bullet points. "
+                "Recommend having less than 4 bullet points for a project."))
+    return issues
+
+
+def _skill_rules(req) -> List[Dict[str, str]]:
+    seen: Dict[str, str] = {}
+    counts: Counter = Counter()
+    for skill in req.skills:
+        for keyword in _KEYWORD_SPLIT_RE.split(skill.keywords or ""):
+            key = _norm(keyword)
+            if key:
+                counts[key] += 1
+                seen.setdefault(key, keyword.strip())
+    dupes = [seen[key] for key, count in counts.items() if count > 1]
+    if not dupes:
+        return []
+    return [_issue("M5", SEVERITY_MID,
+        "The following keywords appear multiple times in your technical skill section, "
+        f"recommend removing duplicates: {', '.join(dupes)}.")]
+
+
+# ── Entry points ─────────────────────────────────────────────────────────────
+
+_LOCAL_RULE_GROUPS = (
+    _contact_rules,
+    _location_and_duration_rules,
+    _section_rules,
+    _double_space_rules,
+    _education_detail_rules,
+    _link_rules,
+    _project_rules,
+    _skill_rules,
+)
+
+
+def iter_sentences(req) -> List[str]:
+    """Every bullet and description, in resume order."""
+    texts = []
+    for exp in req.professional_experiences:
+        for jt in exp.job_titles:
+            texts.extend(_non_empty(jt.bullets))
+    for edu in req.education:
+        texts.extend(_non_empty(d.description for d in edu.degrees))
+    for proj in req.projects_established + req.projects_expanding:
+        texts.extend(_non_empty([proj.description]))
+        texts.extend(_non_empty(proj.bullets))
+    return texts
+
+
+def run_local_rules(req) -> List[Dict[str, str]]:
+    issues = []
+    for group in _LOCAL_RULE_GROUPS:
+        issues.extend(group(req))
+    return issues
+
+
+def sort_issues(issues: List[Dict[str, str]]) -> List[Dict[str, str]]:
+    """Stable order by rule id, dropping duplicate messages."""
+    position = {rule: i for i, rule in enumerate(RULE_ORDER)}
+    unique = list({issue["message"]: issue for issue in issues}.values())
+    return sorted(unique, key=lambda issue: position.get(issue["rule"], len(RULE_ORDER)))
+
+
+SEMANTIC_RULES_PROMPT = """
+Evaluate the resume excerpt against ONLY the following rules. For each rule that IS triggered, include it in the output.
+Only include rules that are actually triggered. Quote the exact sentence involved.
+
+H6. RESUME_TOO_LONG: Estimate from the section statistics and sentences whether the content would exceed one page (many sections, 10+ bullet points across all work/projects). → "Your resume may be over one page, consider trimming lower-priority details to keep it concise."
+H16. INCOMPLETE_SENTENCE: A sentence ends with a preposition (of, in, at, for, to, by, on, from), conjunction (and, but, or), comma, semicolon, or colon, or is otherwise cut off. → "The following sentence appears to be incomplete, please complete it: '{sentence}'"
+H17. SYNTAX_ERROR: A sentence has double punctuation (.., !!, ??), lowercase standalone 'i', mismatched parentheses, or broken grammar. → "There's a syntax error in the following sentence, please correct it. Consider revising: '{sentence}'"
+
+Use severity "High" and rule ids "H6", "H16" or "H17".
+"""
+
+
+def format_for_semantic_check(req) -> str:
+    """Compact input for the semantic rules: section statistics plus numbered sentences."""
+    sentences = iter_sentences(req)
+    job_count = sum(len(exp.job_titles) for exp in req.professional_experiences)
+    project_count = len(req.projects_established) + len(req.projects_expanding)
+    bullet_count = (
+        sum(len(_non_empty(jt.bullets)) for exp in req.professional_experiences for jt in exp.job_titles)
+        + sum(len(_non_empty(p.bullets)) for p in req.projects_established + req.projects_expanding)
+    )
+    lines = [
+        "SECTION STATISTICS:",
+        f"  Work experience entries: {job_count}",
+        f"  Education entries: {len(req.education)}",
+        f"  Project entries: {project_count}",
+        f"  Skill groups: {len(req.skills)}",
+        f"  Bullet points (work + projects): {bullet_count}",
+        "",
+        "SENTENCES:",
+    ]
+    lines.extend(f"  {i}: {text.strip()}" for i, text in enumerate(sentences, 1))
+    return "\n".join(lines)
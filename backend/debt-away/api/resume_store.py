@@ -0,0 +1,143 @@
+"""
+Persistent store of uploaded resumes and their LLM parses.
+
+Each upload is stored once per owner under ``RESUME#<sha256 of the file>``
+in the application-data table:
+
+    text            extracted text
+    filename        original file name
+    parse_<kind>    one attribute per structured parse (see PARSE_* below)
+
+Every resume-consuming endpoint opens the upload through open_resume() and
+requests parses through parse(). The same file then goes through text
+extraction and each kind of parse once, whichever endpoint runs first:
+
+- PARSE_RESUME_DATA (ResumeParsedData) is shared by alpha_resume_analysis and
+  the resume_power_analysis step of overall_analysis
+- PARSE_AUTO_FILL (AutoFillResumeResult) is written by auto_fill_info_from_resume
+  and read by craft_resume_from_existing_resume, which then assembles the
+  factual sections locally. PARSE_CRAFT_FACTS covers crafting before any
+  auto-fill.
+
+The owner is the Cognito sub. The alpha landing flow has no account, so it
+uses ``ALPHA#<user_id>``. Store failures are logged and never fail a request.
+"""
+import hashlib
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Optional, Type, TypeVar
+
+from aws_lambda_powertools import Logger
+from pydantic import BaseModel
+
+import app_data_repository as app_data
+
+logger = Logger()
+
+PARSE_RESUME_DATA = 'resume_parsed_data'
+PARSE_AUTO_FILL = 'auto_fill'
+PARSE_CRAFT_FACTS = 'craft_facts'
+
+PARSE_ATTRIBUTE_PREFIX = 'parse_'
+
+ModelT = TypeVar('ModelT', bound=BaseModel)
+
+
+@dataclass
+class StoredResume:
+    owner: Optional[str]
+    content_hash: str
+    text: str
+    parses: Dict[str, Any] = field(default_factory=dict)
+
+
+def content_hash(file_content: bytes) -> str:
+    return hashlib.sha256(file_content).hexdigest()
+
+
+def alpha_owner(user_id: str) -> str:
+    return f'ALPHA#{user_id}'
+
+
+def _to_dynamo(data: Dict[str, Any]) -> Dict[str, Any]:
+    # DynamoDB has no float type
+    return json.loads(json.dumps(data), parse_float=Decimal)
+
+
+def _from_dynamo(data: Any) -> Any:
+    return json.loads(json.dumps(data, default=lambda value: int(value) if value == int(value) else float(value)))
+
+
+async def open_resume(
+    owner: Optional[str],
+    file_content: bytes,
+    filename: str,
+    extract: Callable[[bytes, str], Awaitable[str]],
+) -> StoredResume:
+    """
+    The stored resume for these bytes, extracting and storing its text on the
+    first upload. Without an owner nothing is read or written.
+    """
+    resume_hash = content_hash(file_content)
+    if owner:
+        try:
+            item = await app_data.get_resume(owner, resume_hash)
+        except Exception as e:
+            logger.warning(f"Could not read stored resume {resume_hash[:12]}: {str(e)}")
+            item = None
+        if item and item.get('text'):
+            parses = {name[len(PARSE_ATTRIBUTE_PREFIX):]: _from_dynamo(value)
+                      for name, value in item.items() if name.startswith(PARSE_ATTRIBUTE_PREFIX)}
+            logger.info(f"Reusing stored resume {resume_hash[:12]}", extra={"parses": sorted(parses)})
+            return StoredResume(owner, resume_hash, item['text'], parses)
+
+    text = await extract(file_content, filename)
+    resume = StoredResume(owner, resume_hash, text)
+    if owner and text:
+        try:
+            await app_data.save_resume_text(owner, resume_hash, text, filename, datetime.now().isoformat())
+        except Exception as e:
+            logger.warning(f"Could not store resume {resume_hash[:12]}: {str(e)}")
+    return resume
+
+
+def stored_parse(resume: StoredResume, kind: str, model: Type[ModelT]) -> Optional[ModelT]:
+    """A previously stored parse of this kind, or None (also when it no longer validates)."""
+    data = resume.parses.get(kind)
+    if data is None:
+        return None
+    try:
+        return model(**data)
+    except Exception as e:
+        logger.warning(f"Stored {kind} parse of resume {resume.content_hash[:12]} is invalid: {str(e)}")
+        return None
+
+
+async def save_parse(resume: StoredResume, kind: str, parsed: BaseModel) -> None:
+    data = parsed.model_dump()
+    resume.parses[kind] = data
+    if not resume.owner:
+        return
+    try:
+        await app_data.save_resume_parse(resume.owner, resume.content_hash, PARSE_ATTRIBUTE_PREFIX + kind,
+                                         _to_dynamo(data), datetime.now().isoformat())
+    except Exception as e:
+        logger.warning(f"Could not store {kind} parse of resume {resume.content_hash[:12]}: {str(e)}")
+
+
+async def parse(
+    resume: StoredResume,
+    kind: str,
+    model: Type[ModelT],
+    produce: Callable[[], Awaitable[ModelT]],
+) -> ModelT:
+    """The stored parse of this kind, or ``produce()``'s result, which is then stored."""
+    parsed = stored_parse(resume, kind, model)
+    if parsed is not None:
+        logger.info(f"Reusing stored {kind} parse of resume {resume.content_hash[:12]}")
+        return parsed
+    parsed = await produce()
+    await save_parse(resume, kind, parsed)
+    return parsed
@@ -0,0 +1,206 @@
+"""
+Resume text extraction off the event loop.
+
+PDF text comes from one of the PDF_BACKENDS, chosen by PDF_TEXT_BACKEND:
+
+- pdfium (default): PDFium through pypdfium2. Native and several times
+  faster than PyPDF2. It orders text by position on the page and infers
+  word gaps from glyph positions, so resumes exported from design tools
+  (one text run per word) keep their spaces.
+- pypdf2: the previous pure-Python extractor. It is used as a fallback
+  whenever the configured backend is missing or fails on a file.
+
+Extraction is CPU bound, so it runs on a small thread pool instead of the
+event loop. The PDF and DOCX libraries are imported by the first extraction
+that needs them, not with this module. A process pool would isolate them
+further, but Lambda has no /dev/shm, which multiprocessing needs.
+
+The same upload is often extracted by several endpoints (crafting, analysis,
+auto-fill), so results are memoized by SHA-256 of the file bytes. Concurrent
+requests for the same bytes share one extraction.
+
+Oversized PDFs stop early: at most MAX_PDF_PAGES pages are read, and reading
+stops once MAX_TEXT_CHARS characters have been collected.
+"""
+import asyncio
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from aws_lambda_powertools import Logger
+
+logger = Logger()
+
+EXTRACT_MAX_WORKERS = 2
+MAX_PDF_PAGES = 10
+MAX_TEXT_CHARS = 50_000
+TEXT_CACHE_MAX_ENTRIES = 64
+
+PDF = 'pdf'
+DOCX = 'docx'
+
+PDFIUM = 'pdfium'
+PYPDF2 = 'pypdf2'
+PDF_BACKEND = os.environ.get('PDF_TEXT_BACKEND', PDFIUM)
+
+_executor = ThreadPoolExecutor(max_workers=EXTRACT_MAX_WORKERS, thread_name_prefix='resume-text')
+_texts: 'OrderedDict[str, str]' = OrderedDict()
+_in_flight: Dict[Tuple[asyncio.AbstractEventLoop, str], 'asyncio.Future[str]'] = {}
+_lock = threading.Lock()
+# PDFium is not thread-safe; pypdfium2 calls must not overlap
+_pdfium_lock = threading.Lock()
+
+
+# ── PDF backends ─────────────────────────────────────────────────────────────
+# A backend takes the file bytes and a page cap, and returns the page count
+# and an iterator of page texts, read lazily so callers can stop early.
+
+PdfPages = Tuple[int, Iterator[str]]
+
+
+def _pdfium_pages(file_content: bytes, max_pages: int) -> PdfPages:
+    import pypdfium2
+
+    def pages(pdf) -> Iterator[str]:
+        try:
+            for page_num in range(min(len(pdf), max_pages)):
+                with _pdfium_lock:
+                    page = pdf[page_num]
+                    textpage = page.get_textpage()
+                    text = textpage.get_text_range()
+                    textpage.close()
+                    page.close()
+                yield text.replace('\r\n', '\n')
+        finally:
+            with _pdfium_lock:
+                pdf.close()
+
+    with _pdfium_lock:
+        pdf = pypdfium2.PdfDocument(file_content)
+        page_count = len(pdf)
+    return page_count, pages(pdf)
+
+
+def _pypdf2_pages(file_content: bytes, max_pages: int) -> PdfPages:
+    import PyPDF2
+
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
+    pages = pdf_reader.pages
+    return len(pages), (pages[page_num].extract_text() or '' for page_num in range(min(len(pages), max_pages)))
+
+
+PDF_BACKENDS: Dict[str, Callable[[bytes, int], PdfPages]] = {PDFIUM: _pdfium_pages, PYPDF2: _pypdf2_pages}
+
+
+def _read_pages(backend: str, file_content: bytes, max_pages: int, max_chars: int) -> str:
+    page_count, pages = PDF_BACKENDS[backend](file_content, max_pages)
+    parts = []
+    collected = 0
+    for text in pages:
+        parts.append(text)
+        collected += len(text) + 1
+        if collected >= max_chars:
+            pages.close()
+            break
+
+    if page_count > len(parts):
+        logger.warning(f"Read {len(parts)} of {page_count} PDF pages (page/character cap reached)")
+    logger.info(f"Successfully extracted text from PDF with {page_count} pages", extra={"pdf_backend": backend})
+    return "\n".join(parts).strip()[:max_chars]
+
+
+def pdf_text(
+    file_content: bytes,
+    max_pages: int = MAX_PDF_PAGES,
+    max_chars: int = MAX_TEXT_CHARS,
+    backend: Optional[str] = None,
+) -> str:
+    """
+    Text of the first ``max_pages`` pages, stopping early past ``max_chars``.
+    Uses ``backend`` (default PDF_BACKEND), then PyPDF2 if that fails.
+    """
+    backend = backend or PDF_BACKEND
+    attempts = [backend] if backend == PYPDF2 else [backend, PYPDF2]
+    error = None
+    for attempt in attempts:
+        try:
+            return _read_pages(attempt, file_content, max_pages, max_chars)
+        except Exception as e:
+            error = e
+            if attempt != attempts[-1]:
+                logger.warning(f"PDF backend {attempt} failed, falling back to {attempts[-1]}: {str(e)}")
+
+    logger.error(f"Error extracting text from PDF: {str(error)}")
+    # Fallback: try to decode as text if it's not a PDF
+    try:
+        return file_content.decode('utf-8')
+    except Exception:
+        raise Exception(f"Failed to extract text from PDF: {str(error)}")
+
+
+def docx_text(file_content: bytes, max_chars: int = MAX_TEXT_CHARS) -> str:
+    """Paragraph and table text of a DOCX document."""
+    try:
+        try:
+            from docx import Document
+        except ImportError:
+            raise Exception("python-docx library is not installed")
+
+        doc = Document(io.BytesIO(file_content))
+        parts = [paragraph.text for paragraph in doc.paragraphs]
+        for table in doc.tables:
+            for row in table.rows:
+                parts.append(" ".join(cell.text for cell in row.cells))
+
+        logger.info("Successfully extracted text from DOCX")
+        return "\n".join(parts).strip()[:max_chars]
+
+    except Exception as e:
+        logger.error(f"Error extracting text from DOCX: {str(e)}")
+        raise Exception(f"Failed to extract text from DOCX: {str(e)}")
+
+
+_EXTRACTORS: Dict[str, Callable[[bytes], str]] = {PDF: pdf_text, DOCX: docx_text}
+
+
+def _cached(key: str) -> Optional[str]:
+    with _lock:
+        text = _texts.get(key)
+        if text is not None:
+            _texts.move_to_end(key)
+        return text
+
+
+def _store(key: str, text: str) -> None:
+    with _lock:
+        _texts[key] = text
+        _texts.move_to_end(key)
+        while len(_texts) > TEXT_CACHE_MAX_ENTRIES:
+            _texts.popitem(last=False)
+
+
+async def extract(file_content: bytes, kind: str) -> str:
+    """Extracted text of a PDF or DOCX upload, memoized by content hash."""
+    key = f"{kind}:{hashlib.sha256(file_content).hexdigest()}"
+    text = _cached(key)
+    if text is not None:
+        logger.info("Resume text served from cache")
+        return text
+
+    loop = asyncio.get_running_loop()
+    pending = _in_flight.get((loop, key))
+    if pending is not None:
+        return await asyncio.shield(pending)
+
+    future = loop.run_in_executor(_executor, _EXTRACTORS[kind], file_content)
+    _in_flight[(loop, key)] = future
+    try:
+        text = await asyncio.shield(future)
+    finally:
+        _in_flight.pop((loop, key), None)
+    _store(key, text)
+    return text
@@ -0,0 +1,137 @@
+"""
+Per-host robots.txt cache with precompiled allow/disallow rules.
+
+check_robots_txt() used to download and rescan /robots.txt before every job
+URL fetch. Job URLs concentrate on a handful of hosts (Greenhouse, Lever,
+Workday, LinkedIn), so the parsed rules are kept per host:
+
+- successfully parsed files are cached for ROBOTS_CACHE_TTL_SECONDS
+- negative results (404, timeouts, connection errors) are cached for
+  ROBOTS_NEGATIVE_TTL_SECONDS, so a host without robots.txt is not retried
+  on every request
+
+Rules for the ``*`` user agent are compiled into regexes once. Matching follows
+the usual robots.txt precedence: the longest matching rule wins, and Allow wins
+ties.
+"""
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Pattern, Tuple
+
+ROBOTS_CACHE_TTL_SECONDS = 6 * 3600
+ROBOTS_NEGATIVE_TTL_SECONDS = 3600
+ROBOTS_CACHE_MAX_HOSTS = 1024
+
+CAPTCHA_KEYWORDS = ('captcha', 'recaptcha', 'hcaptcha', 'verification required')
+
+
+@dataclass
+class RobotsRule:
+    path: str
+    allow: bool
+    pattern: Pattern
+
+    @classmethod
+    def compile(cls, path: str, allow: bool) -> 'RobotsRule':
+        anchored = path.endswith('$')
+        body = path[:-1] if anchored else path
+        regex = '.*'.join(re.escape(part) for part in body.split('*'))
+        return cls(path, allow, re.compile(regex + ('$' if anchored else '')))
+
+
+@dataclass
+class RobotsRules:
+    rules: List[RobotsRule] = field(default_factory=list)
+    captcha_required: bool = False
+
+    def check(self, path: str) -> Tuple[bool, str]:
+        """Return (is_blocked, reason) for a URL path."""
+        if self.captcha_required:
+            return (True, "Website requires captcha verification")
+
+        best: Optional[RobotsRule] = None
+        for rule in self.rules:
+            if not rule.pattern.match(path):
+                continue
+            if (best is None or len(rule.path) > len(best.path)
+                    or (len(rule.path) == len(best.path) and rule.allow)):
+                best = rule
+
+        if best is not None and not best.allow:
+            return (True, f"Path blocked by robots.txt (disallow: {best.path})")
+        return (False, "")
+
+
+# Shared instance for hosts without a usable robots.txt (nothing is blocked)
+ALLOW_ALL = RobotsRules()
+
+
+def parse_robots(content: str) -> RobotsRules:
+    """Compile the rules that apply to all user agents (``*`` groups)."""
+    lowered = content.lower()
+    if any(keyword in lowered for keyword in CAPTCHA_KEYWORDS):
+        return RobotsRules(captcha_required=True)
+
+    rules: List[RobotsRule] = []
+    group_agents: List[str] = []
+    in_agent_block = False
+
+    for raw_line in content.splitlines():
+        line = raw_line.split('#', 1)[0].strip()
+        if not line or ':' not in line:
+            continue
+        directive, value = line.split(':', 1)
+        directive = directive.strip().lower()
+        value = value.strip()
+
+        if directive == 'user-agent':
+            # Consecutive User-agent lines share one group
+            if not in_agent_block:
+                group_agents = []
+            group_agents.append(value.lower())
+            in_agent_block = True
+            continue
+
+        in_agent_block = False
+        if directive not in ('allow', 'disallow') or not value:
+            continue
+        # Rules before any User-agent line are treated as global
+        if group_agents and '*' not in group_agents:
+            continue
+        rules.append(RobotsRule.compile(value, allow=(directive == 'allow')))
+
+    return RobotsRules(rules=rules)
+
+
+# ── Per-host cache ───────────────────────────────────────────────────────────
+
+_hosts: Dict[str, Tuple[float, RobotsRules]] = {}
+_lock = threading.Lock()
+
+
+def get(host: str) -> Optional[RobotsRules]:
+    """Cached rules for ``host`` (scheme://netloc), or None when unknown/expired."""
+    with _lock:
+        entry = _hosts.get(host)
+        if entry is None:
+            return None
+        expires_at, rules = entry
+        if expires_at <= time.time():
+            del _hosts[host]
+            return None
+        return rules
+
+
+def put(host: str, rules: RobotsRules) -> None:
+    ttl = ROBOTS_NEGATIVE_TTL_SECONDS if rules is ALLOW_ALL else ROBOTS_CACHE_TTL_SECONDS
+    with _lock:
+        if len(_hosts) >= ROBOTS_CACHE_MAX_HOSTS and host not in _hosts:
+            _hosts.pop(next(iter(_hosts)))
+        _hosts[host] = (time.time() + ttl, rules)
+
+
+def put_negative(host: str) -> None:
+    """Remember that robots.txt could not be fetched (404, timeout, ...)."""
+    put(host, ALLOW_ALL)
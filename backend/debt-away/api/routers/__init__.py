@@ -0,0 +1,9 @@
+"""
+Feature routers of the API. app.py includes all of them; each module imports
+only what its own endpoints need, and heavy libraries (stripe, openai, bs4, PDF
+and DOCX parsers, numpy) are imported on first use.
+
+Each module lists the external clients its endpoints use in RESOURCES; they
+are warmed before the first request (see resources). Endpoints receive the
+clients through FastAPI dependencies and pass them to the helpers they call.
+"""
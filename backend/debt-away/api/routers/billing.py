@@ -0,0 +1,246 @@
+"""
+Subscriptions and usage: Stripe checkout, payment history, cancellation and quota reads.
+"""
+import os
+
+from aws_lambda_powertools import Logger
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+import app_data_repository as app_data
+from config import STRIPE_SECRET_KEY_AMBITOLOGY
+from resources import stripe_sdk
+
+logger = Logger()
+router = APIRouter()
+RESOURCES = ('dynamodb', 'stripe')
+
+
+# ambitology
+@router.post("/subscription_stripe_checkout_page_handler")
+async def subscription_stripe_checkout_page_handler(request: Request, stripe=Depends(stripe_sdk)):
+    try:
+        data = await request.json()
+        cognito_sub = data.get('cognito_sub', '')
+        email = data.get('email', '')
+        selected_plan = data.get('selected_plan', '')
+
+        plan_price_map = {
+            '2weeks': 'price_1SzqA3Fixq4WY15eJGcxWv7l',
+            '1month': 'price_1Szq9NFixq4WY15eMQzhzm3k',
+            '3months': 'price_1Szq83Fixq4WY15eDVms6mWR',
+        }
+
+        price_id = plan_price_map.get(selected_plan)
+        if not price_id:
+            raise HTTPException(status_code=400, detail=f"Invalid plan: {selected_plan}")
+
+        logger.info(f"Creating subscription checkout for {email}, plan: {selected_plan}")
+
+        # Determine success/cancel URLs based on environment
+        is_local = os.environ.get("AWS_SAM_LOCAL") == "true"
+        if is_local:
+            base_url = "http://localhost:3000"
+        else:
+            base_url = "https://ambitology.com"
+
+        success_url = f"{base_url}/dashboard?session_id={{CHECKOUT_SESSION_ID}}"
+        cancel_url = f"{base_url}/dashboard"
+
+        # Temporarily use the Ambitology Stripe key
+        original_key = stripe.api_key
+        stripe.api_key = STRIPE_SECRET_KEY_AMBITOLOGY
+
+        try:
+            checkout_session = stripe.checkout.Session.create(
+                payment_method_types=['card'],
+                customer_email=email,
+                metadata={
+                    'service_name': 'Ambitology Subscription',
+                    'cognito_sub': cognito_sub,
+                    'email': email,
+                    'selected_plan': selected_plan,
+                },
+                line_items=[
+                    {
+                        'price': price_id,
+                        'quantity': 1,
+                    },
+                ],
+                mode='subscription',
+                allow_promotion_codes=True,
+                success_url=success_url,
+                cancel_url=cancel_url,
+                branding_settings={
+                    'background_color': '#f5f2eb',
+                    'button_color': '#9b6a10',
+                    'border_style': 'rounded',
+                    'font_family': 'inter',
+                    'display_name': 'Ambitology',
+                },
+            )
+        finally:
+            stripe.api_key = original_key
+
+        logger.info(f"Stripe subscription checkout session created: {checkout_session.id}")
+
+        return {
+            "status": "success",
+            "payment_url": checkout_session.url,
+            "checkout_session_id": checkout_session.id,
+        }
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in subscription checkout: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"Error creating checkout session: {str(e)}")
+
+
+@router.get("/get_subscription/{cognito_sub}")
+async def get_subscription(cognito_sub: str):
+    plan = await app_data.get_plan(cognito_sub)
+    return {"plan": plan}
+
+
+# ambitology
+@router.get("/get_usage/{cognito_sub}")
+async def get_usage(cognito_sub: str):
+    try:
+        return await app_data.get_usage(cognito_sub)
+    except Exception as e:
+        logger.error(f"Error in get_usage: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error fetching usage: {str(e)}")
+
+
+# ambitology
+@router.post("/get_payment_history")
+async def get_payment_history(request: Request, stripe=Depends(stripe_sdk)):
+    try:
+        data = await request.json()
+        email = data.get('email', '').strip().lower()
+        cognito_sub = data.get('cognito_sub', '').strip()
+        if not email and not cognito_sub:
+            raise HTTPException(status_code=400, detail="email or cognito_sub is required")
+
+        original_key = stripe.api_key
+        stripe.api_key = STRIPE_SECRET_KEY_AMBITOLOGY
+        try:
+            customer_id = None
+
+            # Strategy 1: look up customer by exact email
+            if email:
+                customers = stripe.Customer.list(email=email, limit=10)
+                if customers.data:
+                    customer_id = customers.data[0].id
+                    logger.info(f"Found Stripe customer {customer_id} by email")
+
+            # Strategy 2: search recent checkout sessions by cognito_sub metadata
+            if not customer_id and cognito_sub:
+                sessions = stripe.checkout.Session.list(limit=100)
+                for session in sessions.auto_paging_iter():
+                    meta = session.get('metadata') or {}
+                    if meta.get('cognito_sub') == cognito_sub and session.get('customer'):
+                        customer_id = session['customer']
+                        logger.info(f"Found Stripe customer {customer_id} via checkout session metadata")
+                        break
+
+            if not customer_id:
+                logger.info(f"No Stripe customer found for email={email} cognito_sub={cognito_sub}")
+                return {"payments": [], "subscription": None}
+
+            # Fetch invoices (main payment history source for subscriptions)
+            invoices = stripe.Invoice.list(customer=customer_id, limit=50, expand=['data.subscription'])
+            payments = []
+            for inv in invoices.data:
+                # Build a human-readable description with fallbacks
+                description = None
+                if inv.get('description'):
+                    description = inv['description']
+                elif inv.lines and inv.lines.data:
+                    line = inv.lines.data[0]
+                    description = line.get('description') or None
+                if not description:
+                    description = "Ambitology Subscription"
+
+                amount = inv.get('amount_paid') or inv.get('amount_due') or 0
+                payments.append({
+                    "id": inv.id,
+                    "amount": amount,
+                    "currency": inv.get('currency', 'usd'),
+                    "status": inv.get('status', 'unknown'),
+                    "date": inv.get('created', 0),
+                    "description": description,
+                    "invoice_url": inv.get('hosted_invoice_url'),
+                    "invoice_pdf": inv.get('invoice_pdf'),
+                })
+
+            # Sort by date descending (most recent first)
+            payments.sort(key=lambda p: p['date'], reverse=True)
+
+            # Get subscription info — check both active and trialing; also include
+            # subscriptions with cancel_at_period_end set (still technically active)
+            subscription_info = None
+            for status in ('active', 'trialing', 'past_due'):
+                subs = stripe.Subscription.list(customer=customer_id, status=status, limit=1)
+                if subs.data:
+                    sub = subs.data[0]
+                    sub_dict = sub if isinstance(sub, dict) else sub.to_dict_recursive() if hasattr(sub, 'to_dict_recursive') else dict(sub)
+                    subscription_info = {
+                        "id": sub_dict.get("id"),
+                        "status": sub_dict.get("status"),
+                        "current_period_end": sub_dict.get("current_period_end"),
+                        "cancel_at_period_end": sub_dict.get("cancel_at_period_end", False),
+                    }
+                    break
+
+            return {"payments": payments, "subscription": subscription_info}
+        finally:
+            stripe.api_key = original_key
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in get_payment_history: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"Error fetching payment history: {str(e)}")
+
+
+# ambitology
+@router.post("/cancel_subscription")
+async def cancel_subscription(request: Request, stripe=Depends(stripe_sdk)):
+    try:
+        data = await request.json()
+        email = data.get('email', '')
+        cognito_sub = data.get('cognito_sub', '')
+        if not email:
+            raise HTTPException(status_code=400, detail="email is required")
+
+        original_key = stripe.api_key
+        stripe.api_key = STRIPE_SECRET_KEY_AMBITOLOGY
+        stripe_cancelled = False
+        try:
+            customers = stripe.Customer.list(email=email, limit=5)
+            if customers.data:
+                customer_id = customers.data[0].id
+                subscriptions = stripe.Subscription.list(customer=customer_id, status='active', limit=1)
+                if subscriptions.data:
+                    sub_id = subscriptions.data[0].id
+                    stripe.Subscription.modify(sub_id, cancel_at_period_end=True)
+                    stripe_cancelled = True
+        finally:
+            stripe.api_key = original_key
+
+        # Always update DynamoDB plan to 'free' and mark cancellation
+        if cognito_sub:
+            await app_data.mark_subscription_cancelled(cognito_sub)
+
+        msg = "Subscription cancelled at period end" if stripe_cancelled else "Plan downgraded to free"
+        return {"status": "success", "message": msg}
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error in cancel_subscription: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error cancelling subscription: {str(e)}")
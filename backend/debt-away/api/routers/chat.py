@@ -0,0 +1,948 @@
+"""
+The /ai-chat assistant, including its tool calls and resume-evaluation mode.
+"""
+import json
+import re
+import time
+
+from aws_lambda_powertools import Logger
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+
+import app_data_repository as app_data
+import http_client
+from resources import llm_client
+from routers.shared import SSE_HEADERS, sse_event, wants_event_stream
+
+logger = Logger()
+router = APIRouter()
+RESOURCES = ('dynamodb', 'openai', 'html')
+
+
+RESUME_TOOLS = [
+    {
+        "type": "function",
+        "function": {
+            "name": "ask_resume_intent",
+            "description": (
+                "Use this when the user has a general or ambiguous resume request that could mean "
+                "either building a brand-new resume from their profile OR improving an existing one. "
+                "Trigger examples: 'Make my resume', 'Build my resume', 'Help me with my resume', "
+                "'How do I write a resume?', 'I need a resume', 'Create my resume', 'Write my resume', "
+                "'Can you make me a resume?', 'I want to make a resume', 'How to build a resume'. "
+                "The UI will display two clickable option cards side by side so the user can choose their path. "
+                "Always call this tool for general or ambiguous resume requests — never present options as plain text."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "reply": {
+                        "type": "string",
+                        "description": (
+                            "A short intro line before the option cards appear "
+                            "(e.g. 'Here are two ways I can help you build your resume.'). "
+                            "Keep it under 20 words."
+                        )
+                    }
+                },
+                "required": ["reply"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "navigate_to_existing_resume",
+            "description": (
+                "Use this ONLY when the user explicitly and specifically asks to improve, enhance, "
+                "polish, tailor, fix, update, strengthen, or rewrite an existing resume they already have. "
+                "Use navigate_to_existing_resume when intent is clearly about an existing resume they want to improve. "
+                "Ambitology's 'Craft from Existing Resume' service handles this."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "reply": {
+                        "type": "string",
+                        "description": (
+                            "A warm, concise reply (2-3 sentences) telling the user that "
+                            "Ambitology's 'Craft from Existing Resume' service can help. "
+                            "Briefly explain it analyzes their resume and tailors it for any job. "
+                            "Ask if they'd like to go there now."
+                        )
+                    }
+                },
+                "required": ["reply"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "navigate_to_knowledge_base_resume",
+            "description": (
+                "Use this when the user asks how to craft, create, generate, or build a resume "
+                "from their knowledge base, experience, background, projects, technical skills, "
+                "work history, or professional profile stored in Ambitology. "
+                "Ambitology's 'Craft from Knowledge Base' service generates a tailored resume "
+                "from the user's saved skills, projects, and experience for a target job or industry."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "reply": {
+                        "type": "string",
+                        "description": (
+                            "A warm, concise reply (2-3 sentences) telling the user that "
+                            "Ambitology's 'Craft from Knowledge Base' service can generate a "
+                            "tailored resume directly from their saved profile, skills, and projects. "
+                            "Ask if they'd like to go there now."
+                        )
+                    }
+                },
+                "required": ["reply"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "show_pricing",
+            "description": (
+                "Use this when the user asks about plans, pricing, cost, subscription, upgrade, or feature access. "
+                "Trigger examples: 'What plans do you have?', 'What's the price for pro?', 'What does the free plan include?', "
+                "'What does the pro plan include?', 'How can I upgrade?', 'My usage is blocked', "
+                "'How many free uses do I get?', 'Do I have unlimited usage?'. "
+                "Always call this tool — never describe pricing in plain text."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "reply": {
+                        "type": "string",
+                        "description": "A short intro line before the pricing card appears (e.g. 'Here's an overview of our plans.'). Keep it under 15 words."
+                    }
+                },
+                "required": ["reply"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "ask_project_type",
+            "description": (
+                "Use this in STEP 1 of the project analysis flow to ask the user what kind of project "
+                "they want to analyze. Always call this tool — never ask as plain text. "
+                "The UI will present four clickable cards: Personal Project, Side Project, Work Project, Research Project."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "reply": {
+                        "type": "string",
+                        "description": "A short intro line before the choices appear (e.g. 'First, what kind of project is this?'). Keep it under 15 words."
+                    }
+                },
+                "required": ["reply"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "ask_project_status",
+            "description": (
+                "Use this in STEP 2 of the project analysis flow to ask the user whether the project "
+                "is currently in progress, already completed, or a planned future project. "
+                "Always call this tool — never ask as plain text. "
+                "The UI will present three clickable cards: In Progress, Completed, Planning Ahead."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "reply": {
+                        "type": "string",
+                        "description": "A short line before the choices appear (e.g. 'And what's the status of this project?'). Keep it under 15 words."
+                    }
+                },
+                "required": ["reply"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "navigate_to_established_personal_project",
+            "description": (
+                "Use this when the user has confirmed they want to analyze a personal project "
+                "that is ongoing or already completed — to generate bullet points, find technologies, "
+                "tools, or technical keywords for that project. Navigate them to "
+                "Knowledge Base > Established Expertise > Personal Project and create a new project page."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "reply": {
+                        "type": "string",
+                        "description": (
+                            "A warm, concise reply (1-2 sentences) confirming you're taking them to "
+                            "the Established Expertise > Personal Project page to add a new project. "
+                            "Then ask them to provide the project URL or paste the project details "
+                            "so you can generate the best description."
+                        )
+                    }
+                },
+                "required": ["reply"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "navigate_to_expanding_personal_project",
+            "description": (
+                "Use this when the user has confirmed they want to analyze a personal project "
+                "that is planned for the future (not yet started) — to generate bullet points, "
+                "find technologies, tools, or technical keywords for that project. Navigate them to "
+                "Knowledge Base > Expanding Knowledge Base > Planned Personal Project and create a new project page."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "reply": {
+                        "type": "string",
+                        "description": (
+                            "A warm, concise reply (1-2 sentences) confirming you're taking them to "
+                            "the Expanding Knowledge Base > Planned Personal Project page to add a new project. "
+                            "Then ask them to provide the project URL or paste the project details "
+                            "so you can generate the best description."
+                        )
+                    }
+                },
+                "required": ["reply"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "navigate_to_established_professional_project",
+            "description": (
+                "Use this when the user has confirmed they want to analyze a professional or work-related "
+                "project that is ongoing or already completed — to generate bullet points, find technologies, "
+                "tools, or technical keywords for that project. Navigate them to "
+                "Knowledge Base > Established Expertise > Professional Project and create a new project page."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "reply": {
+                        "type": "string",
+                        "description": (
+                            "A warm, concise reply (1-2 sentences) confirming you're taking them to "
+                            "the Established Expertise > Professional Project page to add a new project. "
+                            "Then ask them to provide the project URL or paste the project details "
+                            "so you can generate the best description."
+                        )
+                    }
+                },
+                "required": ["reply"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "navigate_to_expanding_professional_project",
+            "description": (
+                "Use this when the user has confirmed they want to analyze a professional or work-related "
+                "project that is planned for the future (not yet started) — to generate bullet points, "
+                "find technologies, tools, or technical keywords for that project. Navigate them to "
+                "Knowledge Base > Expanding Knowledge Base > Planned Professional Project and create a new project page."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "reply": {
+                        "type": "string",
+                        "description": (
+                            "A warm, concise reply (1-2 sentences) confirming you're taking them to "
+                            "the Expanding Knowledge Base > Planned Professional Project page to add a new project. "
+                            "Then ask them to provide the project URL or paste the project details "
+                            "so you can generate the best description."
+                        )
+                    }
+                },
+                "required": ["reply"]
+            }
+        }
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "analyze_project",
+            "description": (
+                "Use this when the user has provided project details (a URL or text description) "
+                "and you need to analyze the project to generate professional resume bullet points, project details, "
+                "and technical keyword or skills or tools suggestions. Only call this after the user has provided "
+                "actual project content (URL or pasted details)."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "reply": {
+                        "type": "string",
+                        "description": "A brief message (1 sentence) saying you're analyzing the project now."
+                    },
+                    "project_details": {
+                        "type": "string",
+                        "description": "The project URL or description text provided by the user."
+                    },
+                    "project_type": {
+                        "type": "string",
+                        "enum": [
+                            "personal_established",
+                            "personal_expanding",
+                            "professional_established",
+                            "professional_expanding"
+                        ],
+                        "description": (
+                            "The project type inferred from the earlier conversation. "
+                            "personal_established = personal + ongoing/done, "
+                            "personal_expanding = personal + future planned, "
+                            "professional_established = professional + ongoing/done, "
+                            "professional_expanding = professional + future planned."
+                        )
+                    }
+                },
+                "required": ["reply", "project_details", "project_type"]
+            }
+        }
+    }
+]
+
+
+# ── AI Chat user-context cache (in-memory, 5-min TTL) ────────────────────────
+import time as _time
+
+_ai_ctx_cache: dict = {}
+
+
+_AI_CTX_TTL = 300  # seconds
+
+
+def _get_ai_ctx(cognito_sub: str):
+    entry = _ai_ctx_cache.get(cognito_sub)
+    if entry and (_time.time() - entry["ts"]) < _AI_CTX_TTL:
+        return entry["ctx"]
+    return None
+
+
+def _set_ai_ctx(cognito_sub: str, ctx: str) -> None:
+    _ai_ctx_cache[cognito_sub] = {"ctx": ctx, "ts": _time.time()}
+
+
+async def _build_ai_user_context(cognito_sub: str, career_focus: str) -> str:
+    """
+    Fetch profile + established/expanding knowledge from DynamoDB in a single
+    BatchGetItem call and return a compact plain-text summary for the system prompt.
+    Results are cached per user for 5 minutes so repeated chat messages are fast.
+    """
+    cached = _get_ai_ctx(cognito_sub)
+    if cached is not None:
+        return cached
+
+    try:
+        cf = (career_focus or "software-engineering").strip() or "software-engineering"
+
+        items = await app_data.batch_get_user_items(cognito_sub, [
+            "PROFILE#MAIN",
+            app_data.knowledge_sort_key(app_data.KNOWLEDGE_ESTABLISHED, cf),
+            app_data.knowledge_sort_key(app_data.KNOWLEDGE_EXPANDING, cf),
+        ])
+
+        parts: list = []
+
+        # ── Profile ──────────────────────────────────────────────────────────
+        profile = items.get("PROFILE#MAIN", {}).get("data", {})
+        if profile:
+            edu_list = profile.get("education", [])
+            edu_parts = []
+            for c in edu_list[:2]:
+                degs = c.get("degrees", [])
+                d = degs[0] if degs else {}
+                school = c.get("collegeName", "")
+                degree = d.get("degree", "")
+                major = d.get("major", "")
+                if school:
+                    label = f"{degree} in {major} from {school}" if degree and major else school
+                    edu_parts.append(label)
+            if edu_parts:
+                parts.append(f"Education: {'; '.join(edu_parts)}")
+
+            companies = profile.get("professional", {}).get("companies", [])
+            job_parts = []
+            for co in companies[:3]:
+                title = co.get("jobTitle", "")
+                company = co.get("companyName", "")
+                if title and company:
+                    suffix = " (current)" if co.get("isPresent") else ""
+                    job_parts.append(f"{title} at {company}{suffix}")
+            if job_parts:
+                parts.append(f"Work experience: {'; '.join(job_parts)}")
+
+            achievements = profile.get("professional", {}).get("achievements", [])
+            ach_vals = [a.get("value", "") for a in achievements[:3] if a.get("value")]
+            if ach_vals:
+                parts.append(f"Notable achievements: {'; '.join(ach_vals)}")
+
+        # ── Established knowledge ─────────────────────────────────────────────
+        est = items.get(f"KNOWLEDGE#ESTABLISHED#{cf}", {}).get("data", {})
+        if est:
+            projs = est.get("personal_project", []) + est.get("professional_project", [])
+            proj_names = [p.get("projectName", "") for p in projs[:5] if p.get("projectName")]
+            if proj_names:
+                parts.append(f"Projects built: {', '.join(proj_names)}")
+
+            skills_obj = est.get("technical_skills", {})
+            selected_skills = skills_obj.get("selectedSkills", [])
+            if selected_skills:
+                parts.append(f"Technical skills: {', '.join(selected_skills[:15])}")
+
+        # ── Expanding knowledge ───────────────────────────────────────────────
+        exp = items.get(f"KNOWLEDGE#EXPANDING#{cf}", {}).get("data", {})
+        if exp:
+            future_projs = (
+                exp.get("future_personal_project", []) +
+                exp.get("future_professional_project", [])
+            )
+            future_names = [p.get("projectName", "") for p in future_projs[:3] if p.get("projectName")]
+            if future_names:
+                parts.append(f"Planned projects: {', '.join(future_names)}")
+
+            future_skills_obj = exp.get("future_technical_skills", {})
+            future_skills = future_skills_obj.get("selectedSkills", [])
+            if future_skills:
+                parts.append(f"Learning goals: {', '.join(future_skills[:10])}")
+
+        ctx = "\n".join(parts)
+        _set_ai_ctx(cognito_sub, ctx)
+        return ctx
+
+    except Exception as exc:
+        logger.warning(f"_build_ai_user_context failed for {cognito_sub}: {exc}")
+        return ""
+
+
+# ── Resume evaluation intent detection ───────────────────────────────────────
+
+_RESUME_EVAL_KEYWORDS = [
+    "evaluat", "review", "analyz", "assess", "critique",
+    "improve", "enhanc", "better", "strengthen", "boost", "optimiz",
+    "issue", "mistake", "problem", "error", "wrong", "fix",
+    "good", "bad", "weak", "strong", "quality", "rate", "score", "grade",
+    "suggest", "tip", "advice", "feedback", "recommend",
+    "missing", "gap", "lack", "need", "stand out",
+    "ats", "keyword", "tailor", "align", "compelling", "impressive", "effective",
+    "how is", "what do you think", "what's wrong", "check",
+]
+
+
+def _is_resume_evaluation_query(message: str, page_context: dict) -> bool:
+    """True when the user is asking to evaluate/review/improve their resume."""
+    section = (page_context.get("section") or "").strip()
+    resume_content = (page_context.get("data") or {}).get("resumeContent", "") or ""
+    if section != "resume" or not resume_content.strip():
+        return False
+    if "Your Name" in resume_content:           # placeholder, not yet crafted
+        return False
+    ml = message.lower()
+    return any(kw in ml for kw in _RESUME_EVAL_KEYWORDS)
+
+
+def _resume_evaluation_messages(
+    message: str,
+    user_context_block: str,
+    resume_content: str,
+    target_job: str,
+    history: list,
+) -> list:
+    """
+    Prompt for the dedicated evaluation chain.
+    Asks for ≤5 structured, actionable suggestions — no tool calls, no re-craft suggestions.
+    Uses a strict format so the frontend renders it cleanly.
+    """
+    target_line = f"Target role this resume is tailored for: {target_job}\n\n" if target_job else ""
+
+    eval_system = (
+        user_context_block
+        + "You are a professional and friendly career coach AI for Ambitology — "
+        "a trusted senior resume reviewer with deep expertise in tech hiring. "
+        "Speak directly, honestly, and with genuine care for the user's growth.\n\n"
+        "TASK: Review the resume provided below and deliver a concise, honest assessment.\n\n"
+        "STRICT RULES:\n"
+        "- Give EXACTLY 3 to 5 actionable suggestions — no more, no fewer.\n"
+        "- Every suggestion must be specific to THIS resume (reference real content by name).\n"
+        "- Do NOT suggest to re-craft, regenerate, or rebuild the resume through any tool.\n"
+        "- Do NOT say you cannot see, access, or view the resume or any page.\n"
+        "- Do NOT mention AI, tools, or this system.\n\n"
+        "OUTPUT FORMAT (follow exactly, no deviations):\n"
+        "<One concise overall verdict sentence.>\n\n"
+        "① **[Category]** — Specific observation from the resume + clear, actionable improvement step.\n\n"
+        "② **[Category]** — Specific observation + clear improvement step.\n\n"
+        "③ **[Category]** — Specific observation + clear improvement step.\n\n"
+        "(Add ④ and ⑤ only if genuinely needed — never pad to reach 5)\n\n"
+        "Category labels to use (pick the most fitting): "
+        "Impact & Metrics | Skill Alignment | Bullet Strength | ATS Keywords | "
+        "Project Depth | Formatting | Achievement Visibility | Career Narrative | "
+        "Quantified Results | Role Relevance\n\n"
+        f"{target_line}"
+        f"RESUME:\n{resume_content[:3500]}"
+    )
+
+    return [
+        {"role": "system", "content": eval_system},
+        *[{"role": m["role"], "content": m["content"]} for m in history[-4:]],
+        {"role": "user", "content": message},
+    ]
+
+
+async def _handle_resume_evaluation(eval_messages: list, llm) -> dict:
+    """Dedicated evaluation chain; see _resume_evaluation_messages."""
+    try:
+        response = await llm.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=eval_messages,
+            temperature=0.35,
+            # No `tools` parameter → tool calls are impossible
+        )
+        reply = response.choices[0].message.content or "I'd be happy to review your resume in detail."
+    except Exception as exc:
+        logger.error(f"_handle_resume_evaluation error: {exc}")
+        reply = "I encountered an issue while reviewing your resume. Please try again in a moment."
+
+    logger.info(f"Resume evaluation reply generated ({len(reply)} chars)")
+    return {"status": "success", "reply": reply}
+
+
+async def _prepare_ai_chat(data: dict) -> dict:
+    """
+    Build the chat request shared by the JSON and streaming modes.
+    Returns {"email", "career_focus", "messages", "evaluation"}; ``evaluation``
+    holds the evaluation-chain messages when the resume evaluation handler
+    should answer instead of the tool-enabled chat.
+    """
+    message      = data.get("message", "")
+    email        = data.get("email", "")
+    name         = data.get("name", "")
+    history      = data.get("history", [])
+    career_focus = data.get("career_focus", "software engineering")
+    cognito_sub  = data.get("cognito_sub", "")
+    page_context = data.get("page_context", {}) or {}
+
+    logger.info(f"AI chat question from {name} ({email}): {message}")
+
+    # ── Fetch & cache user profile + knowledge context ────────────────────
+    user_db_ctx = ""
+    if cognito_sub:
+        cf_for_db = career_focus.replace(" ", "-").lower() if " " in career_focus else career_focus
+        user_db_ctx = await _build_ai_user_context(cognito_sub, cf_for_db)
+
+    # ── Build the context block prepended to the system prompt ────────────
+    context_lines: list = []
+    cf_display = career_focus.replace("-", " ").title() if career_focus else ""
+    if name:
+        context_lines.append(f"User: {name}")
+    if cf_display:
+        context_lines.append(f"Career focus: {cf_display}")
+    if user_db_ctx:
+        context_lines.append(user_db_ctx)
+
+    section = (page_context.get("section") or "").strip()
+    pdata   = page_context.get("data") or {}
+    section_labels = {
+        "profile":  "Profile — editing personal info, education, and work history",
+        "knowledge":"Knowledge Base — managing established skills, projects, and future learning goals",
+        "resume":   "Resume Builder — crafting a tailored resume for a target role",
+        "analyzer": "Job Analysis — analyzing how well the user fits a target job",
+        "account":  "Account — viewing billing info and feature usage",
+    }
+    if section:
+        context_lines.append(f"Current page: {section_labels.get(section, section)}")
+
+    if section == "resume":
+        mode = pdata.get("resumeMode", "")
+        job_title = pdata.get("targetJobTitle", "")
+        if mode:
+            context_lines.append(
+                "Resume mode: " + ("from existing resume" if mode == "existing"
+                                   else "built from knowledge base profile")
+            )
+        if job_title:
+            context_lines.append(f"Target role: {job_title}")
+    elif section == "analyzer":
+        job_title = pdata.get("targetJobTitle", "")
+        if job_title:
+            context_lines.append(f"Target role being analyzed: {job_title}")
+    elif section == "knowledge":
+        kt = pdata.get("knowledgeType", "")
+        if kt:
+            context_lines.append(f"Active knowledge tab: {kt} expertise")
+
+    user_context_block = ""
+    if context_lines:
+        user_context_block = (
+            "━━━ USER CONTEXT ━━━\n"
+            + "\n".join(context_lines)
+            + "\n\n"
+            "Use this context to personalize every reply:\n"
+            "• Generic career questions → draw on the user's career focus, background, skills, and projects above.\n"
+            "• Page-specific questions → use the Current page and its data above to give precise, relevant answers.\n"
+            "━━━━━━━━━━━━━━━━━━━\n\n"
+        )
+
+    chat = {"email": email, "career_focus": career_focus, "messages": None, "evaluation": None}
+
+    # ── Resume evaluation — dedicated handler, bypasses all tool calls ────────
+    if _is_resume_evaluation_query(message, page_context):
+        chat["evaluation"] = _resume_evaluation_messages(
+            message=message,
+            user_context_block=user_context_block,
+            resume_content=pdata.get("resumeContent", ""),
+            target_job=pdata.get("targetJobTitle", ""),
+            history=history,
+        )
+        return chat
+
+    messages = [
+        {
+            "role": "system",
+            "content": (
+                user_context_block
+                + "You are a professional and friendly career coach AI for Ambitology — "
+                "a trusted mentor who brings both expertise and genuine warmth to every interaction. "
+                "Always be encouraging, specific, and actionable.\n\n"
+                "FORMATTING RULES (always follow):\n"
+                "- Keep every reply under 50 words total.\n"
+                "- Never write a wall of text. Use short sentences.\n"
+                "- When listing steps or items, put each on its own line starting with ① ② ③ or • — never run them together.\n"
+                "- Separate distinct thoughts with a blank line.\n"
+                "- No unnecessary filler phrases like 'Great question!' or 'Of course!'.\n"
+                "- Never say you cannot see, access, or view any page, document, or resume. "
+                "If context is missing, ask the user to share the relevant details directly.\n\n"
+                "RESUME CRAFTING:\n"
+                "- User has a general or ambiguous resume request ('make my resume', 'build my resume', 'write a resume', 'help with my resume', 'I need a resume', 'create my resume') → use ask_resume_intent. Show option cards so user can choose their path.\n"
+                "- User explicitly wants to improve/polish/fix/enhance an existing resume they already have → use navigate_to_existing_resume.\n"
+                "- User explicitly wants to craft/create/generate a resume from their knowledge base or saved profile → use navigate_to_knowledge_base_resume.\n"
+                "- When in doubt between the two resume paths, always use ask_resume_intent — never guess.\n\n"
+                "PLAN PRICING:\n"
+                "- User asks about plans, pricing, cost, subscription, upgrade, feature access, usage limits, or how to unblock a feature → use show_pricing.\n"
+                "- Never answer pricing questions in plain text — always use the show_pricing tool.\n\n"
+                "PROJECT ANALYSIS FLOW (follow steps in order, never skip):\n"
+                "Trigger this flow when the user asks about ANY of the following:\n"
+                "• How to write project bullet points or project descriptions\n"
+                "• How to write or find technical skills for a project\n"
+                "• What tools to use or list for a project\n"
+                "• Popular skills, technologies, or technical keywords for a project\n"
+                "• What technologies or tools to write in the resume for a project\n"
+                "• Any question about resume content specific to a project (technologies, frameworks, skills, tools)\n"
+                "STEP 1 — Use ask_project_type tool (never ask as plain text).\n"
+                "STEP 2 — Use ask_project_status tool (never ask as plain text).\n"
+                "STEP 3 — Use matching navigation tool based on the user's card selections:\n"
+                "  Personal Project or Side Project + In Progress/Completed → navigate_to_established_personal_project\n"
+                "  Personal Project or Side Project + Planning Ahead → navigate_to_expanding_personal_project\n"
+                "  Work Project, Work Experience, or Research Project + In Progress/Completed → navigate_to_established_professional_project\n"
+                "  Work Project, Work Experience, or Research Project + Planning Ahead → navigate_to_expanding_professional_project\n"
+                "STEP 4 — Ask: 'Share a project URL or paste the project details.'\n"
+                "STEP 5 — User provides URL or details → use analyze_project tool.\n\n"
+                "Do NOT call a navigation tool before STEP 1 and STEP 2 are both answered."
+            )
+        },
+        *[{"role": m["role"], "content": m["content"]} for m in history],
+        {"role": "user", "content": message},
+    ]
+
+    chat["messages"] = messages
+    return chat
+
+
+async def _ai_chat_tool_result(tool_name: str, args: dict, chat: dict, llm) -> dict:
+    """Response for a tool call: structured action (project analysis runs inline)."""
+    email = chat["email"]
+    career_focus = chat["career_focus"]
+    reply = args.get("reply", "I can help you with that!")
+    logger.info(f"AI chat tool call {tool_name} for {email}: {reply}")
+
+    # Handle project analysis inline
+    if tool_name == "analyze_project":
+        project_details = args.get("project_details", "")
+        project_type = args.get("project_type", "personal_established")
+
+        # If it looks like a URL, try to fetch it
+        content = project_details
+        if project_details.strip().startswith("http"):
+            try:
+                from bs4 import BeautifulSoup
+
+                page_res = await http_client.fetch(project_details.strip(), timeout=10, headers={"User-Agent": "Mozilla/5.0"})
+                soup = BeautifulSoup(page_res.text, 'html.parser')
+                content = soup.get_text(separator=' ', strip=True)[:3000]
+            except Exception as fetch_err:
+                logger.warning(f"Failed to fetch project URL: {fetch_err}")
+                content = project_details
+
+        career_focus_label = career_focus.replace("-", " ").title() if career_focus else "software engineering"
+
+        if career_focus == 'ai-ml':
+            kw_sections = [
+                'AI Application & Product',
+                'Foundation Model & AI Research',
+                'MLOps & ML Platform',
+                'Data Engineering & Analytics',
+                'Infrastructure & Compute',
+            ]
+        else:
+            kw_sections = [
+                'Languages, Runtimes & Build Tooling',
+                'Client, UI & Product Experience',
+                'Backend Services & Distributed Systems',
+                'Data & Messaging Layer',
+                'Operating Systems & Networks',
+            ]
+        sections_str = ", ".join(f'"{s}"' for s in kw_sections)
+
+        industry_options = (
+            "AI & Machine Learning, Blockchain & Web3, Cloud Computing, "
+            "SaaS / Enterprise Software, Big Tech / Consumer Internet, FinTech, "
+            "Trading & Quant Finance, E-commerce & Marketplace, Cybersecurity, "
+            "Data & Analytics, Developer Tools, Healthcare & Insurance, Gaming, "
+            "Autonomous Vehicles & Robotics, Generative AI Platforms"
+        )
+        analysis_prompt = (
+            f"You are a technical resume expert helping a {career_focus_label} professional.\n\n"
+            f"Project information:\n{content[:2500]}\n\n"
+            "Analyze this project and generate professional resume content. "
+            "Think about how the project should be designed and implemented in the best case scenario.\n\n"
+            "Return a JSON object with exactly these keys:\n"
+            "- projectName: A concise, professional project name (3-6 words) that clearly "
+            "describes what this project does. No special characters.\n"
+            "- industrySector: The single best-fit industry sector from this exact list: "
+            f"{industry_options}. Choose the closest match.\n"
+            "- overview: One clear sentence describing what the project does and its main purpose.\n"
+            "- techAndTeamwork: One to two sentences about implementation approach, "
+            "technologies used, architecture decisions, and technical challenges solved. "
+            "If multiple sentences, separate with a newline character (\\n).\n"
+            "- achievement: One sentence with quantified outcomes — use estimated percentages "
+            "or realistic numbers if exact metrics are not available (e.g. 'reduced latency by ~40%', "
+            "'supports 10k+ concurrent users').\n"
+            f"- technologies: An object with exactly these section keys: {sections_str}. "
+            "Each section must contain 5–8 technology keywords (languages, platforms, cloud services, "
+            "databases) most relevant to this project AND popular for this career focus. "
+            "Total roughly 30 keywords across all sections.\n"
+            f"- frameworks: An object with the same section keys: {sections_str}. "
+            "Each section must contain 5–8 framework/tool keywords (frameworks, libraries, dev tools, "
+            "testing tools, CI/CD tools) most relevant to this project AND popular for this career focus. "
+            "Total roughly 30 keywords across all sections. Must not duplicate technologies entries.\n\n"
+            "Return only valid JSON with no extra text."
+        )
+
+        try:
+            analysis_response = await llm.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": "You are a technical resume expert. Return only valid JSON."},
+                    {"role": "user", "content": analysis_prompt}
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.4,
+            )
+            analysis_data = json.loads(analysis_response.choices[0].message.content)
+            logger.info(f"Project analysis complete for {email}, project_type={project_type}")
+            return {
+                "status": "success",
+                "reply": "I've analyzed your project and prepared updates for each field. Which fields would you like to fill in?",
+                "action": {
+                    "type": "update_project_description",
+                    "data": {
+                        "projectType": project_type,
+                        "projectSource": project_details[:2000],
+                        "projectName": analysis_data.get("projectName", ""),
+                        "industrySector": analysis_data.get("industrySector", ""),
+                        "overview": analysis_data.get("overview", ""),
+                        "techAndTeamwork": analysis_data.get("techAndTeamwork", ""),
+                        "achievement": analysis_data.get("achievement", ""),
+                        "technologies": analysis_data.get("technologies", {}),
+                        "frameworks": analysis_data.get("frameworks", {})
+                    }
+                }
+            }
+        except Exception as analysis_err:
+            logger.error(f"Project analysis failed: {analysis_err}")
+            return {
+                "status": "success",
+                "reply": "I had trouble analyzing the project details. Could you provide more information or try a different URL?",
+            }
+
+    return {"status": "success", "reply": reply, "action": {"type": tool_name}}
+
+
+# Card actions inferred from plain replies, compiled once at import
+PROJECT_TYPE_PATTERNS = [re.compile(p) for p in (
+    r'what (kind|type) of project',
+    r'is (this|it) (a )?(personal|professional)',
+    r'personal.{0,20}(or|vs|versus).{0,20}(professional|work experience)',
+    r'personal project.{0,60}work experience',
+    r'personal.{0,40}work.{0,40}research',
+)]
+PROJECT_STATUS_PATTERNS = [re.compile(p) for p in (
+    r'status of (this |the )?project',
+    r'(currently in progress|already completed|planned for the future)',
+    r'(in progress|ongoing).{0,60}(completed|finished).{0,60}(plan|future)',
+    r'(completed|finished).{0,60}(in progress|ongoing).{0,60}(plan|future)',
+    r'is (this |the )?project (currently|already|still|done)',
+    r"what.{0,20}(status|stage|state).{0,20}(project|it)",
+)]
+CHOICE_LINE_RE = re.compile(r'^(?:\d+[.)]\s*|[①②③④⑤⑥⑦⑧⑨⑩]\s*)(.+)$')
+
+
+def _ai_chat_text_result(reply: str) -> dict:
+    """Response for a plain text reply; infers card actions from the wording."""
+    rl = reply.lower()
+
+    # ── Semantic: project TYPE question ──
+    if any(p.search(rl) for p in PROJECT_TYPE_PATTERNS):
+        return {"status": "success", "reply": reply, "action": {"type": "ask_project_type"}}
+
+    # ── Semantic: project STATUS question ──
+    if any(p.search(rl) for p in PROJECT_STATUS_PATTERNS):
+        return {"status": "success", "reply": reply, "action": {"type": "ask_project_status"}}
+
+    # ── Auto-detect numbered/bulleted choice lists ──
+    lines = [l.strip() for l in reply.split('\n') if l.strip()]
+    numbered = []
+    for line in lines:
+        m = CHOICE_LINE_RE.match(line)
+        if m:
+            numbered.append(m.group(1).strip())
+    if 2 <= len(numbered) <= 5 and all(len(item) <= 45 for item in numbered):
+        return {"status": "success", "reply": reply, "action": {"type": "text_choices", "choices": numbered}}
+
+    return {"status": "success", "reply": reply}
+
+
+async def _stream_ai_chat(chat: dict, llm):
+    """
+    Server-Sent Events for /ai-chat:
+      event: token  data: {"text": "..."}   — reply text as it is generated
+      event: done   data: {...}             — the same object the JSON mode returns
+                                              (tool-call actions included)
+      event: error  data: {"status": "error", "detail": "..."}
+    """
+    started = time.perf_counter()
+    ttft_ms = None
+    text_parts: list = []
+    tool_name = None
+    tool_args: list = []
+
+    try:
+        if chat["evaluation"] is not None:
+            stream = await llm.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=chat["evaluation"],
+                temperature=0.35,
+                stream=True,
+            )
+        else:
+            stream = await llm.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=chat["messages"],
+                tools=RESUME_TOOLS,
+                tool_choice="auto",
+                stream=True,
+            )
+
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.tool_calls:
+                # Only the first tool call is acted on, as in the JSON mode
+                for call in delta.tool_calls:
+                    if call.index != 0 or call.function is None:
+                        continue
+                    if call.function.name:
+                        tool_name = call.function.name
+                    if call.function.arguments:
+                        tool_args.append(call.function.arguments)
+                continue
+            if delta.content:
+                if ttft_ms is None:
+                    ttft_ms = round((time.perf_counter() - started) * 1000, 1)
+                text_parts.append(delta.content)
+                yield sse_event("token", {"text": delta.content})
+
+        reply = "".join(text_parts)
+        if chat["evaluation"] is not None:
+            result = {"status": "success", "reply": reply or "I'd be happy to review your resume in detail."}
+        elif tool_name:
+            result = await _ai_chat_tool_result(tool_name, json.loads("".join(tool_args) or "{}"), chat, llm)
+        else:
+            logger.info(f"AI chat response to {chat['email']}: {reply}")
+            result = _ai_chat_text_result(reply)
+        yield sse_event("done", result)
+
+    except Exception as e:
+        logger.error(f"Error in ai_chat stream: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
+        yield sse_event("error", {"status": "error", "detail": f"Error processing chat: {str(e)}"})
+
+    finally:
+        logger.info("AI chat stream finished", extra={
+            "ttft_ms": ttft_ms,
+            "total_ms": round((time.perf_counter() - started) * 1000, 1),
+            "tool_call": tool_name,
+        })
+
+
+@router.post("/ai-chat")
+async def ai_chat(request: Request, llm=Depends(llm_client)):
+    """
+    Career coach chat. With ``"stream": true`` in the body (or an
+    ``Accept: text/event-stream`` header) the reply is streamed as Server-Sent
+    Events (see _stream_ai_chat); otherwise the full reply is returned as JSON.
+    """
+    try:
+        data = await request.json()
+        chat = await _prepare_ai_chat(data)
+
+        if wants_event_stream(request, data):
+            return StreamingResponse(_stream_ai_chat(chat, llm), media_type="text/event-stream", headers=SSE_HEADERS)
+
+        if chat["evaluation"] is not None:
+            return await _handle_resume_evaluation(chat["evaluation"], llm)
+
+        response = await llm.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=chat["messages"],
+            tools=RESUME_TOOLS,
+            tool_choice="auto",
+        )
+
+        choice = response.choices[0]
+
+        if choice.finish_reason == "tool_calls":
+            tool_name = choice.message.tool_calls[0].function.name
+            args = json.loads(choice.message.tool_calls[0].function.arguments)
+            return await _ai_chat_tool_result(tool_name, args, chat, llm)
+
+        reply = choice.message.content
+        logger.info(f"AI chat response to {chat['email']}: {reply}")
+        return _ai_chat_text_result(reply)
+
+    except Exception as e:
+        logger.error(f"Error in ai_chat: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"Error processing chat: {str(e)}")
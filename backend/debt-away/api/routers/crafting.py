@@ -0,0 +1,901 @@
+"""
+Resume crafting from the knowledge base or an existing resume, auto-fill and project bullet points.
+"""
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from aws_lambda_powertools import Logger
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+import resume_crafting
+import resume_store
+import section_stream
+import usage_quota
+from resources import llm_client
+from usage_quota import consume_quota
+from routers.shared import SSE_HEADERS, extract_text_from_resume, fetch_web_page_content, sse_event, wants_event_stream
+
+logger = Logger()
+router = APIRouter()
+RESOURCES = ('dynamodb', 'openai', 'documents', 'html')
+
+
+class CraftResumeEducation(BaseModel):
+    college_name: str
+    degree: str
+    major: Optional[str] = None
+    coursework: Optional[List[str]] = []
+    location: Optional[str] = None
+    start_date: str
+    end_date: str
+
+
+class CraftResumeProfessionalHistory(BaseModel):
+    company_name: str
+    job_title: str
+    location: Optional[str] = None
+    start_date: str
+    end_date: str
+
+
+class CraftResumeProfessionalAchievement(BaseModel):
+    type: str
+    value: str
+
+
+class CraftResumeProjectTechContent(BaseModel):
+    content: str  # Limited to 250 characters
+
+
+class CraftResumeProject(BaseModel):
+    project_name: str
+    location: Optional[str] = None
+    start_date: str
+    end_date: str
+    overview_content: str  # Limited to 250 characters
+    tech_content: List[CraftResumeProjectTechContent]  # Up to 2 items, each 250 chars
+    achievement_content: str  # Limited to 250 characters
+    technologies: List[str]  # Technical keywords
+
+
+class CraftResumeProfessionalProject(BaseModel):
+    project_name: str
+    work_experience: str
+    location: Optional[str] = None
+    overview_content: str  # Limited to 250 characters
+    tech_content: List[CraftResumeProjectTechContent]  # Up to 2 items, each 250 chars
+    achievement_content: str  # Limited to 250 characters
+    technologies: List[str]  # Technical keywords
+
+
+class CraftResumeTechnicalSkills(BaseModel):
+    Languages: List[str] = []
+    Frameworks: List[str] = []
+    Tools: List[str] = []
+
+
+class CraftResumeResponse(BaseModel):
+    full_name: str
+    email_address: str
+    phone_number: Optional[str] = None
+    home_address: Optional[str] = None
+    links: Optional[List[str]] = []
+    education_history: List[CraftResumeEducation]
+    professional_history: List[CraftResumeProfessionalHistory]
+    professional_achievement: Optional[List[CraftResumeProfessionalAchievement]] = []
+    personal_projects: List[CraftResumeProject]
+    professional_projects: List[CraftResumeProfessionalProject]
+    technical_skills: CraftResumeTechnicalSkills
+
+
+class CraftResumeFacts(BaseModel):
+    full_name: str
+    email_address: str
+    phone_number: Optional[str] = None
+    home_address: Optional[str] = None
+    links: Optional[List[str]] = []
+    education_history: List[CraftResumeEducation]
+    professional_history: List[CraftResumeProfessionalHistory]
+    professional_achievement: Optional[List[CraftResumeProfessionalAchievement]] = []
+
+
+class CraftResumeProjects(BaseModel):
+    personal_projects: List[CraftResumeProject]
+    professional_projects: List[CraftResumeProfessionalProject]
+
+
+class CraftResumeProjectContent(BaseModel):
+    overview_content: str  # Limited to 250 characters
+    tech_content: List[CraftResumeProjectTechContent]  # Up to 2 items, each 250 chars
+    achievement_content: str  # Limited to 250 characters
+    technologies: List[str]
+
+
+class CraftResumeProjectContents(BaseModel):
+    personal_projects: List[CraftResumeProjectContent]  # one per input project, same order
+    professional_projects: List[CraftResumeProjectContent]
+
+
+class CraftResumeSkills(BaseModel):
+    technical_skills: CraftResumeTechnicalSkills
+
+
+class AutoFillDegree(BaseModel):
+    degree: str
+    major: str
+    startMonth: str
+    startYear: str
+    endMonth: str
+    endYear: str
+    coursework: str
+
+
+class AutoFillCollege(BaseModel):
+    collegeName: str
+    location: str
+    degrees: List[AutoFillDegree]
+
+
+class AutoFillCompany(BaseModel):
+    companyName: str
+    jobTitle: str
+    startMonth: str
+    startYear: str
+    endMonth: str
+    endYear: str
+    isPresent: bool
+    location: str
+
+
+class AutoFillAchievement(BaseModel):
+    type: str
+    value: str
+
+
+class AutoFillProjectDescription(BaseModel):
+    overview: str
+    techAndTeamwork: str
+    achievement: str
+
+
+class AutoFillPersonalProject(BaseModel):
+    projectName: str
+    projectDescription: AutoFillProjectDescription
+    projectStartMonth: str
+    projectStartYear: str
+    projectEndMonth: str
+    projectEndYear: str
+    location: str
+    selectedTechnologies: List[str]
+    selectedFrameworks: List[str]
+    customTechnologies: List[str]
+    customFrameworks: List[str]
+
+
+class AutoFillProfessionalProject(BaseModel):
+    projectName: str
+    projectDescription: AutoFillProjectDescription
+    selectedWorkExperience: str
+    projectStartMonth: str
+    projectStartYear: str
+    projectEndMonth: str
+    projectEndYear: str
+    selectedTechnologies: List[str]
+    selectedFrameworks: List[str]
+    customTechnologies: List[str]
+    customFrameworks: List[str]
+
+
+class AutoFillResumeResult(BaseModel):
+    career_focus: str
+    firstName: str
+    middleName: str
+    lastName: str
+    email: str
+    phone: str
+    addressStreet: str
+    addressState: str
+    addressZip: str
+    personalWebsite: str
+    linkedin: str
+    education: List[AutoFillCollege]
+    companies: List[AutoFillCompany]
+    achievements: List[AutoFillAchievement]
+    personal_projects: List[AutoFillPersonalProject]
+    professional_projects: List[AutoFillProfessionalProject]
+    technical_skill_items: List[str]
+    custom_technical_items: List[str]
+
+
+class ProjectBulletPoints(BaseModel):
+    overview: str          # ~13 words: project purpose
+    showcase1: str         # ~13 words: key tools/architecture used
+    showcase2: Optional[str] = None  # ~13 words: second feature (omit if only 3 bullets)
+    achievement: str       # ~13 words: quantitative outcome
+
+
+# ── Resume crafting pipeline ─────────────────────────────────────────────────
+
+CRAFT_MODEL = "gpt-4o-mini"
+
+
+CRAFT_SYSTEM_PROMPT = (
+    "You are an expert resume writer specializing in creating ATS-friendly, professional resumes "
+    "that highlight technical skills and project achievements. Always follow the instructions "
+    "precisely and ensure all character limits are respected."
+)
+
+
+CRAFT_CONTENT_RULES = """   - All content fields (overview_content, tech_content items, achievement_content) must be limited to 250 characters including spaces
+   - Use professional resume-style syntax and tone
+   - Prioritize matching target job description requirements throughout
+   - If a TARGET INDUSTRY SECTOR is specified, surface and prioritize technical keywords, tools, and project descriptions most relevant to that industry — this overrides generic keyword selection"""
+
+
+class CraftCall(NamedTuple):
+    """One LLM call of the crafting pipeline."""
+    text_format: type
+    prompt: str
+    # Parsed output -> CraftResumeResponse members; defaults to model_dump()
+    merge: Optional[Callable[[Any], Dict[str, Any]]] = None
+    # Output keys are CraftResumeResponse members, so they can be streamed as they close
+    streams_members: bool = False
+    # Awaited with the parsed output, e.g. to store it
+    on_parsed: Optional[Callable[[Any], Awaitable[None]]] = None
+
+
+async def _run_craft_call(call: CraftCall, llm,
+                          emit: Optional[Callable[[str, Any], None]] = None) -> Dict[str, Any]:
+    craft_input = [
+        {"role": "system", "content": CRAFT_SYSTEM_PROMPT},
+        {"role": "user", "content": call.prompt},
+    ]
+    merge = call.merge or (lambda parsed: parsed.model_dump())
+    if emit is None:
+        response = await llm.responses.parse(
+            model=CRAFT_MODEL,
+            input=craft_input,
+            text_format=call.text_format,
+        )
+        if call.on_parsed is not None:
+            await call.on_parsed(response.output_parsed)
+        return merge(response.output_parsed)
+
+    scanner = section_stream.TopLevelMembers() if call.streams_members else None
+    async with llm.responses.stream(
+        model=CRAFT_MODEL,
+        input=craft_input,
+        text_format=call.text_format,
+    ) as stream:
+        async for event in stream:
+            if scanner is not None and event.type == "response.output_text.delta":
+                for key, value in scanner.feed(event.delta):
+                    emit(key, value)
+        final_response = await stream.get_final_response()
+    if call.on_parsed is not None:
+        await call.on_parsed(final_response.output_parsed)
+    members = merge(final_response.output_parsed)
+    for key, value in members.items():
+        emit(key, value)
+    return members
+
+
+async def _craft_resume(local: Dict[str, Any], calls: List[CraftCall], llm) -> CraftResumeResponse:
+    """Run the calls concurrently and merge them with the locally assembled members."""
+    started = time.perf_counter()
+    results = await asyncio.gather(*(_run_craft_call(call, llm) for call in calls))
+    merged = dict(local)
+    for members in results:
+        merged.update(members)
+    resume_crafting.dedupe_crafted_technologies(merged)
+    logger.info("Resume crafted", extra={"llm_calls": len(calls),
+                                         "duration_ms": round((time.perf_counter() - started) * 1000, 1)})
+    return CraftResumeResponse(**merged)
+
+
+async def _stream_crafted_resume(local: Dict[str, Any], calls: List[CraftCall], llm, endpoint: str):
+    """
+    Server-Sent Events for the craft endpoints:
+      event: section  data: {"section": "header", "data": {...}}  — each section
+                      (header, education, professional_history, projects, skills)
+                      as soon as it is assembled locally or its call has produced it
+                      (projects also wait for the skills, see dedupe_crafted_technologies)
+      event: done     data: {"success": true, "data": {...}}      — the validated
+                      CraftResumeResponse, same as the JSON mode
+      event: error    data: {"success": false, "error_code": "OPENAI_ERROR", ...}
+    """
+    started = time.perf_counter()
+    assembler = section_stream.SectionAssembler()
+    members: asyncio.Queue = asyncio.Queue()
+
+    def section_event(name: str, data: dict) -> str:
+        logger.info(f"{endpoint}: section '{name}' ready",
+                    extra={"elapsed_ms": round((time.perf_counter() - started) * 1000, 1)})
+        return sse_event("section", {"section": name, "data": data})
+
+    def emit(key: str, value: Any) -> None:
+        members.put_nowait((key, value))
+
+    for key, value in local.items():
+        emit(key, value)
+    calls_done = asyncio.gather(*(_run_craft_call(call, llm, emit) for call in calls))
+    # Project technologies are deduplicated against the skills, so projects wait for them
+    held: Dict[str, Any] = {}
+
+    def add_member(key: str, value: Any) -> List[Tuple[str, Dict[str, Any]]]:
+        ready = [] if key in resume_crafting.PROJECT_MEMBERS else assembler.add(key, value)
+        if key in resume_crafting.PROJECT_MEMBERS or key == 'technical_skills':
+            held[key] = value
+            if len(held) == len(resume_crafting.PROJECT_MEMBERS) + 1:
+                resume_crafting.dedupe_crafted_technologies(held)
+                for project_key in resume_crafting.PROJECT_MEMBERS:
+                    ready += assembler.add(project_key, held[project_key])
+        return ready
+
+    try:
+        while True:
+            next_member = asyncio.ensure_future(members.get())
+            await asyncio.wait({next_member, calls_done}, return_when=asyncio.FIRST_COMPLETED)
+            if not next_member.done():
+                next_member.cancel()
+                break
+            for name, data in add_member(*next_member.result()):
+                yield section_event(name, data)
+
+        merged = dict(local)
+        for result in calls_done.result():
+            merged.update(result)
+        resume_crafting.dedupe_crafted_technologies(merged)
+        crafted_resume = CraftResumeResponse(**merged)
+        data = crafted_resume.model_dump()
+        for name, section in assembler.remaining(data):
+            yield section_event(name, section)
+        logger.info(f"Successfully crafted resume (streamed) for candidate: {crafted_resume.full_name}")
+        yield sse_event("done", {"success": True, "data": data})
+
+    except Exception as openai_error:
+        logger.error(f"OpenAI error in {endpoint} stream: {str(openai_error)}")
+        yield sse_event("error", {
+            "success": False,
+            "error_code": "OPENAI_ERROR",
+            "message": f"Failed to craft resume: {str(openai_error)}",
+        })
+    finally:
+        calls_done.cancel()
+
+
+@router.post("/craft_resume_from_knowledge_base")
+async def craft_resume_from_knowledge_base(request: Request, llm=Depends(llm_client)):
+    """
+    Craft a resume from knowledge base data using OpenAI.
+    
+    Request body should contain:
+    - basic_info: Profile information (firstName, lastName, email, phone, address, etc.)
+    - target_company_type: Industry sector (if provided)
+    - target_job_position: Job position details (if provided, includes job description)
+    - personal_projects: List of selected personal projects
+    - professional_projects: List of selected professional projects
+    - future_personal_projects: List of selected future personal projects
+    - future_professional_projects: List of selected future professional projects
+    - skills: Combined technical skills (from established and future)
+    - stream: optional, true to receive sections as Server-Sent Events
+    
+    Returns structured resume data ready for template population. In streaming
+    mode (see _stream_crafted_resume) each section is sent as soon as it is done.
+    """
+    try:
+        logger.info("Received craft_resume_from_knowledge_base request")
+        
+        body = await request.json()
+        basic_info = body.get('basic_info', {})
+        target_company_type = body.get('target_company_type')
+        target_job_position = body.get('target_job_position')
+        personal_projects = body.get('personal_projects', [])
+        professional_projects = body.get('professional_projects', [])
+        future_personal_projects = body.get('future_personal_projects', [])
+        future_professional_projects = body.get('future_professional_projects', [])
+        skills = body.get('skills', [])
+        education = body.get('education', [])
+        professional_history = body.get('professional_history', [])
+        achievements = body.get('achievements', [])
+        cognito_sub = body.get('cognito_sub')
+
+        if cognito_sub:
+            # Check plan limit and increment craft_count in one atomic call
+            quota = await consume_quota(cognito_sub, usage_quota.CRAFT)
+            if not quota.allowed:
+                return {"success": False, "error_code": "CRAFT_LIMIT_EXCEEDED", "message": "Free plan craft limit reached."}
+
+        # Build the prompt for OpenAI
+        job_context = ""
+        if target_job_position:
+            if isinstance(target_job_position, dict):
+                job_description = target_job_position.get('description', '')
+                job_title = target_job_position.get('title', '')
+                job_company = target_job_position.get('company', '')
+                job_context = f"""TARGET JOB POSITION:
+- Job Title: {job_title}
+- Company: {job_company}
+- Job Description: {job_description}
+"""
+            else:
+                job_context = f"TARGET JOB POSITION: {target_job_position}\n"
+        if target_company_type:
+            job_context += f"TARGET INDUSTRY SECTOR: {target_company_type}\n"
+
+        # Build goal context sentence for the prompt header
+        if target_job_position and target_company_type:
+            goal_context = f'The resume will be tailored for the "{target_company_type}" industry sector and the specific job position described below.'
+        elif target_company_type:
+            goal_context = f'The resume will be tailored specifically for the "{target_company_type}" industry sector, emphasizing technical keywords, frameworks, and projects most valued in that field.'
+        elif target_job_position:
+            goal_context = 'The resume will be tailored for the specific job position described below.'
+        else:
+            goal_context = "The resume will professionally showcase the candidate's technical skills and projects."
+
+        # Build optional industry-sector instruction block
+        industry_instruction = ""
+        if target_company_type:
+            industry_instruction = f"""
+INDUSTRY SECTOR FOCUS — {target_company_type}:
+- Prioritize and front-load technical keywords, frameworks, tools, and architectural patterns that are most in-demand for the "{target_company_type}" industry.
+- In tech_content for each project, highlight the technologies and design patterns that resonate most with {target_company_type} companies and hiring managers.
+- In the technical_skills section, surface and group skills that are most valued by {target_company_type} employers; reorder within each category to lead with the most sector-relevant items.
+- In overview_content and achievement_content, use terminology and framing familiar to {target_company_type} hiring managers to maximize ATS relevance.
+"""
+
+        # Combine all projects
+        all_personal_projects = personal_projects + future_personal_projects
+        all_professional_projects = professional_projects + future_professional_projects
+
+        # Profile data is copied as it is, so it is assembled here; only the
+        # project content and the skills are written by the model, in
+        # concurrent calls (see resume_crafting)
+        local = {
+            **resume_crafting.header(basic_info),
+            'education_history': resume_crafting.education_history(education),
+            'professional_history': resume_crafting.professional_history(professional_history),
+            'professional_achievement': resume_crafting.achievements(achievements),
+        }
+
+        def merge_projects(parsed: CraftResumeProjectContents) -> Dict[str, Any]:
+            contents = parsed.model_dump()
+            personal = resume_crafting.merge_project_content(
+                all_personal_projects, contents['personal_projects'])
+            professional = resume_crafting.merge_project_content(
+                all_professional_projects, contents['professional_projects'], professional=True)
+            return {'personal_projects': personal, 'professional_projects': professional}
+
+        projects_prompt = f"""
+You are an expert resume writer. Write the project content of a professional resume for a candidate. {goal_context}
+
+{job_context}{industry_instruction}
+PERSONAL PROJECTS (from Established Expertise and Expanding Knowledge Base):
+{json.dumps([resume_crafting.project_brief(p) for p in all_personal_projects], indent=2)}
+
+PROFESSIONAL PROJECTS (from Established Expertise and Expanding Knowledge Base):
+{json.dumps([resume_crafting.project_brief(p) for p in all_professional_projects], indent=2)}
+
+INSTRUCTIONS:
+1. Return exactly one personal_projects item per personal project and one professional_projects item per professional project, in the order given above.
+2. For each project:
+   - Create overview_content: Transform the project overview into a high-level professional resume description (max 250 characters)
+   - Create tech_content: Create 1-2 items (each max 250 characters) showcasing technologies and tools used for the most important functionalities. Prioritize:
+     * Selected technologies and frameworks from the project input
+     * Technologies that match target job description requirements
+     * If content exceeds 250 chars, split into two items (max 2 items total)
+   - Create achievement_content: Describe technical performance improvements first, then sales/functionality improvements if applicable. Match both user input achievements and job description expectations (max 250 characters)
+   - Create technologies list: Include remaining technologies/frameworks/tools not mentioned in tech_content, prioritizing those matching target job requirements
+3. IMPORTANT RULES:
+{CRAFT_CONTENT_RULES}
+   - No duplicate technical keywords should appear across personal and professional projects
+"""
+
+        skills_prompt = f"""
+You are an expert resume writer. Organize the technical skills section of a professional resume for a candidate. {goal_context}
+
+{job_context}{industry_instruction}
+TECHNICAL SKILLS (from Established Expertise and Expanding Knowledge Base):
+{json.dumps(skills, indent=2)}
+
+INSTRUCTIONS:
+1. Organize the skills into the categories "Languages", "Frameworks" and "Tools".
+2. Prioritize skills that match the target job description technical keywords; if a TARGET INDUSTRY SECTOR is specified, reorder within each category to lead with the most sector-relevant skills.
+"""
+
+        calls = [CraftCall(CraftResumeSkills, skills_prompt)]
+        if all_personal_projects or all_professional_projects:
+            calls.append(CraftCall(CraftResumeProjectContents, projects_prompt, merge=merge_projects))
+        else:
+            local.update(personal_projects=[], professional_projects=[])
+
+        if wants_event_stream(request, body):
+            logger.info("Streaming crafted resume sections...")
+            return StreamingResponse(
+                _stream_crafted_resume(local, calls, llm, "craft_resume_from_knowledge_base"),
+                media_type="text/event-stream",
+                headers=SSE_HEADERS,
+            )
+
+        logger.info("Calling OpenAI to craft resume...")
+        
+        try:
+            crafted_resume = await _craft_resume(local, calls, llm)
+            
+            logger.info(f"Successfully crafted resume for candidate: {crafted_resume.full_name}")
+            
+            # Convert Pydantic model to dict for JSON response
+            return {
+                "success": True,
+                "data": crafted_resume.model_dump()
+            }
+            
+        except Exception as openai_error:
+            logger.error(f"OpenAI error in craft_resume_from_knowledge_base: {str(openai_error)}")
+            return {
+                "success": False,
+                "error_code": "OPENAI_ERROR",
+                "message": f"Failed to craft resume: {str(openai_error)}"
+            }
+        
+    except HTTPException as http_err:
+        logger.error(f"HTTP error in craft_resume_from_knowledge_base: {http_err.status_code} - {http_err.detail}")
+        raise
+    except Exception as e:
+        import traceback
+        error_traceback = traceback.format_exc()
+        logger.error(f"Unexpected error in craft_resume_from_knowledge_base: {str(e)}")
+        logger.error(f"Error type: {type(e).__name__}")
+        logger.error(f"Full traceback: {error_traceback}")
+        return {
+            "success": False,
+            "error_code": "INTERNAL_ERROR",
+            "message": f"Internal server error: {str(e)}"
+        }
+
+
+@router.post("/craft_resume_from_existing_resume")
+async def craft_resume_from_existing_resume(
+    request: Request,
+    resume_file: UploadFile = File(...),
+    form_data: str = Form(...),
+    llm=Depends(llm_client)
+):
+    """
+    Craft a resume from an uploaded existing resume file using OpenAI.
+
+    Multipart form fields:
+    - resume_file: uploaded PDF / DOC / DOCX resume
+    - form_data: JSON string containing:
+        - cognito_sub: user identifier (for usage tracking)
+        - target_job_position: dict with keys title, company, description, skill_keywords
+                               (or None if industry sector only)
+        - target_company_type: industry sector string (or None)
+        - stream: optional, true to receive sections as Server-Sent Events
+
+    Returns the same CraftResumeResponse structure as craft_resume_from_knowledge_base
+    so the frontend can reuse processCraftedResumeData unchanged. In streaming
+    mode (see _stream_crafted_resume) each section is sent as soon as it is done.
+    """
+    try:
+        logger.info("Received craft_resume_from_existing_resume request")
+
+        # ── Parse JSON form_data ──────────────────────────────────────────────
+        try:
+            body = json.loads(form_data)
+        except Exception:
+            raise HTTPException(status_code=400, detail="Invalid form_data JSON")
+
+        cognito_sub = body.get("cognito_sub")
+        target_job_position = body.get("target_job_position")   # dict or None
+        target_company_type = body.get("target_company_type")   # str or None
+
+        # ── Usage / plan gate (same logic as knowledge-base endpoint) ─────────
+        if cognito_sub:
+            quota = await consume_quota(cognito_sub, usage_quota.CRAFT)
+            if not quota.allowed:
+                return {
+                    "success": False,
+                    "error_code": "CRAFT_LIMIT_EXCEEDED",
+                    "message": "Free plan craft limit reached.",
+                }
+
+        # ── Extract text from uploaded resume ─────────────────────────────────
+        file_content = await resume_file.read()
+        filename = resume_file.filename or "resume"
+        logger.info(f"Extracting text from uploaded resume: {filename}")
+
+        resume = await resume_store.open_resume(cognito_sub, file_content, filename, extract_text_from_resume)
+        resume_text = resume.text
+
+        if not resume_text or len(resume_text.strip()) < 50:
+            return {
+                "success": False,
+                "error_code": "EXTRACTION_FAILED",
+                "message": "Could not extract meaningful text from the uploaded resume. Please ensure the file is not scanned/image-only.",
+            }
+
+        # Truncate to avoid hitting token limits (keep first 6000 chars)
+        if len(resume_text) > 6000:
+            resume_text = resume_text[:6000] + "\n... [resume content truncated]"
+
+        # ── Build job / industry context ──────────────────────────────────────
+        job_context = ""
+        if target_job_position and isinstance(target_job_position, dict):
+            job_title = target_job_position.get("title", "")
+            job_company = target_job_position.get("company", "")
+            job_description = target_job_position.get("description", "")
+            skill_keywords = target_job_position.get("skill_keywords", [])
+            job_context = f"""TARGET JOB POSITION:
+- Job Title: {job_title}
+- Company: {job_company}
+- Job Description: {job_description}
+- Key Skill Keywords: {", ".join(skill_keywords) if skill_keywords else "N/A"}
+"""
+        elif target_job_position and isinstance(target_job_position, str):
+            job_context = f"TARGET JOB POSITION: {target_job_position}\n"
+
+        if target_company_type:
+            job_context += f"TARGET INDUSTRY SECTOR: {target_company_type}\n"
+
+        # ── Build OpenAI prompts ──────────────────────────────────────────────
+        # Facts are extracted as they are while projects and skills are
+        # enriched, each in its own concurrent call
+        facts_prompt = f"""You are an expert resume parser. Extract the candidate's factual resume information exactly as written.
+
+EXISTING RESUME CONTENT:
+{resume_text}
+
+INSTRUCTIONS:
+1. Extract full_name, email_address, phone_number, home_address, and any profile links (LinkedIn, GitHub, personal site, etc.) from the resume. Return links as a list of strings.
+2. Extract education_history: all education entries ordered most-recent first. Each entry needs college_name, degree, major (if available), coursework (list, if mentioned), location (if available), start_date, end_date.
+3. Extract professional_history: all work experience ordered most-recent first. Each entry needs company_name, job_title, location (if available), start_date, end_date.
+4. Extract professional_achievement: any awards, certifications, publications, or notable achievements. Each item has a "type" (e.g. "Award", "Certification") and "value" (the description).
+5. Do not rewrite or enrich anything. If a date is unknown or not mentioned, use an empty string.
+"""
+
+        projects_prompt = f"""You are an expert resume writer and career coach. Extract the candidate's projects from the existing resume and enrich them to better align with the target job position and/or industry sector described below.
+
+{job_context}
+
+EXISTING RESUME CONTENT:
+{resume_text}
+
+INSTRUCTIONS:
+1. Process personal_projects: Extract all personal/side projects from the resume. For each project:
+   - Keep project_name, location (if available), start_date, end_date.
+   - Create overview_content: a high-level professional description ENHANCED to highlight relevance to the target job/industry (max 250 characters).
+   - Create tech_content: 1–2 items (each max 250 characters) showcasing the most impactful technologies and methodologies used. Prioritize skills that match the target job's requirements. Split into two items if content exceeds 250 characters.
+   - Create achievement_content: quantified or impact-focused achievement statement, ENHANCED toward the target job/industry expectations (max 250 characters).
+   - Create technologies: remaining relevant tech keywords not already covered in tech_content, prioritizing those matching target job skills.
+2. Process professional_projects: Extract all work-related projects from the professional experience section. Follow the same enrichment rules as personal_projects, and additionally set work_experience to "CompanyName - JobTitle" so it maps back to the correct professional history entry.
+3. IMPORTANT RULES:
+{CRAFT_CONTENT_RULES}
+   - No duplicate technical keywords across personal_projects and professional_projects.
+   - If the resume does not have personal projects or professional projects, return empty lists.
+   - If a date is unknown or not mentioned, use an empty string.
+"""
+
+        skills_prompt = f"""You are an expert resume writer and career coach. Organize the candidate's technical skills from the existing resume for the target job position and/or industry sector described below.
+
+{job_context}
+
+EXISTING RESUME CONTENT:
+{resume_text}
+
+INSTRUCTIONS:
+1. Organize ALL technical skills from the resume into the categories "Languages", "Frameworks" and "Tools".
+2. Enrich with skills that are closely related to the target job description or industry sector (only include skills the candidate demonstrably has or has used — do not fabricate).
+3. If a TARGET INDUSTRY SECTOR is provided, reorder within each category to lead with the most sector-relevant skills.
+"""
+
+        async def store_facts(parsed: CraftResumeFacts) -> None:
+            await resume_store.save_parse(resume, resume_store.PARSE_CRAFT_FACTS, parsed)
+
+        calls = [
+            CraftCall(CraftResumeProjects, projects_prompt),
+            CraftCall(CraftResumeSkills, skills_prompt),
+        ]
+        # Factual sections come from an earlier parse of the same file when there is one
+        local: Dict[str, Any] = {}
+        auto_fill = resume_store.stored_parse(resume, resume_store.PARSE_AUTO_FILL, AutoFillResumeResult)
+        craft_facts = resume_store.stored_parse(resume, resume_store.PARSE_CRAFT_FACTS, CraftResumeFacts)
+        if auto_fill is not None:
+            profile = auto_fill.model_dump()
+            profile['links'] = [{'name': 'Personal Website', 'url': profile['personalWebsite']},
+                                {'name': 'LinkedIn', 'url': profile['linkedin']}]
+            local = {
+                **resume_crafting.header(profile),
+                'education_history': resume_crafting.education_history(profile['education']),
+                'professional_history': resume_crafting.professional_history(profile['companies']),
+                'professional_achievement': resume_crafting.achievements(profile['achievements']),
+            }
+        elif craft_facts is not None:
+            local = craft_facts.model_dump()
+        else:
+            calls.insert(0, CraftCall(CraftResumeFacts, facts_prompt, streams_members=True, on_parsed=store_facts))
+
+        if wants_event_stream(request, body):
+            logger.info("Streaming crafted resume sections from existing resume...")
+            return StreamingResponse(
+                _stream_crafted_resume(local, calls, llm, "craft_resume_from_existing_resume"),
+                media_type="text/event-stream",
+                headers=SSE_HEADERS,
+            )
+
+        logger.info("Calling OpenAI to craft resume from existing resume...")
+
+        try:
+            crafted_resume = await _craft_resume(local, calls, llm)
+            logger.info(f"Successfully crafted resume from existing file for: {crafted_resume.full_name}")
+
+            return {"success": True, "data": crafted_resume.model_dump()}
+
+        except Exception as openai_error:
+            logger.error(f"OpenAI error in craft_resume_from_existing_resume: {str(openai_error)}")
+            return {
+                "success": False,
+                "error_code": "OPENAI_ERROR",
+                "message": f"Failed to craft resume: {str(openai_error)}",
+            }
+
+    except HTTPException as http_err:
+        logger.error(
+            f"HTTP error in craft_resume_from_existing_resume: {http_err.status_code} - {http_err.detail}"
+        )
+        raise
+    except Exception as e:
+        import traceback
+        logger.error(f"Unexpected error in craft_resume_from_existing_resume: {str(e)}")
+        logger.error(traceback.format_exc())
+        return {
+            "success": False,
+            "error_code": "INTERNAL_ERROR",
+            "message": f"Internal server error: {str(e)}",
+        }
+
+
+@router.post("/get_bullet_points_from_project_source")
+async def get_bullet_points_from_project_source(request: Request, llm=Depends(llm_client)):
+    body = await request.json()
+    source_input = body.get('source_input', '').strip()
+
+    if not source_input:
+        return {"success": False, "error_code": "EMPTY_INPUT",
+                "message": "Please enter a project URL or description."}
+    if len(source_input) > 20000:
+        return {"success": False, "error_code": "INPUT_TOO_LONG",
+                "message": "Input is too long. Please use a URL or a description under 20,000 characters."}
+
+    is_url = source_input.startswith('http://') or source_input.startswith('https://')
+    if is_url:
+        content = await fetch_web_page_content(source_input)
+        error_indicators = ["Invalid URL", "Non-HTML", "Timeout", "Connection error",
+                            "HTTP error", "Request error", "Unexpected error"]
+        if any(ind in content for ind in error_indicators) or len(content.strip()) < 50:
+            return {"success": False, "error_code": "URL_FETCH_FAILED",
+                    "message": f"Could not fetch URL content. Ensure it is publicly accessible. Detail: {content[:200]}"}
+    else:
+        content = source_input
+
+    system_prompt = (
+        "You are a professional technical resume writer for software engineering roles. "
+        "Generate concise, impactful resume bullet points (~13 words each). "
+        "Use strong past-tense verbs. "
+        "overview: what the project is and its primary purpose. "
+        "showcase1: key tech stack, tools, frameworks, or architectural choices used. "
+        "showcase2: (optional) a second distinct feature or collaboration highlight. Only include if genuinely different. "
+        "achievement: quantitative outcome (latency reduction, user count, accuracy, etc.)."
+    )
+    user_prompt = f"Generate resume bullet points for this project:\n\n{content[:4000]}"
+
+    try:
+        response = await llm.responses.parse(
+            model="gpt-4o-mini",
+            input=[{"role": "system", "content": system_prompt},
+                   {"role": "user", "content": user_prompt}],
+            text_format=ProjectBulletPoints
+        )
+        bp = response.output_parsed
+        tech = bp.showcase1.strip()
+        if bp.showcase2 and bp.showcase2.strip():
+            tech = tech + '\n' + bp.showcase2.strip()
+        return {"success": True, "data": {
+            "overview": bp.overview.strip(),
+            "techAndTeamwork": tech,
+            "achievement": bp.achievement.strip()
+        }}
+    except Exception as e:
+        logger.error(f"OpenAI error in get_bullet_points_from_project_source: {str(e)}")
+        return {"success": False, "error_code": "AI_FAILED",
+                "message": "Failed to generate bullet points. Please try again."}
+
+
+@router.post("/auto_fill_info_from_resume")
+async def auto_fill_info_from_resume(
+    resume_file: UploadFile = File(...),
+    cognito_sub: str = Form(...),
+    llm=Depends(llm_client)
+):
+    file_content = await resume_file.read()
+    resume = await resume_store.open_resume(cognito_sub, file_content, resume_file.filename or 'resume.pdf',
+                                            extract_text_from_resume)
+    resume_text = resume.text
+
+    PREDEFINED_TECHNOLOGIES = """
+Software Engineering:
+  Languages/Build: TypeScript, JavaScript, Python, Java, C#, C++, Go, Rust, Kotlin, SQL, Bash, Node.js, JVM, .NET, PHP
+  Client/UI: HTML5, CSS3, DOM, HTTP/HTTPS, PWA, iOS, Android, Swift, WebSockets
+  Backend/Distributed: REST APIs, gRPC, GraphQL, Microservices, Event-driven architecture, Containers, Kubernetes, JWT, Caching patterns, Load balancing
+  Data/Messaging: Relational data modeling, Key-value data modeling, ACID, Replication, Partitioning, Event streaming, Message queuing
+  OS/Networks: TCP/UDP, Lock-free concurrency, Zero-copy I/O
+
+Frameworks (SE):
+  Languages/Build: Git, GitHub, Docker, GitHub Actions, Jenkins, Maven, Gradle, npm, pip, Poetry, Conda
+  Client/UI: React, Next.js, Vue.js, Angular, Svelte, Tailwind CSS, Vite, Webpack, React Native, SwiftUI
+  Backend: Node.js, Express, Spring Boot, FastAPI, Django, Flask, NestJS, Kubernetes, Terraform, AWS, GCP, Azure
+  Data: PostgreSQL, MySQL, Redis, MongoDB, Elasticsearch, Apache Kafka, RabbitMQ, Apache Spark, Snowflake, BigQuery, dbt
+
+AI/ML Technologies:
+  AI App: LLM APIs, RAG, prompt engineering, vector databases, AI agents, function calling, fine-tuning, RLHF
+  Foundation/Research: Transformers, attention mechanisms, diffusion models, reinforcement learning, computer vision, NLP
+  MLOps: experiment tracking, model serving, model monitoring, feature stores, CI/CD for ML, A/B testing
+  Data Engineering: data pipelines, ETL, stream processing, batch processing, data warehousing, feature engineering
+  Infrastructure: GPU clusters, distributed training, CUDA, model optimization, quantization, inference optimization
+
+Frameworks (AI/ML):
+  AI App: LangChain, LlamaIndex, OpenAI API, Claude API, Hugging Face, LangGraph, AutoGen, ChromaDB, Pinecone, Weaviate
+  Foundation: PyTorch, TensorFlow, JAX, Transformers, PEFT, DeepSpeed, vLLM, llama.cpp, Axolotl, Unsloth
+  MLOps: MLflow, Kubeflow, Apache Airflow, Ray Serve, AWS SageMaker, Vertex AI, Weights & Biases, DVC
+  Data: Spark, Kafka, dbt, Snowflake, Databricks, BigQuery, Pandas, Polars, DuckDB
+  Infrastructure: CUDA, cuDNN, NCCL, TensorRT, Slurm, Triton
+"""
+
+    system_prompt = f"""You are an expert resume parser and career advisor. Extract ALL information from the resume into a structured format. Follow these rules strictly:
+
+CAREER FOCUS: Determine the best fit from exactly these four values:
+- "software-engineering" — backend, frontend, fullstack, systems, infrastructure
+- "ai-ml" — machine learning, deep learning, LLMs, NLP, computer vision, AI research
+- "data-science" — data analysis, statistics, BI, analytics, research science
+- "data-engineering" — data pipelines, ETL, data platforms, data infrastructure
+
+PROJECTS: Classify as:
+- personal_projects: personal side projects, college/university projects, open-source contributions, hackathon projects
+- professional_projects: work projects done while employed (link each to the company/job via selectedWorkExperience as "CompanyName – JobTitle")
+
+TECHNOLOGIES & FRAMEWORKS: For selectedTechnologies and selectedFrameworks in projects, ONLY include items that exactly match from these predefined lists:
+{PREDEFINED_TECHNOLOGIES}
+Put items NOT in the predefined lists into customTechnologies / customFrameworks.
+
+TECHNICAL SKILLS: For technical_skill_items, pick individual items from the predefined lists above that match skills in the resume. Put non-matching items in custom_technical_items.
+
+DATES: Use month as 3-letter abbreviation (Jan, Feb, Mar, Apr, May, Jun, Jul, Aug, Sep, Oct, Nov, Dec) and year as 4-digit string. Use empty strings for unknown values.
+
+ACHIEVEMENTS: Include awards, publications, certifications, patents, honors. Use descriptive type strings.
+
+PROJECT DESCRIPTIONS:
+- overview: what the project does and its purpose
+- techAndTeamwork: technologies used and team collaboration details
+- achievement: measurable outcomes, impact, or results
+
+Fill all fields as completely as possible. Use empty strings for missing data, never null."""
+
+    user_prompt = f"Extract all information from this resume:\n\n{resume_text}"
+
+    async def parse_for_auto_fill() -> AutoFillResumeResult:
+        response = await llm.responses.parse(
+            model="gpt-4o",
+            input=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            text_format=AutoFillResumeResult
+        )
+        return response.output_parsed
+
+    result = await resume_store.parse(resume, resume_store.PARSE_AUTO_FILL, AutoFillResumeResult, parse_for_auto_fill)
+    return {"success": True, "data": result.model_dump()}
@@ -0,0 +1,765 @@
+"""
+Target job sources: job posting URLs, job title lookups and cached job recommendations.
+"""
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from aws_lambda_powertools import Logger
+from boto3.dynamodb.types import TypeDeserializer
+from fastapi import APIRouter, Depends, HTTPException, Request
+from pydantic import BaseModel
+
+import http_client
+import job_snapshots
+import robots_cache
+from app_data_repository import get_dynamodb_client, run_in_executor
+from llm_cache import cached_parse
+from resources import llm_client
+from routers.shared import fetch_web_page_content
+
+logger = Logger()
+router = APIRouter()
+RESOURCES = ('dynamodb', 'openai', 'html')
+
+
+class JobUrlExtraction(BaseModel):
+    target_job_title: str
+    target_job_company: str
+    target_job_description: str
+    target_job_skill_keywords: List[str]
+    target_job_url: Optional[str] = None
+
+
+class JobTitleValidation(BaseModel):
+    is_valid_job_title: bool
+    target_job_title: Optional[str] = None
+    target_job_company: Optional[str] = None
+    target_job_description: Optional[str] = None
+    target_job_skill_keywords: Optional[List[str]] = None
+
+
+ROBOTS_MAX_BYTES = 512 * 1024
+
+
+async def check_robots_txt(url: str) -> Tuple[bool, str]:
+    """
+    Check robots.txt to see if the URL path is blocked from scraping.
+
+    Parsed rules are cached per host (see robots_cache), including hosts whose
+    robots.txt is missing or unreachable, so repeat checks need no network call.
+    
+    Returns:
+        (is_blocked, reason) - True if blocked, False otherwise, with reason string
+    """
+    try:
+        from urllib.parse import urlparse, urljoin
+        
+        # Parse the URL to get base domain
+        parsed = urlparse(url)
+        base_url = f"{parsed.scheme}://{parsed.netloc}"
+        url_path = parsed.path or '/'
+
+        rules = robots_cache.get(base_url)
+        if rules is None:
+            robots_url = urljoin(base_url, '/robots.txt')
+            logger.info(f"Checking robots.txt at: {robots_url}")
+            
+            # Fetch robots.txt
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            }
+            
+            try:
+                response = await http_client.fetch(robots_url, headers=headers, timeout=10, max_bytes=ROBOTS_MAX_BYTES)
+            except httpx.HTTPError as e:
+                response = None
+                logger.info(f"Could not fetch robots.txt: {str(e)}")
+
+            if response is None or not response.ok:
+                # If robots.txt doesn't exist or can't be fetched, assume not blocked
+                if response is not None:
+                    logger.info(f"Could not fetch robots.txt: HTTP {response.status_code}")
+                robots_cache.put_negative(base_url)
+                return (False, "")
+
+            rules = robots_cache.parse_robots(response.text)
+            robots_cache.put(base_url, rules)
+        
+        is_blocked, blocking_reason = rules.check(url_path)
+        if is_blocked:
+            logger.warning(f"URL blocked by robots.txt: {url} ({blocking_reason})")
+        return (is_blocked, blocking_reason)
+        
+    except Exception as e:
+        logger.error(f"Error checking robots.txt: {str(e)}")
+        # On error, assume not blocked to avoid false positives
+        return (False, "")
+
+
+# ambitology
+@router.post("/validate_and_fetch_job_url")
+async def validate_and_fetch_job_url(request: Request, llm=Depends(llm_client)):
+    """
+    Validate a job posting URL, fetch its content, and extract structured job data using OpenAI.
+    
+    Returns:
+    - success: True/False
+    - error_code: "INVALID_URL", "FETCH_FAILED", "PARSE_FAILED" (if failed)
+    - data: { target_job_title, target_job_company, target_job_description, target_job_skill_keywords }
+    """
+    try:
+        logger.info("Received validate_and_fetch_job_url request")
+
+        # Parse request body
+        body = await request.json()
+        url = body.get('url', '').strip()
+        fallback_title = body.get('fallback_title', '').strip()
+        fallback_company = body.get('fallback_company', '').strip()
+
+        # ------------------------------------------------------------------
+        # Helper: OpenAI fallback using known job title + company
+        # Called whenever URL fetch fails but we have panel-provided metadata.
+        # ------------------------------------------------------------------
+        async def openai_fallback(title: str, company: str) -> dict:
+            logger.info(f"Using OpenAI fallback for '{title}' at '{company}'")
+            fallback_prompt = f"""
+You are a job market expert with deep knowledge of technology companies and their hiring practices.
+
+Generate accurate, specific structured job information for the following position:
+
+Job Title: {title}
+Company: {company}
+
+Based on your knowledge of {company}'s technology stack, culture, and typical role requirements, provide:
+1. target_job_title: The exact standardized job title
+2. target_job_company: The company name
+3. target_job_description: A specific 2-3 sentence description of what this role involves at {company}, referencing their actual tech stack and work if known
+4. target_job_skill_keywords: List of 6-10 key technical skills, tools, and qualifications typically required for this exact role at {company}
+"""
+            d = await cached_parse(
+                llm, "validate_and_fetch_job_url:fallback",
+                model="gpt-5-mini",
+                input=[
+                    {"role": "system", "content": "You are an expert job market analyst with knowledge of major tech companies and their hiring requirements."},
+                    {"role": "user", "content": fallback_prompt}
+                ],
+                text_format=JobUrlExtraction
+            )
+            return {
+                "success": True,
+                "fallback_used": True,
+                "data": {
+                    "target_job_title": d.target_job_title or title,
+                    "target_job_company": d.target_job_company or company,
+                    "target_job_description": d.target_job_description or "",
+                    "target_job_skill_keywords": d.target_job_skill_keywords or []
+                }
+            }
+
+        if not url:
+            return {
+                "success": False,
+                "error_code": "INVALID_URL",
+                "message": "URL is required"
+            }
+
+        # Validate URL format
+        if not url.startswith(('http://', 'https://')):
+            return {
+                "success": False,
+                "error_code": "INVALID_URL",
+                "message": "Invalid URL format. URL must start with http:// or https://"
+            }
+
+        # Check robots.txt to see if scraping is blocked, before fetching the page
+        # (the host's rules are cached, so only the first check fetches robots.txt)
+        logger.info(f"Checking robots.txt for: {url}")
+        is_blocked, blocking_reason = await check_robots_txt(url)
+
+        if is_blocked:
+            logger.warning(f"Website blocks scraping for: {url} - {blocking_reason}")
+            if fallback_title and fallback_company:
+                return await openai_fallback(fallback_title, fallback_company)
+            return {
+                "success": False,
+                "error_code": "BLOCKED_OR_AUTH_REQUIRED",
+                "message": blocking_reason or "The website blocks direct fetch or requires authentication/captcha"
+            }
+
+        # Try to fetch web content
+        logger.info(f"Fetching job posting content from: {url}")
+        web_content = await fetch_web_page_content(url)
+
+        # Check if fetch was successful (fetch_web_page_content returns error messages as strings)
+        error_indicators = [
+            "Invalid URL format",
+            "Non-HTML content",
+            "Timeout fetching",
+            "Connection error",
+            "HTTP error",
+            "Request error",
+            "Missing dependency",
+            "Unexpected error",
+            "Very little content extracted"
+        ]
+
+        is_error = any(indicator in web_content for indicator in error_indicators)
+
+        if is_error or len(web_content.strip()) < 100:
+            logger.warning(f"Failed to fetch valid content from URL: {url}")
+            if fallback_title and fallback_company:
+                return await openai_fallback(fallback_title, fallback_company)
+            return {
+                "success": False,
+                "error_code": "FETCH_FAILED",
+                "message": web_content if is_error else "Unable to extract meaningful content from the URL"
+            }
+
+        # Use OpenAI to extract structured job data
+        logger.info("Extracting structured job data using OpenAI...")
+
+        prompt = f"""
+        Extract structured job information from the following job posting content:
+
+        JOB POSTING CONTENT:
+        {web_content[:6000]}  # Limit to avoid token limits
+
+        Extract the following information:
+        1. target_job_title: The job title/position being advertised
+        2. target_job_company: The company name offering the job
+        3. target_job_description: A concise summary of the job description (2-3 sentences)
+        4. target_job_skill_keywords: List of key skills, technologies, and requirements mentioned
+
+        If any information is not clearly available, provide a reasonable inference or "Not specified".
+        """
+
+        try:
+            extracted_data = await cached_parse(
+                llm, "validate_and_fetch_job_url",
+                model="gpt-5-mini",
+                input=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert job posting analyzer. Extract key information from job postings accurately and concisely."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                text_format=JobUrlExtraction
+            )
+
+            # If the extracted content looks empty/thin, fall back to OpenAI knowledge
+            has_real_content = (
+                extracted_data.target_job_title and
+                extracted_data.target_job_description and
+                len(extracted_data.target_job_description) > 30 and
+                extracted_data.target_job_skill_keywords and
+                len(extracted_data.target_job_skill_keywords) >= 2
+            )
+
+            if not has_real_content and fallback_title and fallback_company:
+                logger.info("Extracted content is thin — switching to OpenAI fallback")
+                return await openai_fallback(fallback_title, fallback_company)
+
+            logger.info(f"Successfully extracted job data: {extracted_data.target_job_title} at {extracted_data.target_job_company}")
+
+            return {
+                "success": True,
+                "data": {
+                    "target_job_title": extracted_data.target_job_title,
+                    "target_job_company": extracted_data.target_job_company,
+                    "target_job_description": extracted_data.target_job_description,
+                    "target_job_skill_keywords": extracted_data.target_job_skill_keywords,
+                    "target_job_url": url
+                }
+            }
+
+        except Exception as openai_error:
+            logger.error(f"OpenAI parsing error: {str(openai_error)}")
+            if fallback_title and fallback_company:
+                try:
+                    return await openai_fallback(fallback_title, fallback_company)
+                except Exception as fallback_error:
+                    logger.error(f"OpenAI fallback also failed: {str(fallback_error)}")
+            return {
+                "success": False,
+                "error_code": "PARSE_FAILED",
+                "message": f"Failed to parse job posting content: {str(openai_error)}"
+            }
+
+    except HTTPException as http_err:
+        logger.error(f"HTTP error in validate_and_fetch_job_url: {http_err.status_code} - {http_err.detail}")
+        raise
+    except Exception as e:
+        import traceback
+        error_traceback = traceback.format_exc()
+        logger.error(f"Unexpected error in validate_and_fetch_job_url: {str(e)}")
+        logger.error(f"Error type: {type(e).__name__}")
+        logger.error(f"Full traceback: {error_traceback}")
+        return {
+            "success": False,
+            "error_code": "FETCH_FAILED",
+            "message": f"Internal server error: {str(e)}"
+        }
+
+
+@router.post("/resolve_job_url")
+async def resolve_job_url(request: Request, llm=Depends(llm_client)):
+    """
+    Check whether a job posting URL is reachable.
+    - If reachable (HTTP < 400), return it unchanged.
+    - If not (4xx/5xx, timeout, connection error), use OpenAI web search to
+      find the current live job listing for that title at that company and
+      return the discovered URL instead.
+
+    Input:  { url: str, job_title: str, company_name: str }
+    Output: { url: str, fallback_used: bool }
+    """
+    body = {}
+    try:
+        body = await request.json()
+        url          = (body.get("url")          or "").strip()
+        job_title    = (body.get("job_title")    or "").strip()
+        company_name = (body.get("company_name") or "").strip()
+
+        if not url:
+            return {"url": url, "fallback_used": False}
+
+        # ------------------------------------------------------------------
+        # Step 1: Quick reachability check — HEAD, then GET fallback
+        # ------------------------------------------------------------------
+        _headers = {"User-Agent": "Mozilla/5.0 (compatible; JobChecker/1.0)"}
+        url_ok = False
+
+        try:
+            head_resp = await http_client.fetch(url, method="HEAD", timeout=5, headers=_headers, max_bytes=0)
+            url_ok = head_resp.ok
+        except Exception:
+            pass
+
+        if not url_ok:
+            # Some servers reject HEAD — try a streaming GET without downloading the body
+            try:
+                get_resp = await http_client.fetch(url, timeout=5, headers=_headers, max_bytes=0)
+                url_ok = get_resp.ok
+            except Exception:
+                pass
+
+        if url_ok:
+            return {"url": url, "fallback_used": False}
+
+        # ------------------------------------------------------------------
+        # Step 2: URL is dead — use OpenAI web search to find the live posting
+        # ------------------------------------------------------------------
+        logger.info(f"resolve_job_url: '{url}' unreachable — OpenAI fallback for '{job_title}' at '{company_name}'")
+
+        if not (job_title and company_name):
+            # No metadata to search with — return original and let the browser handle it
+            return {"url": url, "fallback_used": False}
+
+        prompt = (
+            f'Find the current, live job application page for the "{job_title}" position '
+            f"at {company_name} on their official careers website.\n\n"
+            "Return ONLY a single raw URL — no markdown, no explanation, nothing else. "
+            "The URL must point to a real, currently open job posting or to the company's "
+            f'careers search page filtered for "{job_title}". '
+            f"If you cannot find a specific open posting, return {company_name}'s main careers page URL."
+        )
+
+        oa_response = await llm.responses.create(
+            model="gpt-4o-mini",
+            tools=[{"type": "web_search_preview"}],
+            input=prompt,
+        )
+
+        found_url = ""
+        for item in oa_response.output:
+            if getattr(item, "type", None) == "message":
+                for block in getattr(item, "content", []):
+                    if getattr(block, "type", None) == "output_text":
+                        found_url += block.text
+
+        # The model should return just a URL; take the first whitespace-separated token
+        found_url = (found_url.strip().split()[0] if found_url.strip() else "")
+
+        if found_url.startswith(("http://", "https://")):
+            logger.info(f"resolve_job_url: found fallback URL '{found_url}'")
+            return {"url": found_url, "fallback_used": True}
+
+        # Model didn't return a usable URL — open original so user still gets something
+        return {"url": url, "fallback_used": False}
+
+    except Exception as e:
+        logger.error(f"resolve_job_url unexpected error: {e}")
+        return {"url": body.get("url", ""), "fallback_used": False}
+
+
+@router.post("/fetch_with_job_title")
+async def fetch_with_job_title(request: Request, llm=Depends(llm_client)):
+    """
+    Validate a job title and generate a generic job description using OpenAI.
+    
+    Input: job_title (string, <150 chars)
+    
+    Returns:
+    - success: True/False
+    - data: { target_job_title, target_job_company, target_job_description, target_job_skill_keywords }
+    - message: Error message if validation fails
+    """
+    try:
+        logger.info("Received fetch_with_job_title request")
+        
+        # Parse request body
+        body = await request.json()
+        job_title = body.get('job_title', '').strip()
+        
+        if not job_title:
+            return {
+                "success": False,
+                "message": "Job title is required"
+            }
+        
+        if len(job_title) >= 150:
+            return {
+                "success": False,
+                "message": "Input too long. Please enter a shorter job title or use the job description field."
+            }
+        
+        # Use OpenAI to validate job title and generate generic job description
+        logger.info(f"Validating and generating job description for: {job_title}")
+        
+        validation_prompt = f"""
+        Analyze the following text and determine if it represents a valid job title or job position:
+        
+        INPUT: "{job_title}"
+        
+        A valid job title typically:
+        - Describes a professional role or position (e.g., "Software Engineer", "Product Manager at Google", "Senior Data Scientist")
+        - May include company name (e.g., "Software Engineer at Meta")
+        - May include seniority level (e.g., "Senior", "Junior", "Lead")
+        
+        Invalid inputs include:
+        - Random text or gibberish
+        - Complete sentences that aren't job titles
+        - Names of people
+        - Locations without a job context
+        
+        If VALID: Extract the job title and company (if mentioned), then generate:
+        1. target_job_title: The standardized job title
+        2. target_job_company: The company name if mentioned, otherwise "Various Companies"
+        3. target_job_description: A generic 2-3 sentence description of what this role typically involves
+        4. target_job_skill_keywords: List of 5-10 key skills typically required for this role
+        
+        If INVALID: Set is_valid_job_title to false
+        """
+        
+        try:
+            result = await cached_parse(
+                llm, "fetch_with_job_title",
+                model="gpt-5-mini",
+                input=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert job market analyst. Validate job titles and generate accurate, industry-standard job descriptions."
+                    },
+                    {
+                        "role": "user",
+                        "content": validation_prompt
+                    }
+                ],
+                text_format=JobTitleValidation
+            )
+            
+            if not result.is_valid_job_title:
+                logger.info(f"Invalid job title detected: {job_title}")
+                return {
+                    "success": False,
+                    "message": "Please enter a valid job title"
+                }
+            
+            logger.info(f"Successfully generated job data for: {result.target_job_title}")
+            
+            return {
+                "success": True,
+                "data": {
+                    "target_job_title": result.target_job_title or job_title,
+                    "target_job_company": result.target_job_company or "Various Companies",
+                    "target_job_description": result.target_job_description or "",
+                    "target_job_skill_keywords": result.target_job_skill_keywords or []
+                }
+            }
+            
+        except Exception as openai_error:
+            logger.error(f"OpenAI parsing error: {str(openai_error)}")
+            return {
+                "success": False,
+                "message": f"Failed to process job title: {str(openai_error)}"
+            }
+        
+    except Exception as e:
+        import traceback
+        error_traceback = traceback.format_exc()
+        logger.error(f"Unexpected error in fetch_with_job_title: {str(e)}")
+        logger.error(f"Full traceback: {error_traceback}")
+        return {
+            "success": False,
+            "message": f"Internal server error: {str(e)}"
+        }
+
+
+@router.post("/parse_job_description")
+async def parse_job_description(request: Request, llm=Depends(llm_client)):
+    """
+    Parse a job description text and extract structured job data using OpenAI.
+    
+    Input: job_description (string, >150 chars)
+    
+    Returns:
+    - success: True/False
+    - data: { target_job_title, target_job_company, target_job_description, target_job_skill_keywords }
+    - message: Error message if parsing fails
+    """
+    try:
+        logger.info("Received parse_job_description request")
+        
+        # Parse request body
+        body = await request.json()
+        job_description = body.get('job_description', '').strip()
+        
+        if not job_description:
+            return {
+                "success": False,
+                "message": "Job description is required"
+            }
+        
+        if len(job_description) < 150:
+            return {
+                "success": False,
+                "message": "Job description is too short. Please provide a complete job description."
+            }
+        
+        # Use OpenAI to extract structured job data
+        logger.info("Extracting structured job data from description using OpenAI...")
+        
+        prompt = f"""
+        Extract structured job information from the following job description:
+
+        JOB DESCRIPTION:
+        {job_description[:6000]}  # Limit to avoid token limits
+
+        Extract the following information:
+        1. target_job_title: The job title/position being described
+        2. target_job_company: The company name if mentioned, otherwise "Not specified"
+        3. target_job_description: A concise summary of the job description (2-3 sentences)
+        4. target_job_skill_keywords: List of key skills, technologies, and requirements mentioned
+        5. target_job_url: If an explicit job posting URL or application link (starting with http:// or https://) appears in the text, extract it. Otherwise use null.
+
+        If any information is not clearly available, provide a reasonable inference.
+        """
+        
+        try:
+            extracted_data = await cached_parse(
+                llm, "parse_job_description",
+                model="gpt-5-mini",
+                input=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert job posting analyzer. Extract key information from job descriptions accurately and concisely."
+                    },
+                    {
+                        "role": "user",
+                        "content": prompt
+                    }
+                ],
+                text_format=JobUrlExtraction
+            )
+            
+            logger.info(f"Successfully extracted job data: {extracted_data.target_job_title} at {extracted_data.target_job_company}")
+
+            return {
+                "success": True,
+                "data": {
+                    "target_job_title": extracted_data.target_job_title,
+                    "target_job_company": extracted_data.target_job_company,
+                    "target_job_description": extracted_data.target_job_description,
+                    "target_job_skill_keywords": extracted_data.target_job_skill_keywords,
+                    "target_job_url": extracted_data.target_job_url or None
+                }
+            }
+            
+        except Exception as openai_error:
+            logger.error(f"OpenAI parsing error: {str(openai_error)}")
+            return {
+                "success": False,
+                "message": f"Failed to parse job description: {str(openai_error)}"
+            }
+        
+    except Exception as e:
+        import traceback
+        error_traceback = traceback.format_exc()
+        logger.error(f"Unexpected error in parse_job_description: {str(e)}")
+        logger.error(f"Full traceback: {error_traceback}")
+        return {
+            "success": False,
+            "message": f"Internal server error: {str(e)}"
+        }
+
+
+JOB_CACHE_TABLE = "jobCache"
+
+
+JOB_TIE_BREAK_MAX_CANDIDATES = 30
+
+
+class JobRanking(BaseModel):
+    ranked_indices: List[int]
+
+
+def _query_position_pool(normalized_position: str) -> List[Dict[str, Any]]:
+    pages = get_dynamodb_client().get_paginator('query').paginate(
+        TableName=JOB_CACHE_TABLE,
+        IndexName="position-index",
+        KeyConditionExpression="position_name = :position",
+        ExpressionAttributeValues={":position": {"S": normalized_position}},
+        ProjectionExpression="job_title, company_name, job_url, job_skills",
+    )
+    deserializer = TypeDeserializer()
+    return [{k: deserializer.deserialize(v) for k, v in item.items()}
+            for page in pages for item in page.get("Items", [])]
+
+
+async def load_position_pool(normalized_position: str) -> List[Dict[str, Any]]:
+    """All cached listings for a position from the position-index (paginated, on the DynamoDB executor)."""
+    return await run_in_executor(_query_position_pool, normalized_position)
+
+
+async def llm_tie_break(llm, position_name: str, career_focus: str, user_skills: List[str],
+                        candidates: List[Dict[str, Any]]) -> List[int]:
+    """
+    Order listings the local ranker scored as tied. Returns a permutation of
+    range(len(candidates)); invalid or missing indices keep the local order.
+    """
+    job_list_text = "\n".join(
+        f"{i}: {j.get('job_title', '')} @ {j.get('company_name', '')}"
+        for i, j in enumerate(candidates)
+    )
+    skills_text = ", ".join(user_skills) if user_skills else "not specified"
+
+    ranking_prompt = f"""You are an expert career advisor and technical recruiter.
+
+User profile:
+- Career focus: {career_focus or 'not specified'}
+- Technical skills: {skills_text}
+
+Below is a numbered list of job listings for the position "{position_name}" that are otherwise equally suitable.
+Order them for this user, prioritising relevance to the user's career focus and technical skills, then company reputation.
+
+Return ONLY a JSON array of the indices (0-based integers), ordered with the best match first.
+
+Job listings:
+{job_list_text}"""
+
+    parsed = await cached_parse(
+        llm, "job_recommendations:tie_break",
+        model="gpt-5-mini",
+        input=[
+            {"role": "system", "content": "You are a concise JSON-only responder. Return only the JSON object requested."},
+            {"role": "user",   "content": ranking_prompt},
+        ],
+        text_format=JobRanking,
+    )
+
+    seen = set()
+    ordered = []
+    for idx in parsed.ranked_indices or []:
+        if isinstance(idx, int) and 0 <= idx < len(candidates) and idx not in seen:
+            seen.add(idx)
+            ordered.append(idx)
+    ordered.extend(i for i in range(len(candidates)) if i not in seen)
+    return ordered
+
+
+@router.post("/job-recommendations")
+async def get_job_recommendations(request: Request, llm=Depends(llm_client)):
+    """
+    Return the top 20 cached job listings for a position.
+
+    The jobCache refresh materializes a ranked snapshot per position (cached in
+    memory per batch, see job_snapshots); the local ranking engine
+    (job_ranking) scores that pool by skill match, company tier and diversity
+    in one vectorized pass. With ``"tie_break": "llm"`` in the body,
+    listings tied around the top-20 cutoff are additionally ordered by OpenAI.
+    """
+    position_name = ""
+    try:
+        import job_ranking  # numpy; imported on first use
+
+        started = time.perf_counter()
+        body = await request.json()
+        position_name = body.get("position_name", "").strip()
+        career_focus  = body.get("career_focus", "").strip()
+        user_skills   = [s for s in (body.get("user_skills", []) or []) if isinstance(s, str)]
+        use_llm_tie_break = body.get("tie_break") == "llm"
+
+        if not position_name:
+            return {"success": False, "jobs": [], "error": "position_name is required"}
+
+        normalized = (
+            position_name.strip()
+            .lower()
+            .replace(" ", "_")
+            .replace("/", "_")
+            .replace("&", "and")
+        )
+
+        # ------------------------------------------------------------------
+        # 1. Materialized snapshot (served from memory on warm containers);
+        #    the position-index query is only needed for positions without one
+        # ------------------------------------------------------------------
+        snapshot = await job_snapshots.get_snapshot(normalized)
+        if snapshot is not None:
+            pool = snapshot.jobs
+            index = job_ranking.get_index(normalized, snapshot.batch_id, pool)
+        else:
+            logger.warning(f"No precomputed ranking for '{normalized}', ranking the live pool")
+            pool = await load_position_pool(normalized)
+            index = job_ranking.build_index(pool)
+
+        if not pool:
+            return {"success": True, "jobs": []}
+
+        # ------------------------------------------------------------------
+        # 2. Local deterministic ranking of the whole pool
+        # ------------------------------------------------------------------
+        ranking = job_ranking.rank(index, user_skills, career_focus)
+        order = [int(i) for i in ranking.order]
+
+        # ------------------------------------------------------------------
+        # 3. Optional: let OpenAI break ties around the cutoff
+        # ------------------------------------------------------------------
+        if use_llm_tie_break:
+            start, end = job_ranking.tie_window(ranking, job_ranking.RECOMMENDATION_LIMIT)
+            end = min(end, start + JOB_TIE_BREAK_MAX_CANDIDATES)
+            if end - start > 1:
+                window = order[start:end]
+                try:
+                    permutation = await llm_tie_break(
+                        llm, position_name, career_focus, user_skills, [pool[i] for i in window]
+                    )
+                    order[start:end] = [window[i] for i in permutation]
+                except Exception as e:
+                    logger.warning(f"LLM tie-break failed for '{position_name}', keeping local order: {e}")
+
+        jobs = [job_ranking.public_job(pool[i]) for i in order[:job_ranking.RECOMMENDATION_LIMIT]]
+        logger.info(
+            f"Ranked {len(jobs)} jobs for position '{position_name}' (total pool: {len(pool)})",
+            extra={"duration_ms": round((time.perf_counter() - started) * 1000, 1)},
+        )
+        return {"success": True, "jobs": jobs}
+
+    except Exception as e:
+        logger.error(f"Error fetching job recommendations for '{position_name}': {e}")
+        return {"success": False, "jobs": [], "error": str(e)}
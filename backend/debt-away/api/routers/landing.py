@@ -0,0 +1,567 @@
+"""
+Landing-page forms: paid lab checkouts, lead sign-up and job/referral applications.
+"""
+import json
+import re
+import uuid
+from datetime import datetime
+from typing import Optional
+
+from aws_lambda_powertools import Logger
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Request, UploadFile
+
+from resources import dynamodb_resource, stripe_sdk
+from upload_queue import enqueue_upload, wait_for_uploads
+
+logger = Logger()
+router = APIRouter()
+RESOURCES = ('dynamodb', 's3', 'stripe')
+
+EMAIL_RE = re.compile(r'^[^\s@]+@[^\s@]+\.[^\s@]+$')
+
+
+@router.post("/resume-analysis-lab")
+async def resume_analysis_lab(file: UploadFile = File(...), form_data: str = Form(...), stripe=Depends(stripe_sdk)):
+    try:
+        logger.info(f"Received resume analysis lab request")
+        
+        # Parse form data
+        form_data_json = json.loads(form_data)
+        email = form_data_json.get('email', '')
+        full_name = form_data_json.get('fullName', '')
+        current_role = form_data_json.get('currentRole', '')
+        target_role = form_data_json.get('targetRole', '')
+        career_objectives = form_data_json.get('careerObjectives', '')
+        
+        logger.info(f"Processing resume analysis for {full_name} ({email})")
+        
+        # Save file to S3 for later processing (background upload queue)
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        base_submission_id = f"{email}-{current_date}"
+        client_uuid = str(uuid.uuid4())
+        submission_id = f"{base_submission_id}-{client_uuid}"
+        file_content = await file.read()
+        file_name = file.filename
+        object_key = f"resume-analysis-lab/{submission_id}/{file_name}"
+        uploads = [enqueue_upload(object_key, file_content, file.content_type)]
+        # Save client info JSON to S3 (background upload queue)
+        info_key = f"resume-analysis-lab/{submission_id}/client_info.json"
+        client_info = {
+            "client_uuid": client_uuid,
+            "email": email,
+            "full_name": full_name,
+            "submission_id": submission_id,
+            "current_role": current_role,
+            "target_role": target_role,
+            "career_objectives": career_objectives,
+            "submission_date": current_date,
+            "file_name": file_name,
+            "resume_link": f"https://career-landing-group.s3.us-east-1.amazonaws.com/{object_key}"
+        }
+        client_info_json = json.dumps(client_info, indent=2)
+        uploads.append(enqueue_upload(info_key, client_info_json, "application/json"))
+        service_path = "/resume-analysis-lab"
+        # Create a Stripe checkout session with custom fields
+        checkout_session = stripe.checkout.Session.create(
+            payment_method_types=[
+                'card',
+                'afterpay_clearpay',
+                'klarna',
+                'cashapp'
+                ],
+            customer_email=email,
+            client_reference_id=client_uuid,
+            metadata={
+                'service_name': 'Resume Analysis Lab',
+                'submission_id': submission_id,
+                'client_uuid': client_uuid,
+                'email': email,
+                'full_name': full_name,
+                'target_role': target_role,
+                's3_client_info_link': f"https://career-landing-group.s3.us-east-1.amazonaws.com/{info_key}"
+            },
+            line_items=[
+                {
+                    'price': 'price_1RGVGwCNRzh0Tnp2WgcmYivd',
+                    'quantity': 1,
+                },
+            ],
+            mode='payment',
+            allow_promotion_codes=True,
+            success_url=f"https://www.careerlandinggroup.com/payment-confirmation?session_id={{CHECKOUT_SESSION_ID}}&email={email}&service_path={service_path}",
+            cancel_url="https://www.careerlandinggroup.com/resume-design/resume-analysis-lab/"
+        )
+        logger.info(f"Stripe checkout session created: {checkout_session.id}")
+        await wait_for_uploads(uploads)
+        return {
+            "status": "success",
+            "checkout_session_id": checkout_session.id,
+            "payment_url": checkout_session.url,
+            "direct_payment_link": checkout_session.url,
+            "submission_id": submission_id,
+            "client_uuid": client_uuid
+        }
+    except Exception as e:
+        logger.error(f"Error in resume analysis lab: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
+
+
+@router.post("/instant-mock-interview")
+async def instant_mock_interview(
+    file: Optional[UploadFile] = File(None),
+    form_data: str = Form(...),
+    stripe=Depends(stripe_sdk)
+):
+    try:
+        logger.info(f"Received instant mock interview request")
+        
+        # Parse form data
+        form_data_json = json.loads(form_data)
+        email = form_data_json.get('email', '')
+        full_name = form_data_json.get('fullName', '')
+        current_role = form_data_json.get('currentRole', '')
+        target_role = form_data_json.get('targetRole', '')
+        target_job_link = form_data_json.get('targetJobLink', '')
+        interview_question_type = form_data_json.get('interviewQuestionType', '')
+        
+        logger.info(f"Processing instant mock interview for {full_name} ({email})")
+        
+        # Submission date and ID
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        base_submission_id = f"{email}-{current_date}"
+        client_uuid = str(uuid.uuid4())
+        submission_id = f"{base_submission_id}-{client_uuid}"
+        logger.info(f"Generated unique submission ID: {submission_id}")
+        logger.info(f"UUID component: {client_uuid}")
+        
+        # S3 file upload (background upload queue)
+        uploads = []
+        if file is not None:
+            file_content = await file.read()
+            object_key = f"instant-mock-interview/{submission_id}/{file.filename}"
+            uploads.append(enqueue_upload(object_key, file_content, file.content_type))
+        
+        # Store client info as JSON (background upload queue)
+        client_info = {
+            "client_uuid": client_uuid,
+            "email": email,
+            "full_name": full_name,
+            "current_role": current_role,
+            "target_role": target_role,
+            "target_job_link": target_job_link,
+            "interview_question_type": interview_question_type,
+            "submission_date": current_date,
+            "submission_id": submission_id,
+        }
+        info_key = f"instant-mock-interview/{submission_id}/client_info.json"
+        uploads.append(enqueue_upload(info_key, json.dumps(client_info, indent=2), "application/json"))
+        
+        service_path = "/instant-mock-interview"
+
+        # Create a Stripe checkout session
+        checkout_session = stripe.checkout.Session.create(
+            payment_method_types=[
+                'card',
+                'afterpay_clearpay',
+                'klarna',
+                'cashapp'
+            ],
+            customer_email=email,
+            client_reference_id=client_uuid,
+            metadata={
+                'service_name': 'Instant Mock Interview',
+                'submission_id': submission_id,
+                'client_uuid': client_uuid,
+                'email': email,
+                'full_name': full_name,
+                'target_role': target_role,
+                'interview_question_type': interview_question_type,
+                's3_client_info_link': f"https://career-landing-group.s3.us-east-1.amazonaws.com/{info_key}"
+            },
+            line_items=[
+                {
+                    #'price': 'price_1RLXQuCNRzh0Tnp24yLckBAN', # test price
+                    'price': 'price_1RHWPoCNRzh0Tnp2WKqgRJXb',  # live price
+                    'quantity': 1,
+                },
+            ],
+            mode='payment',
+            allow_promotion_codes=True,
+            success_url=f"https://www.careerlandinggroup.com/payment-confirmation?session_id={{CHECKOUT_SESSION_ID}}&email={email}&service_path={service_path}",
+            cancel_url="https://www.careerlandinggroup.com/interview-prep/instant-mock-interview/",
+            payment_intent_data={
+                'setup_future_usage': None,
+                'capture_method': 'automatic',
+            }
+        )
+
+        logger.info(f"Stripe checkout session created: {checkout_session.id}")
+        await wait_for_uploads(uploads)
+        
+        return {
+            "status": "success",
+            "sessionId": checkout_session.id, # Official stripe checkout session id
+            "payment_url": checkout_session.url,
+            "direct_payment_link": checkout_session.url,
+            "client_uuid": client_uuid
+        }
+    except Exception as e:
+        logger.error(f"Error in instant mock interview: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"Error processing instant mock interview: {str(e)}")
+
+
+@router.post("/flash-chat")
+async def flash_chat(request: Request, stripe=Depends(stripe_sdk)):
+    try:
+        # Parse JSON data from the request
+        data = await request.json()
+        email = data.get('email', '')
+        full_name = data.get('fullName', '')
+        current_role = data.get('currentRole', '')
+        target_role = data.get('targetRole', '')
+        message = data.get('message', '')
+        selected_questions = data.get('selectedQuestions', [])
+        subscription_type = data.get('subscriptionType', 'monthly')
+        # Determine price_id based on subscription_type
+        if subscription_type == 'biweekly':
+            price_id = 'price_1RUrC2CNRzh0Tnp2ikTobjoM'
+        else:
+            price_id = 'price_1RJ4LnCNRzh0Tnp2aOj91XNX'
+        
+        logger.info(f"Received flash chat request from {full_name} ({email})")
+        
+        # Create a human-readable date string
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        
+        # Create a unique identifier for this chat
+        base_chat_id = f"{email}-{current_date}"
+        
+        # Generate a UUID based on the chat_id
+        client_uuid = str(uuid.uuid4())
+        
+        # Final chat ID combines the readable ID and UUID
+        chat_id = f"{base_chat_id}-{client_uuid}"
+        
+        logger.info(f"Generated unique chat ID: {chat_id}")
+        logger.info(f"UUID component: {client_uuid}")
+        
+        # Create and store client information as JSON (background upload queue)
+        client_info = {
+            "client_uuid": client_uuid,
+            "email": email,
+            "full_name": full_name,
+            "current_role": current_role,
+            "target_role": target_role,
+            "message": message,
+            "selected_questions": selected_questions,
+            "submission_date": current_date,
+            'subscription_type': subscription_type,
+            "chat_id": chat_id
+        }
+        info_key = f"flash-chat/{chat_id}/client_info.json"
+        client_info_json = json.dumps(client_info, indent=2)
+        uploads = [enqueue_upload(info_key, client_info_json, "application/json")]
+        service_path = "/flash-chat"
+        # Create a Stripe checkout session with custom fields for monthly subscription
+        checkout_session = stripe.checkout.Session.create(
+            payment_method_types=[ 'card' ],
+            customer_email=email,
+            client_reference_id=client_uuid,
+            metadata={
+                'service_name': 'Flash Chat',
+                'chat_id': chat_id,
+                'client_uuid': client_uuid,
+                'email': email,
+                'full_name': full_name,
+                'target_role': target_role,
+                's3_client_info_link': f"https://career-landing-group.s3.us-east-1.amazonaws.com/{info_key}",
+                'subscription_type': subscription_type,
+            },
+            line_items=[
+                {
+                    'price': price_id,
+                    'quantity': 1,
+                },
+            ],
+            mode='subscription',
+            allow_promotion_codes=True,
+            subscription_data={
+                'trial_period_days': 2,
+            },
+            success_url=f"https://www.careerlandinggroup.com/payment-confirmation?session_id={{CHECKOUT_SESSION_ID}}&email={email}&service_path={service_path}",
+            cancel_url="https://www.careerlandinggroup.com/career-cruise/flash-chat-2/"
+        )
+        logger.info(f"Stripe subscription checkout session created: {checkout_session.id}")
+        await wait_for_uploads(uploads)
+        return {
+            "status": "success",
+            "checkout_session_id": checkout_session.id,
+            "payment_url": checkout_session.url,
+            "direct_payment_link": checkout_session.url,
+            "chat_id": chat_id,
+            "client_uuid": client_uuid
+        }
+    except Exception as e:
+        logger.error(f"Error in flash chat: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"Error processing chat request: {str(e)}")
+
+
+@router.post("/lead_sign_up")
+async def lead_sign_up(request: Request, dynamodb=Depends(dynamodb_resource)):
+    try:
+        logger.info("Received lead sign up request")
+        
+        # Get request body
+        body = await request.json()
+        email = body.get('email', '').strip()
+        
+        if not email:
+            raise HTTPException(status_code=400, detail="Email is required")
+        
+        # Validate email format
+        if not EMAIL_RE.match(email):
+            raise HTTPException(status_code=400, detail="Invalid email format")
+        
+        # Check if table exists, create if not
+        table_name = 'lead_email'
+        try:
+            table = dynamodb.Table(table_name)
+            # Try to load the table to see if it exists
+            table.load()
+            logger.info(f"Table {table_name} exists")
+        except dynamodb.meta.client.exceptions.ResourceNotFoundException:
+            logger.info(f"Table {table_name} does not exist, creating it...")
+            # Create the table
+            table = dynamodb.create_table(
+                TableName=table_name,
+                KeySchema=[
+                    {
+                        'AttributeName': 'id',
+                        'KeyType': 'HASH'
+                    }
+                ],
+                AttributeDefinitions=[
+                    {
+                        'AttributeName': 'id',
+                        'AttributeType': 'S'
+                    }
+                ],
+                BillingMode='PAY_PER_REQUEST'
+            )
+            # Wait for table to be created
+            table.wait_until_exists()
+            logger.info(f"Table {table_name} created successfully")
+        except Exception as table_check_error:
+            # If we can't describe the table due to permissions, assume it exists and try to use it
+            logger.warning(f"Could not check table status (permissions issue): {str(table_check_error)}")
+            table = dynamodb.Table(table_name)
+        
+        # Generate unique ID and timestamp
+        lead_id = str(uuid.uuid4())
+        timestamp = datetime.now().isoformat()
+        
+        logger.info(f"Attempting to save lead email: {email}")
+        # Save to DynamoDB
+        table.put_item(
+            Item={
+                'id': lead_id,
+                'email': email,
+                'timestamp': timestamp,
+                'source': 'lead_page'
+            },
+            ConditionExpression="attribute_not_exists(id)",
+        )
+        logger.info(f"Successfully wrote to DynamoDB table: {table_name}")
+        
+        logger.info(f"Successfully saved lead email: {email}")
+        
+        return {
+            "status": "success",
+            "message": "Email successfully saved",
+            "lead_id": lead_id
+        }
+        
+    except HTTPException as http_err:
+        # Log HTTP exceptions with details
+        logger.error(f"HTTP error in lead_sign_up: {http_err.status_code} - {http_err.detail}")
+        logger.error(f"Request details - Email: {email if 'email' in locals() else 'N/A'}")
+        raise
+    except Exception as e:
+        # Comprehensive error logging for debugging
+        import traceback
+        error_traceback = traceback.format_exc()
+        
+        logger.error(f"Unexpected error in lead_sign_up: {str(e)}")
+        logger.error(f"Error type: {type(e).__name__}")
+        logger.error(f"Full traceback: {error_traceback}")
+        
+        # Log request context for debugging
+        try:
+            logger.error(f"Request details - Email: {email if 'email' in locals() else 'N/A'}")
+            logger.error(f"Lead ID: {lead_id if 'lead_id' in locals() else 'N/A'}")
+            logger.error(f"Timestamp: {timestamp if 'timestamp' in locals() else 'N/A'}")
+        except:
+            logger.error("Could not log request details")
+        
+        # Log system information for infrastructure debugging
+        import os
+        logger.error(f"Environment: {os.environ.get('AWS_LAMBDA_FUNCTION_NAME', 'local')}")
+        logger.error(f"Region: {os.environ.get('AWS_REGION', 'unknown')}")
+        
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+@router.post("/job_application")
+async def job_application(
+    form_data: str = Form(...),
+    resume: Optional[UploadFile] = File(None)
+):
+    try:
+        logger.info(f"Received job application request")
+
+        # Parse JSON text fields from the single form_data field
+        try:
+            data = json.loads(form_data)
+        except Exception:
+            raise HTTPException(status_code=400, detail="Invalid form_data JSON")
+
+        firstName = data.get("firstName", "")
+        lastName = data.get("lastName", "")
+        email = data.get("email", "")
+        phoneNumber = data.get("phoneNumber", "")
+        isStudent = data.get("isStudent", "")
+        currentEmployer = data.get("currentEmployer", "")
+        linkedinUrl = data.get("linkedinUrl", "")
+        githubUrl = data.get("githubUrl", "")
+        portfolioUrl = data.get("portfolioUrl", "")
+        websiteUrl = data.get("websiteUrl", "")
+        selectedPosition = data.get("selectedPosition", "")
+
+        logger.info(f"Resume filename: {resume.filename if resume else 'None'}")
+        logger.info(f"Resume content_type: {resume.content_type if resume else 'None'}")
+
+        full_name = f"{firstName} {lastName}"
+        logger.info(f"Processing job application for {full_name} ({email})")
+        
+        # Submission date and ID
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        base_submission_id = f"{email}-{current_date}"
+        client_uuid = str(uuid.uuid4())
+        submission_id = f"{base_submission_id}-{client_uuid}"
+        
+        logger.info(f"Generated unique submission ID: {submission_id}")
+        logger.info(f"UUID component: {client_uuid}")
+        
+        # Save file to S3 for later processing (background upload queue) - following resume_analysis_lab pattern
+        file_content = None
+        file_name = None
+        object_key = None
+        uploads = []
+        
+        if resume is not None:
+            logger.info(f"Resume file received: {resume.filename}, type: {resume.content_type}")
+            file_content = await resume.read()
+            logger.info(f"File content read, size: {len(file_content)} bytes")
+            file_name = resume.filename
+            object_key = f"job_application/{submission_id}/{file_name}"
+            uploads.append(enqueue_upload(object_key, file_content, resume.content_type))
+        else:
+            logger.info("No resume file provided")
+        
+        # Store client info as JSON (background upload queue)
+        client_info = {
+            "client_uuid": client_uuid,
+            "email": email,
+            "firstName": firstName,
+            "lastName": lastName,
+            "full_name": full_name,
+            "phoneNumber": phoneNumber,
+            "isStudent": isStudent,
+            "currentEmployer": currentEmployer,
+            "linkedinUrl": linkedinUrl,
+            "githubUrl": githubUrl,
+            "portfolioUrl": portfolioUrl,
+            "websiteUrl": websiteUrl,
+            "selectedPosition": selectedPosition,
+            "submission_date": current_date,
+            "submission_id": submission_id,
+        }
+        
+        # Add resume info if file was uploaded
+        if resume is not None and file_name and object_key:
+            client_info["file_name"] = file_name
+            client_info["resume_link"] = f"https://career-landing-group.s3.us-east-1.amazonaws.com/{object_key}"
+        
+        info_key = f"job_application/{submission_id}/client_info.json"
+        uploads.append(enqueue_upload(info_key, json.dumps(client_info, indent=2), "application/json"))
+        await wait_for_uploads(uploads)
+        
+        logger.info(f"Job application processed successfully for {full_name} ({email})")
+        
+        return {
+            "status": "success",
+            "message": "Job application submitted successfully",
+            "submission_id": submission_id,
+            "client_uuid": client_uuid
+        }
+    except Exception as e:
+        logger.error(f"Error in job application: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"Error processing job application: {str(e)}")
+
+
+@router.post("/referral_application")
+async def referral_application(file: UploadFile = File(...), form_data: str = Form(...)):
+    try:
+        logger.info(f"Received referral application request")
+        
+        # Parse form data
+        form_data_json = json.loads(form_data)
+        email = form_data_json.get('email', '')
+        
+        logger.info(f"Processing referral application for ({email})")
+        
+        # Save file to S3 for later processing (background upload queue)
+        current_date = datetime.now().strftime("%Y-%m-%d")
+        base_submission_id = f"{email}-{current_date}"
+        client_uuid = str(uuid.uuid4())
+        submission_id = f"{base_submission_id}-{client_uuid}"
+        file_content = await file.read()
+        file_name = file.filename
+        object_key = f"referral/{submission_id}/{file_name}"
+        uploads = [enqueue_upload(object_key, file_content, file.content_type)]
+        
+        # Save client info JSON to S3 (background upload queue)
+        info_key = f"referral/{submission_id}/client_info.json"
+        client_info = {
+            "client_uuid": client_uuid,
+            "email": email,
+            "submission_id": submission_id,
+            "submission_date": current_date,
+            "file_name": file_name,
+            "resume_link": f"https://career-landing-group.s3.us-east-1.amazonaws.com/{object_key}"
+        }
+        client_info_json = json.dumps(client_info, indent=2)
+        uploads.append(enqueue_upload(info_key, client_info_json, "application/json"))
+        await wait_for_uploads(uploads)
+        
+        logger.info(f"Referral application processed successfully for ({email})")
+        
+        return {
+            "status": "success",
+            "message": "Referral application submitted successfully",
+            "submission_id": submission_id,
+            "client_uuid": client_uuid
+        }
+    except Exception as e:
+        logger.error(f"Error in referral application: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"Error processing referral application: {str(e)}")
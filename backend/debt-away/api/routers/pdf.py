@@ -0,0 +1,749 @@
+"""
+Resume documents: LaTeX rendering, PDF/TeX downloads and the resume sanity check.
+"""
+import os
+import shutil
+import uuid
+from typing import Any, Dict, List, Optional
+
+from aws_lambda_powertools import Logger
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+import latex_engine
+import pdf_render_cache
+import resume_sanity
+import usage_quota
+from llm_cache import cached_parse
+from resources import llm_client
+from usage_quota import consume_quota
+
+logger = Logger()
+router = APIRouter()
+RESOURCES = ('dynamodb', 'latex', 'openai', 's3')
+
+
+class ResumeContact(BaseModel):
+    label: str  # e.g., "Email", "Phone", "LinkedIn", "GitHub"
+    value: str
+
+
+class ResumeJobTitle(BaseModel):
+    id: str
+    title: str
+    date: str
+    bullets: List[str]
+    projectTechnologies: Optional[Dict[str, Any]] = None
+
+
+class ResumeProfessionalExperience(BaseModel):
+    id: str
+    company: str
+    jobTitles: List[ResumeJobTitle]
+
+
+class ResumeDegree(BaseModel):
+    id: str
+    degree: str
+    description: str
+
+
+class ResumeEducation(BaseModel):
+    id: str
+    university: str
+    date: str
+    degrees: List[ResumeDegree]
+
+
+class ResumeProject(BaseModel):
+    id: str
+    name: str
+    date: str
+    description: str
+    bullets: List[str]
+    technologies: Optional[List[str]] = None
+
+
+class ResumeSkill(BaseModel):
+    id: str
+    topic: str  # e.g., "Languages", "Frameworks", "Tools"
+    keywords: str  # comma-separated
+
+
+class ResumeAchievement(BaseModel):
+    id: str
+    type: str  # e.g., "Award", "Certification", "Publication"
+    value: str
+
+
+class GenerateResumePDFRequest(BaseModel):
+    user_id: str
+    name: str
+    contact: List[ResumeContact]
+    professional_experiences: List[ResumeProfessionalExperience]
+    education: List[ResumeEducation]
+    projects: List[ResumeProject]
+    skills: List[ResumeSkill]
+    achievements: List[ResumeAchievement]
+
+
+# ==================== Resume PDF Generation Helper Functions ====================
+
+def escape_latex(text: str) -> str:
+    """
+    Escape special LaTeX characters in user input.
+
+    Args:
+        text: Raw text string from user input
+
+    Returns:
+        LaTeX-safe string with special characters escaped
+
+    Escapes: & % $ # _ { } ~ ^ \ |
+    """
+    if not text:
+        return ""
+
+    # Order matters! Escape backslash first
+    replacements = [
+        ('\\', r'\textbackslash{}'),
+        ('&', r'\&'),
+        ('%', r'\%'),
+        ('$', r'\$'),
+        ('#', r'\#'),
+        ('_', r'\_'),
+        ('{', r'\{'),
+        ('}', r'\}'),
+        ('~', r'\textasciitilde{}'),
+        ('^', r'\textasciicircum{}'),
+        ('|', r'\textbar{}'),
+    ]
+
+    result = text
+    for char, replacement in replacements:
+        result = result.replace(char, replacement)
+
+    return result
+
+
+def format_location_date(date_str: str) -> str:
+    if not date_str:
+        return ""
+    
+    # Just escape LaTeX special characters and return
+    return escape_latex(date_str)
+
+
+def build_section_professional_experience(experiences: List[ResumeProfessionalExperience]) -> str:
+    """
+    Build LaTeX for professional section.
+
+    Args:
+        experiences: List of professional experiences with nested job titles
+
+    Returns:
+        LaTeX string for complete section or empty string if no data
+    """
+    if not experiences:
+        return ""
+
+    latex = r"""\section*{Professional}
+\vspace{1pt}
+\hrule
+\vspace{3pt}
+
+"""
+
+    for i, exp in enumerate(experiences):
+        company = escape_latex(exp.company)
+
+        for job_title in exp.jobTitles:
+            title = escape_latex(job_title.title)
+            # Format location and date: "Location | Date1 - Date2"
+            date = format_location_date(job_title.date)
+
+            # Add space gap above company name if it's not the first company
+            if i > 0:
+                latex += "\\vspace{4pt}\n"
+            
+            # Company name on its own row (always start on new line)
+            latex += f"\n\\textbf{{{company}}} \\\\\n"
+            # Job title with location/date on the right side
+            latex += f"\\textbf{{\\textit{{{title}}}}} \\hfill \\textit{{{date}}}\n"
+
+            if job_title.bullets:
+                # Track if we're inside an itemize environment and current project name
+                in_itemize = False
+                current_project_name = None
+                is_first_project = True
+                
+                # Get project technologies mapping if available
+                project_tech_map = job_title.projectTechnologies or {}
+                
+                for bullet in job_title.bullets:
+                    escaped_bullet = escape_latex(bullet)
+                    # Check if bullet starts with project name prefix (handle both escaped and unescaped)
+                    if bullet.startswith("__PROJECT_NAME__:") or escaped_bullet.startswith("__PROJECT\\_NAME__:"):
+                        # Close any open itemize and add technologies for previous project
+                        if in_itemize:
+                            latex += r"\end{itemize}" + "\n"
+                            # Add technologies for the previous project if available
+                            if current_project_name and current_project_name in project_tech_map:
+                                tech_list = project_tech_map[current_project_name]
+                                if tech_list:
+                                    if isinstance(tech_list, list):
+                                        tech_str = ", ".join([escape_latex(str(t)) for t in tech_list])
+                                    else:
+                                        tech_str = escape_latex(str(tech_list))
+                                    # Technologies with space gap below (with 2-character indentation)
+                                    latex += f"\\hspace{{1em}}\\textit{{Technologies: {tech_str}}}\n"
+                                    latex += "\\vspace{3pt}\n"
+                            in_itemize = False
+                        # Remove prefix and render as non-bold project name on its own row (always start on new line)
+                        current_project_name = bullet.replace("__PROJECT_NAME__:", "").strip()
+                        escaped_project_name = escape_latex(current_project_name)
+                        # Add 2-character indentation for project name
+                        latex += f"\n\\hspace{{1em}}{escaped_project_name}\n"
+                        is_first_project = False
+                    else:
+                        # Start itemize if not already in one
+                        if not in_itemize:
+                            # Increase leftmargin by 2 characters (0.2in) for indentation
+                            latex += r"\begin{itemize}[leftmargin=0.3in, itemsep=0pt, parsep=0pt, topsep=0pt]" + "\n"
+                            in_itemize = True
+                        latex += f"    \\item {escaped_bullet}\n"
+                
+                # Close itemize if still open and add technologies for last project
+                if in_itemize:
+                    latex += r"\end{itemize}" + "\n"
+                    # Add technologies for the last project if available
+                    if current_project_name and current_project_name in project_tech_map:
+                        tech_list = project_tech_map[current_project_name]
+                        if tech_list:
+                            if isinstance(tech_list, list):
+                                tech_str = ", ".join([escape_latex(str(t)) for t in tech_list])
+                            else:
+                                tech_str = escape_latex(str(tech_list))
+                            # Technologies with space gap below (with 2-character indentation)
+                            latex += f"\\hspace{{1em}}\\textit{{Technologies: {tech_str}}}\n"
+                            latex += "\\vspace{3pt}\n"
+
+    return latex
+
+
+def build_section_education(education_list: List[ResumeEducation]) -> str:
+    """
+    Build LaTeX for education section.
+
+    Args:
+        education_list: List of education entries with nested degrees
+
+    Returns:
+        LaTeX string for complete section or empty string if no data
+    """
+    if not education_list:
+        return ""
+
+    latex = r"""\section*{Education}
+\vspace{1pt}
+\hrule
+\vspace{3pt}
+
+"""
+
+    for i, edu in enumerate(education_list):
+        university = escape_latex(edu.university)
+        # Format location and date: "Location | Date1 - Date2"
+        date = format_location_date(edu.date)
+
+        # Add spacing between universities (except first)
+        if i > 0:
+            latex += "\\vspace{2pt}\n"
+
+        # University name with location/duration on its own row (always start from beginning of row)
+        latex += f"\n\\textbf{{{university}}} \\hfill \\textit{{{date}}} \\\\\n"
+
+        for j, degree in enumerate(edu.degrees):
+            degree_name = escape_latex(degree.degree)
+            description = escape_latex(degree.description)
+
+            # Degree name on its own row
+            latex += f"\\textit{{{degree_name}}} \\\\\n"
+            # Description on a new separate row from the beginning
+            if description:
+                latex += f"{description} \\\\\n"
+
+    return latex
+
+
+def build_section_projects(projects: List[ResumeProject]) -> str:
+    """
+    Build LaTeX for project experience section.
+
+    Args:
+        projects: List of projects (already filtered on frontend)
+
+    Returns:
+        LaTeX string for complete section or empty string if no data
+    """
+    if not projects:
+        return ""
+
+    latex = r"""\section*{Project Experience}
+\vspace{1pt}
+\hrule
+\vspace{3pt}
+
+"""
+
+    for i, project in enumerate(projects):
+        name = escape_latex(project.name)
+        # Format location and date: "Location | Date1 - Date2"
+        date = format_location_date(project.date)
+
+        # Add small spacing above each project name (except first)
+        if i > 0:
+            latex += "\\vspace{4pt}\n"
+        
+        # Project name (bold, same style as university) with location/duration on its own row (always start on new line)
+        latex += f"\n\\textbf{{{name}}} \\hfill \\textit{{{date}}}\n"
+
+        # Bullet points
+        if project.bullets:
+            latex += r"\begin{itemize}[leftmargin=0.2in, itemsep=0pt, parsep=0pt, topsep=0pt]" + "\n"
+            for bullet in project.bullets:
+                latex += f"    \\item {escape_latex(bullet)}\n"
+            latex += r"\end{itemize}" + "\n"
+
+        # Technologies at the bottom for each project with space gap below
+        if project.technologies:
+            tech_str = ", ".join([escape_latex(t) for t in project.technologies])
+            latex += f"\\textit{{Technologies: {tech_str}}}\n"
+            latex += "\\vspace{3pt}\n"
+
+    return latex
+
+
+def build_section_skills(skills: List[ResumeSkill]) -> str:
+    """
+    Build LaTeX for technical skills section.
+
+    Args:
+        skills: List of skill categories with keywords
+
+    Returns:
+        LaTeX string for complete section or empty string if no data
+    """
+    if not skills:
+        return ""
+
+    latex = r"""\section*{Technical Skills}
+\vspace{1pt}
+\hrule
+\vspace{3pt}
+
+"""
+
+    for skill in skills:
+        topic = escape_latex(skill.topic)
+        keywords = escape_latex(skill.keywords)
+
+        latex += f"\\textbf{{{topic}}}: {keywords} \\\\\n"
+
+    return latex
+
+
+def build_section_achievements(achievements: List[ResumeAchievement]) -> str:
+    """
+    Build LaTeX for achievements section.
+
+    Args:
+        achievements: List of achievements/awards
+
+    Returns:
+        LaTeX string for complete section or empty string if no data
+    """
+    if not achievements:
+        return ""
+
+    latex = r"""\section*{Achievements}
+\vspace{1pt}
+\hrule
+\vspace{3pt}
+
+"""
+
+    latex += r"\begin{itemize}[leftmargin=0.2in, itemsep=0pt, parsep=0pt, topsep=0pt]" + "\n"
+    for achievement in achievements:
+        value = escape_latex(achievement.value)
+        latex += f"    \\item {value}\n"
+    latex += r"\end{itemize}" + "\n"
+
+    return latex
+
+
+def generate_latex_content(resume_data: GenerateResumePDFRequest) -> str:
+    """
+    Generate complete LaTeX document from resume data.
+
+    Args:
+        resume_data: Validated Pydantic model with resume information
+
+    Returns:
+        Complete LaTeX document as string
+
+    Features:
+        - Conditionally includes sections only if data exists
+        - Escapes all user input
+        - Applies ATS-optimized formatting
+        - Dynamic spacing based on content volume
+    """
+    # Calculate content density for spacing adjustments
+    total_items = (
+        len(resume_data.professional_experiences) +
+        len(resume_data.education) +
+        len(resume_data.projects) +
+        len(resume_data.skills) +
+        len(resume_data.achievements)
+    )
+
+    # Adjust spacing based on content density - optimized for single page
+    if total_items > 25:  # Dense resume
+        margin = "0.4in"
+        line_spacing = "0.9"
+    elif total_items > 15:  # Normal resume
+        margin = "0.45in"
+        line_spacing = "0.92"
+    else:  # Sparse resume
+        margin = "0.5in"
+        line_spacing = "0.95"
+
+    # Build contact information
+    # Process each contact field with exact field name (label) and field data (value)
+    # Use \mbox{} to keep each field name and field data on the same row
+    contact_parts = []
+    for contact in resume_data.contact:
+        label = escape_latex(contact.label)
+        value = escape_latex(contact.value)
+
+        # Check if value is a URL (for LinkedIn, GitHub, etc.)
+        if contact.value.startswith(('http://', 'https://', 'www.')):
+            # Use href for clickable links (show label: URL)
+            # Wrap in \mbox{} to keep field name and URL on same row
+            contact_parts.append(f"\\mbox{{{label}: \\href{{{contact.value}}}{{{value}}}}}")
+        else:
+            # For non-URL fields, also include the label (field name) with the value (field data)
+            # Format: "Field Name: Field Data"
+            # Wrap in \mbox{} to keep field name and field data on same row
+            contact_parts.append(f"\\mbox{{{label}: {value}}}")
+
+    # Join contact fields with LaTeX \quad spacing (about 3 spaces)
+    # LaTeX collapses regular spaces, so we use \quad for explicit spacing
+    contact_line = " \\quad ".join(contact_parts)
+
+    # Start building the LaTeX document. The fixed preamble comes first so the
+    # compile engine can load it from a precompiled format
+    latex = latex_engine.RESUME_PREAMBLE + f"""\\geometry{{margin={margin}, top=0.3in, bottom=0.3in}}
+\\usepackage[hidelinks]{{hyperref}}
+
+% Disable page numbers
+\\pagestyle{{empty}}
+
+% Reduce spacing for compact layout
+\\setlength{{\\parindent}}{{0pt}}
+\\setlength{{\\parskip}}{{0pt}}
+\\setlength{{\\topsep}}{{0pt}}
+\\setlength{{\\partopsep}}{{0pt}}
+\\setlist{{nosep, leftmargin=0.2in, topsep=0pt, partopsep=0pt, itemsep=0pt}}
+\\setstretch{{{line_spacing}}}
+
+% Reduce section spacing (before and after sections)
+\\titlespacing*{{\\section}}{{0pt}}{{4pt}}{{1pt}}
+
+% Hyperref setup - black links for ATS
+\\hypersetup{{
+    colorlinks=true,
+    linkcolor=black,
+    urlcolor=black,
+    citecolor=black
+}}
+
+\\begin{{document}}
+
+\\vspace{{-8pt}}
+
+% NAME (centered, large)
+\\begin{{center}}
+    {{\\Large\\textbf{{{escape_latex(resume_data.name)}}}}}
+\\end{{center}}
+
+\\vspace{{4pt}}
+
+% CONTACT INFO (centered, max 80% width)
+\\begin{{center}}
+    \\begin{{minipage}}{{0.85\\textwidth}}
+        \\centering
+        \\small {contact_line}
+    \\end{{minipage}}
+\\end{{center}}
+
+\\vspace{{4pt}}
+
+"""
+
+    # Add sections (only if they have content)
+    latex += build_section_professional_experience(resume_data.professional_experiences)
+    latex += build_section_education(resume_data.education)
+    latex += build_section_projects(resume_data.projects)
+    latex += build_section_skills(resume_data.skills)
+    latex += build_section_achievements(resume_data.achievements)
+
+    # Close document
+    latex += "\\end{document}\n"
+
+    return latex
+
+
+def compile_latex_to_pdf(latex_content: str, output_dir: str) -> str:
+    """
+    Compile LaTeX content to PDF using pdflatex (see latex_engine).
+
+    Args:
+        latex_content: Complete LaTeX document string
+        output_dir: Directory for temporary files (e.g., /tmp/resume_xyz)
+
+    Returns:
+        Path to generated PDF file
+
+    Raises:
+        RuntimeError: If pdflatex compilation fails
+    """
+    return latex_engine.compile_pdf(latex_content, output_dir)
+
+
+def cleanup_temp_files(directory: str) -> None:
+    """
+    Clean up temporary files created during PDF generation.
+
+    Args:
+        directory: Path to temporary directory to remove
+
+    Purpose:
+        Critical for Lambda to avoid /tmp/ space exhaustion
+        Removes .tex, .aux, .log, .out files and directory
+    """
+    try:
+        if os.path.exists(directory):
+            shutil.rmtree(directory)
+            logger.info(f"Cleaned up temp directory: {directory}")
+    except Exception as e:
+        # Log but don't raise - cleanup failure shouldn't break response
+        logger.warning(f"Failed to cleanup {directory}: {str(e)}")
+
+
+@router.post("/generate_resume_pdf")
+async def generate_resume_pdf(request: GenerateResumePDFRequest):
+    """
+    Generate ATS-optimized resume PDF from structured data.
+
+    Accepts JSON with resume information and returns PDF file.
+    Frontend sends only selected projects based on knowledge scope.
+
+    Identical documents are served from pdf_render_cache without compiling;
+    the download still counts towards the plan limit.
+
+    Returns:
+        PDF file as an attachment
+    """
+    request_id = str(uuid.uuid4())
+    temp_dir = os.path.join(latex_engine.compile_root(), f"resume_{request_id}")
+
+    try:
+        # Check plan limit and increment download_count in one atomic call
+        quota = await consume_quota(request.user_id, usage_quota.DOWNLOAD)
+        if not quota.allowed:
+            return JSONResponse(content={
+                "status": "error",
+                "error_code": "DOWNLOAD_LIMIT_EXCEEDED",
+                "message": "Free plan download limit reached."
+            })
+
+        logger.info(f"PDF generation request for: {request.name}")
+        logger.info(f"Sections: exp={len(request.professional_experiences)}, "
+                   f"edu={len(request.education)}, proj={len(request.projects)}, "
+                   f"skills={len(request.skills)}, achievements={len(request.achievements)}")
+
+        # 1. Generate LaTeX content
+        latex_content = generate_latex_content(request)
+        logger.info("LaTeX content generated successfully")
+
+        # 2. Reuse the PDF of an identical document, or compile it
+        cache_key = pdf_render_cache.render_key(latex_content)
+        pdf_bytes = await pdf_render_cache.get(cache_key)
+        if pdf_bytes is None:
+            pdf_path = compile_latex_to_pdf(latex_content, temp_dir)
+            with open(pdf_path, 'rb') as f:
+                pdf_bytes = f.read()
+            pdf_render_cache.put(cache_key, pdf_bytes)
+            cleanup_temp_files(temp_dir)
+        else:
+            logger.info(f"Serving cached PDF render: {cache_key}")
+
+        # 3. Return PDF
+        safe_filename = request.name.replace(' ', '_').replace('/', '_')
+        return Response(
+            content=pdf_bytes,
+            media_type="application/pdf",
+            headers={"Content-Disposition": f'attachment; filename="{safe_filename}_Resume.pdf"'}
+        )
+
+    except Exception as e:
+        logger.error(f"Error generating PDF: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
+        cleanup_temp_files(temp_dir)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error generating resume PDF: {str(e)}"
+        )
+
+
+@router.post("/generate_resume_tex")
+async def generate_resume_tex(request: GenerateResumePDFRequest):
+    """Return the LaTeX .tex source file used to generate the resume PDF."""
+    try:
+        quota = await consume_quota(request.user_id, usage_quota.DOWNLOAD)
+        if not quota.allowed:
+            return JSONResponse(content={"status": "error",
+                                         "error_code": "DOWNLOAD_LIMIT_EXCEEDED",
+                                         "message": "Free plan download limit reached."})
+
+        latex_content = generate_latex_content(request)
+        safe_filename = request.name.replace(' ', '_').replace('/', '_')
+
+        return Response(
+            content=latex_content.encode('utf-8'),
+            media_type="application/x-tex",
+            headers={"Content-Disposition": f'attachment; filename="{safe_filename}_Resume.tex"'}
+        )
+    except Exception as e:
+        logger.error(f"Error generating resume .tex: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Error generating resume .tex: {str(e)}")
+
+
+# ── Resume Sanity Check ──────────────────────────────────────────────────────
+
+class SanityContactField(BaseModel):
+    label: str
+    value: str
+
+
+class SanityJobTitle(BaseModel):
+    title: str
+    date: str
+    bullets: List[str]
+
+
+class SanityExperience(BaseModel):
+    company: str
+    job_titles: List[SanityJobTitle]
+
+
+class SanityDegree(BaseModel):
+    degree: str
+    description: str
+
+
+class SanityEducation(BaseModel):
+    university: str
+    date: str
+    degrees: List[SanityDegree]
+
+
+class SanityProject(BaseModel):
+    name: str
+    date: str
+    description: str
+    bullets: List[str]
+    technologies: List[str] = []
+
+
+class SanitySkill(BaseModel):
+    topic: str
+    keywords: str
+
+
+class ResumeSanityCheckRequest(BaseModel):
+    name: str
+    contact_fields: List[SanityContactField]
+    professional_experiences: List[SanityExperience]
+    education: List[SanityEducation]
+    projects_established: List[SanityProject]
+    projects_expanding: List[SanityProject]
+    skills: List[SanitySkill]
+
+
+class SanityIssue(BaseModel):
+    rule: str
+    severity: str
+    message: str
+
+
+class SanitySemanticIssues(BaseModel):
+    issues: List[SanityIssue]
+
+
+async def _semantic_sanity_issues(req: ResumeSanityCheckRequest, llm) -> List[Dict[str, str]]:
+    """H6 / H16 / H17 need judgement; everything else is checked by resume_sanity."""
+    if not resume_sanity.iter_sentences(req):
+        return []
+
+    parsed = await cached_parse(
+        llm, "resume_sanity_check:semantic",
+        model="gpt-4o-mini",
+        input=[
+            {"role": "system", "content": resume_sanity.SEMANTIC_RULES_PROMPT},
+            {"role": "user", "content": f"Resume excerpt:\n{resume_sanity.format_for_semantic_check(req)}"},
+        ],
+        text_format=SanitySemanticIssues,
+    )
+    return [
+        {"rule": issue.rule, "severity": "High", "message": issue.message}
+        for issue in parsed.issues
+        if issue.rule in resume_sanity.SEMANTIC_RULES and issue.message.strip()
+    ]
+
+
+def _to_ordinal(n: int) -> str:
+    if 11 <= (n % 100) <= 13:
+        return f"{n}th"
+    return f"{n}" + {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+
+
+@router.post("/resume-sanity-check")
+async def resume_sanity_check(request: ResumeSanityCheckRequest, llm=Depends(llm_client)):
+    try:
+        issues = resume_sanity.run_local_rules(request)
+
+        try:
+            issues.extend(await _semantic_sanity_issues(request, llm))
+        except Exception as e:
+            logger.warning(f"Semantic sanity rules skipped: {str(e)}")
+
+        formatted = [
+            {
+                "severity": issue["severity"],
+                "ordinal": _to_ordinal(i + 1),
+                "message": issue["message"],
+            }
+            for i, issue in enumerate(resume_sanity.sort_issues(issues))
+        ]
+
+        return {"issues": formatted, "matched_count": len(formatted)}
+
+    except Exception as e:
+        logger.error(f"Error in resume_sanity_check: {str(e)}")
+        import traceback
+        logger.error(traceback.format_exc())
+        raise HTTPException(status_code=500, detail=f"Error processing sanity check: {str(e)}")
@@ -0,0 +1,545 @@
+"""
+Account, profile and knowledge (established and expanding) reads and updates.
+"""
+from datetime import datetime
+
+from aws_lambda_powertools import Logger
+from fastapi import APIRouter, HTTPException, Request
+
+import app_data_repository as app_data
+
+logger = Logger()
+router = APIRouter()
+RESOURCES = ('dynamodb',)
+
+
+# ambitology
+@router.post("/user_authentication")
+async def user_authentication(request: Request):
+    """
+    Authenticate and register user in DynamoDB after Cognito login.
+    Creates user record if not exists, returns success if already exists.
+    
+    Single-Table Design:
+    - PK: Cognito subID (user identifier)
+    - SK: Section key (METADATA, PROFILE#*, KNOWLEDGE#*, RESUME#*, ANALYSIS#*)
+    - GSI1PK: EMAIL#<email> for email-based lookups
+    - GSI1SK: User ID for GSI sorting
+    """
+    try:
+        logger.info("Received user authentication request")
+        
+        # Parse request body
+        body = await request.json()
+        cognito_sub = body.get('cognito_sub', '').strip()
+        email = body.get('email', '').strip()
+        
+        if not cognito_sub:
+            raise HTTPException(status_code=400, detail="cognito_sub is required")
+        
+        if not email:
+            raise HTTPException(status_code=400, detail="email is required")
+        
+        # Table existence is verified once per container
+        await app_data.ensure_table()
+
+        timestamp = datetime.now().isoformat()
+
+        # Check if user already exists
+        if await app_data.get_metadata(cognito_sub):
+            # User already exists, update last login
+            logger.info(f"User {cognito_sub} already exists, updating last login")
+            await app_data.touch_last_login(cognito_sub, timestamp)
+
+            return {
+                "status": "success",
+                "message": "User authenticated successfully",
+                "user_id": cognito_sub,
+                "is_new_user": False
+            }
+
+        # User doesn't exist, create METADATA, SUBSCRIPTION and USAGE records.
+        # The METADATA put is conditional to protect against concurrent registration.
+        logger.info(f"Creating new user record for {cognito_sub}")
+        if await app_data.create_user(cognito_sub, email, timestamp):
+            logger.info(f"Successfully created user, subscription and usage records for {cognito_sub}")
+            return {
+                "status": "success",
+                "message": "User registered successfully",
+                "user_id": cognito_sub,
+                "is_new_user": True
+            }
+
+        # User was created by another request, treat as existing user
+        logger.info(f"User {cognito_sub} was created by concurrent request")
+        return {
+            "status": "success",
+            "message": "User authenticated successfully",
+            "user_id": cognito_sub,
+            "is_new_user": False
+        }
+        
+    except HTTPException as http_err:
+        logger.error(f"HTTP error in user_authentication: {http_err.status_code} - {http_err.detail}")
+        raise
+    except Exception as e:
+        import traceback
+        error_traceback = traceback.format_exc()
+        logger.error(f"Unexpected error in user_authentication: {str(e)}")
+        logger.error(f"Error type: {type(e).__name__}")
+        logger.error(f"Full traceback: {error_traceback}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+# ambitology
+@router.get("/get_profile/{cognito_sub}")
+async def get_profile(cognito_sub: str):
+    """
+    Retrieve user profile data from DynamoDB.
+    
+    Single-Table Design:
+    - PK: Cognito subID (user identifier)
+    - SK: PROFILE#MAIN
+    
+    Returns profile data structure:
+    - careerFocus: string
+    - basicInfo: { firstName, middleName, lastName, email, phone, 
+                   addressStreet, addressState, addressZip,
+                   personalWebsite, linkedin, links[] }
+    - education: [                          # List of college objects
+        { id, collegeName, degrees: [
+            { id, degree, major, startMonth, startYear, endMonth, endYear, isPresent }
+        ]}
+      ]
+    - professional: {
+        companies: [                        # List of company objects
+            { id, companyName, jobTitle, startMonth, startYear, endMonth, endYear, isPresent }
+        ],
+        achievements: [                     # List of achievement objects
+            { id, type, value }
+        ]
+      }
+    """
+    try:
+        logger.info(f"Received get profile request for user: {cognito_sub}")
+        
+        if not cognito_sub or not cognito_sub.strip():
+            raise HTTPException(status_code=400, detail="cognito_sub is required")
+        
+        cognito_sub = cognito_sub.strip()
+        
+        # Get profile from DynamoDB
+        item = await app_data.get_profile(cognito_sub)
+        
+        if item is None:
+            # No profile found, return empty profile structure
+            logger.info(f"No profile found for user {cognito_sub}")
+            return {
+                "status": "success",
+                "profile_exists": False,
+                "data": None
+            }
+        
+        # Profile found, extract and return data
+        profile_data = item.get('data', {})
+        
+        logger.info(f"Successfully retrieved profile for user {cognito_sub}")
+        
+        return {
+            "status": "success",
+            "profile_exists": True,
+            "data": {
+                "careerFocus": profile_data.get('careerFocus', ''),
+                "basicInfo": profile_data.get('basicInfo', {}),
+                "education": profile_data.get('education', []),
+                "professional": profile_data.get('professional', {})
+            },
+            "createdAt": item.get('createdAt'),
+            "updatedAt": item.get('updatedAt')
+        }
+        
+    except HTTPException as http_err:
+        logger.error(f"HTTP error in get_profile: {http_err.status_code} - {http_err.detail}")
+        raise
+    except Exception as e:
+        import traceback
+        error_traceback = traceback.format_exc()
+        logger.error(f"Unexpected error in get_profile: {str(e)}")
+        logger.error(f"Error type: {type(e).__name__}")
+        logger.error(f"Full traceback: {error_traceback}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+# ambitology
+@router.post("/profile_update")
+async def profile_update(request: Request):
+    """
+    Update user profile data in DynamoDB.
+    
+    Single-Table Design:
+    - PK: Cognito subID (user identifier)
+    - SK: PROFILE#MAIN
+    
+    Data Structure:
+    - careerFocus: string
+    - basicInfo: { firstName, middleName, lastName, email, phone, 
+                   addressStreet, addressState, addressZip,
+                   personalWebsite, linkedin, links[] }
+    - education: [                          # List of college objects
+        { id, collegeName, location, degrees: [
+            { id, degree, major, startMonth, startYear, endMonth, endYear, coursework }
+        ]}
+      ]
+    - professional: {
+        companies: [                        # List of company objects
+            { id, companyName, jobTitle, startMonth, startYear, endMonth, endYear, isPresent, location }
+        ],
+        achievements: [                     # List of achievement objects
+            { id, type, value }
+        ]
+      }
+    """
+    try:
+        logger.info("Received profile update request")
+        
+        # Parse request body
+        body = await request.json()
+        cognito_sub = body.get('cognito_sub', '').strip()
+        
+        if not cognito_sub:
+            raise HTTPException(status_code=400, detail="cognito_sub is required")
+        
+        # Extract profile data
+        career_focus = body.get('careerFocus', '')
+        basic_info = body.get('basicInfo', {})
+        education = body.get('education', [])
+        professional = body.get('professional', {})
+        
+        # Create timestamp
+        timestamp = datetime.now().isoformat()
+
+        # Single upsert: updates the existing profile or creates it if absent
+        is_new_profile = await app_data.save_profile(
+            cognito_sub,
+            {
+                'careerFocus': career_focus,
+                'basicInfo': basic_info,
+                'education': education,
+                'professional': professional
+            },
+            timestamp,
+        )
+
+        if is_new_profile:
+            logger.info(f"Successfully created profile record for {cognito_sub}")
+        else:
+            logger.info(f"Updated existing profile for user {cognito_sub}")
+
+        return {
+            "status": "success",
+            "message": "Profile created successfully" if is_new_profile else "Profile updated successfully",
+            "user_id": cognito_sub,
+            "is_new_profile": is_new_profile
+        }
+        
+    except HTTPException as http_err:
+        logger.error(f"HTTP error in profile_update: {http_err.status_code} - {http_err.detail}")
+        raise
+    except Exception as e:
+        import traceback
+        error_traceback = traceback.format_exc()
+        logger.error(f"Unexpected error in profile_update: {str(e)}")
+        logger.error(f"Error type: {type(e).__name__}")
+        logger.error(f"Full traceback: {error_traceback}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+# ambitology
+@router.post("/established_knowledge_update")
+async def established_knowledge_update(request: Request):
+    """
+    Update user knowledge data in DynamoDB.
+
+    Single-Table Design:
+    - PK: Cognito subID (user identifier)
+    - SK: KNOWLEDGE#ESTABLISHED#<career_focus>  (one item per career focus)
+
+    Data Structure (stored flat per item, fully isolated by career focus):
+    - personal_project: Array of personal project objects with selectedTechnologies[], selectedFrameworks[]
+    - professional_project: Array of professional project objects with selectedTechnologies[], selectedFrameworks[]
+    - technical_skills: { selectedSkills[], customKeywords: Record<str, str[]>, customLayers: [...] }
+    - custom_keywords: Record<sectionName, str[]>  — custom technology keyword options
+    - custom_framework_keywords: Record<sectionName, str[]>  — custom framework keyword options
+    """
+    try:
+        logger.info("Received knowledge update request")
+
+        # Parse request body
+        body = await request.json()
+        cognito_sub = body.get('cognito_sub', '').strip()
+
+        if not cognito_sub:
+            raise HTTPException(status_code=400, detail="cognito_sub is required")
+
+        # Extract knowledge data
+        career_focus = body.get('career_focus', 'software-engineering').strip() or 'software-engineering'
+        personal_project = body.get('personal_project', [])
+        professional_project = body.get('professional_project', [])
+        technical_skills = body.get('technical_skills', {})
+        custom_keywords = body.get('custom_keywords', {})
+        custom_framework_keywords = body.get('custom_framework_keywords', {})
+
+        # Each career focus gets its own DynamoDB item (SK KNOWLEDGE#ESTABLISHED#<career_focus>)
+        timestamp = datetime.now().isoformat()
+
+        # Flat data payload — no career-focus nesting needed (SK already scopes it)
+        knowledge_data = {
+            'personal_project': personal_project,
+            'professional_project': professional_project,
+            'technical_skills': technical_skills,
+            'custom_keywords': custom_keywords,
+            'custom_framework_keywords': custom_framework_keywords,
+        }
+
+        # Single upsert: updates the existing item or creates it if absent
+        is_new_record = await app_data.save_knowledge(
+            cognito_sub, app_data.KNOWLEDGE_ESTABLISHED, career_focus, knowledge_data, timestamp
+        )
+        logger.info(
+            f"{'Created' if is_new_record else 'Updated'} established knowledge for user {cognito_sub} (career_focus={career_focus})"
+        )
+
+        return {
+            "status": "success",
+            "message": "Knowledge created successfully" if is_new_record else "Knowledge updated successfully",
+            "user_id": cognito_sub,
+            "is_new_record": is_new_record
+        }
+
+    except HTTPException as http_err:
+        logger.error(f"HTTP error in knowledge_update: {http_err.status_code} - {http_err.detail}")
+        raise
+    except Exception as e:
+        import traceback
+        error_traceback = traceback.format_exc()
+        logger.error(f"Unexpected error in knowledge_update: {str(e)}")
+        logger.error(f"Error type: {type(e).__name__}")
+        logger.error(f"Full traceback: {error_traceback}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+# ambitology
+@router.get("/get_knowledge/{cognito_sub}")
+async def get_knowledge(cognito_sub: str, career_focus: str = 'software-engineering'):
+    """
+    Retrieve user established knowledge data from DynamoDB.
+
+    Single-Table Design:
+    - PK: Cognito subID (user identifier)
+    - SK: KNOWLEDGE#ESTABLISHED#<career_focus>  (one item per career focus)
+
+    Backward-compatibility: also checks the legacy SK 'KNOWLEDGE#ESTABLISHED' for users
+    who had data before career-focus isolation was introduced.
+    """
+    try:
+        logger.info(f"Received get knowledge request for user: {cognito_sub}, career_focus: {career_focus}")
+
+        if not cognito_sub or not cognito_sub.strip():
+            raise HTTPException(status_code=400, detail="cognito_sub is required")
+
+        cognito_sub = cognito_sub.strip()
+        career_focus = (career_focus or 'software-engineering').strip() or 'software-engineering'
+
+        def _build_response(knowledge_data: dict, item: dict) -> dict:
+            return {
+                "status": "success",
+                "knowledge_exists": True,
+                "data": {
+                    "personal_project": knowledge_data.get('personal_project', []),
+                    "professional_project": knowledge_data.get('professional_project', []),
+                    "technical_skills": knowledge_data.get('technical_skills', {}),
+                    "custom_keywords": knowledge_data.get('custom_keywords', {}),
+                    "custom_framework_keywords": knowledge_data.get('custom_framework_keywords', {}),
+                },
+                "createdAt": item.get('createdAt'),
+                "updatedAt": item.get('updatedAt'),
+            }
+
+        # 1. Try the career-focus-specific item (new format)
+        item = await app_data.get_knowledge(cognito_sub, app_data.KNOWLEDGE_ESTABLISHED, career_focus)
+        if item:
+            logger.info(f"Found career-focus-specific knowledge for user {cognito_sub} (career_focus={career_focus})")
+            return _build_response(item.get('data', {}), item)
+
+        # 2. Backward-compatibility: check legacy item SK = 'KNOWLEDGE#ESTABLISHED'
+        if career_focus == 'software-engineering':
+            legacy_item = await app_data.get_knowledge(cognito_sub, app_data.KNOWLEDGE_ESTABLISHED)
+            if legacy_item:
+                raw_data = legacy_item.get('data', {})
+                # Flat format (original legacy) — data is at the top level
+                if 'personal_project' in raw_data or 'professional_project' in raw_data or 'technical_skills' in raw_data:
+                    logger.info(f"Returning legacy flat-format knowledge for user {cognito_sub}")
+                    return _build_response(raw_data, legacy_item)
+                # Nested format (interim migration) — data is under career-focus key
+                cf_data = raw_data.get('software-engineering', {})
+                if cf_data:
+                    logger.info(f"Returning legacy nested-format knowledge for user {cognito_sub}")
+                    return _build_response(cf_data, legacy_item)
+
+        logger.info(f"No knowledge found for user {cognito_sub} (career_focus={career_focus})")
+        return {"status": "success", "knowledge_exists": False, "data": None}
+
+    except HTTPException as http_err:
+        logger.error(f"HTTP error in get_knowledge: {http_err.status_code} - {http_err.detail}")
+        raise
+    except Exception as e:
+        import traceback
+        error_traceback = traceback.format_exc()
+        logger.error(f"Unexpected error in get_knowledge: {str(e)}")
+        logger.error(f"Error type: {type(e).__name__}")
+        logger.error(f"Full traceback: {error_traceback}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+# ambitology
+@router.post("/expanding_knowledge_update")
+async def expanding_knowledge_update(request: Request):
+    """
+    Update user expanding knowledge data in DynamoDB.
+
+    Single-Table Design:
+    - PK: Cognito subID (user identifier)
+    - SK: KNOWLEDGE#EXPANDING#<career_focus>  (one item per career focus)
+
+    Data stored flat per item (fully isolated by career focus):
+    - future_personal_project, future_professional_project, future_technical_skills
+    - custom_future_keywords, custom_future_framework_keywords
+    """
+    try:
+        logger.info("Received expanding knowledge update request")
+
+        # Parse request body
+        body = await request.json()
+        cognito_sub = body.get('cognito_sub', '').strip()
+
+        if not cognito_sub:
+            raise HTTPException(status_code=400, detail="cognito_sub is required")
+
+        # Extract expanding knowledge data
+        career_focus = body.get('career_focus', 'software-engineering').strip() or 'software-engineering'
+        future_personal_project = body.get('future_personal_project', [])
+        future_professional_project = body.get('future_professional_project', [])
+        future_technical_skills = body.get('future_technical_skills', {})
+        custom_future_keywords = body.get('custom_future_keywords', {})
+        custom_future_framework_keywords = body.get('custom_future_framework_keywords', {})
+
+        # Each career focus gets its own DynamoDB item (SK KNOWLEDGE#EXPANDING#<career_focus>)
+        timestamp = datetime.now().isoformat()
+
+        # Flat data payload — no career-focus nesting needed (SK already scopes it)
+        expanding_data = {
+            'future_personal_project': future_personal_project,
+            'future_professional_project': future_professional_project,
+            'future_technical_skills': future_technical_skills,
+            'custom_future_keywords': custom_future_keywords,
+            'custom_future_framework_keywords': custom_future_framework_keywords,
+        }
+
+        # Single upsert: updates the existing item or creates it if absent
+        is_new_record = await app_data.save_knowledge(
+            cognito_sub, app_data.KNOWLEDGE_EXPANDING, career_focus, expanding_data, timestamp
+        )
+        logger.info(
+            f"{'Created' if is_new_record else 'Updated'} expanding knowledge for user {cognito_sub} (career_focus={career_focus})"
+        )
+
+        return {
+            "status": "success",
+            "message": "Expanding knowledge created successfully" if is_new_record else "Expanding knowledge updated successfully",
+            "user_id": cognito_sub,
+            "is_new_record": is_new_record
+        }
+
+    except HTTPException as http_err:
+        logger.error(f"HTTP error in expanding_knowledge_update: {http_err.status_code} - {http_err.detail}")
+        raise
+    except Exception as e:
+        import traceback
+        error_traceback = traceback.format_exc()
+        logger.error(f"Unexpected error in expanding_knowledge_update: {str(e)}")
+        logger.error(f"Error type: {type(e).__name__}")
+        logger.error(f"Full traceback: {error_traceback}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+
+
+# ambitology
+@router.get("/get_expanding_knowledge/{cognito_sub}")
+async def get_expanding_knowledge(cognito_sub: str, career_focus: str = 'software-engineering'):
+    """
+    Retrieve user expanding knowledge data from DynamoDB.
+
+    Single-Table Design:
+    - PK: Cognito subID (user identifier)
+    - SK: KNOWLEDGE#EXPANDING#<career_focus>  (one item per career focus)
+
+    Backward-compatibility: also checks the legacy SK 'KNOWLEDGE#EXPANDING' for users
+    who had data before career-focus isolation was introduced.
+    """
+    try:
+        logger.info(f"Received get expanding knowledge request for user: {cognito_sub}, career_focus: {career_focus}")
+
+        if not cognito_sub or not cognito_sub.strip():
+            raise HTTPException(status_code=400, detail="cognito_sub is required")
+
+        cognito_sub = cognito_sub.strip()
+        career_focus = (career_focus or 'software-engineering').strip() or 'software-engineering'
+
+        def _build_response(expanding_data: dict, item: dict) -> dict:
+            return {
+                "status": "success",
+                "expanding_knowledge_exists": True,
+                "data": {
+                    "future_personal_project": expanding_data.get('future_personal_project', []),
+                    "future_professional_project": expanding_data.get('future_professional_project', []),
+                    "future_technical_skills": expanding_data.get('future_technical_skills', {}),
+                    "custom_future_keywords": expanding_data.get('custom_future_keywords', {}),
+                    "custom_future_framework_keywords": expanding_data.get('custom_future_framework_keywords', {}),
+                },
+                "createdAt": item.get('createdAt'),
+                "updatedAt": item.get('updatedAt'),
+            }
+
+        # 1. Try the career-focus-specific item (new format)
+        item = await app_data.get_knowledge(cognito_sub, app_data.KNOWLEDGE_EXPANDING, career_focus)
+        if item:
+            logger.info(f"Found career-focus-specific expanding knowledge for user {cognito_sub} (career_focus={career_focus})")
+            return _build_response(item.get('data', {}), item)
+
+        # 2. Backward-compatibility: check legacy item SK = 'KNOWLEDGE#EXPANDING'
+        if career_focus == 'software-engineering':
+            legacy_item = await app_data.get_knowledge(cognito_sub, app_data.KNOWLEDGE_EXPANDING)
+            if legacy_item:
+                raw_data = legacy_item.get('data', {})
+                # Flat format (original legacy)
+                if 'future_personal_project' in raw_data or 'future_professional_project' in raw_data or 'future_technical_skills' in raw_data:
+                    logger.info(f"Returning legacy flat-format expanding knowledge for user {cognito_sub}")
+                    return _build_response(raw_data, legacy_item)
+                # Nested format (interim migration)
+                cf_data = raw_data.get('software-engineering', {})
+                if cf_data:
+                    logger.info(f"Returning legacy nested-format expanding knowledge for user {cognito_sub}")
+                    return _build_response(cf_data, legacy_item)
+
+        logger.info(f"No expanding knowledge found for user {cognito_sub} (career_focus={career_focus})")
+        return {"status": "success", "expanding_knowledge_exists": False, "data": None}
+
+    except HTTPException as http_err:
+        logger.error(f"HTTP error in get_expanding_knowledge: {http_err.status_code} - {http_err.detail}")
+        raise
+    except Exception as e:
+        import traceback
+        error_traceback = traceback.format_exc()
+        logger.error(f"Unexpected error in get_expanding_knowledge: {str(e)}")
+        logger.error(f"Error type: {type(e).__name__}")
+        logger.error(f"Full traceback: {error_traceback}")
+        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
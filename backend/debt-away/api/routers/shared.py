@@ -0,0 +1,194 @@
+"""
+Helpers used by more than one router: Server-Sent Events framing, resume
+upload text, web page text and the lazily imported Stripe SDK.
+"""
+import json
+
+import httpx
+from aws_lambda_powertools import Logger
+from fastapi import HTTPException, Request
+
+import http_client
+import page_cache
+import resume_text
+from config import STRIPE_SECRET_KEY
+
+logger = Logger()
+
+
+# ── Stripe ───────────────────────────────────────────────────────────────────
+
+def get_stripe():
+    """
+    The stripe module, imported on first use (it takes ~0.2 s to import, which
+    routes without payments should not pay on a cold start).
+    """
+    import stripe
+
+    if stripe.api_key is None:
+        stripe.api_key = STRIPE_SECRET_KEY
+    return stripe
+
+
+# ── Server-Sent Events ───────────────────────────────────────────────────────
+
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def wants_event_stream(request: Request, data: dict) -> bool:
+    return bool(data.get("stream")) or "text/event-stream" in request.headers.get("accept", "")
+
+
+def sse_event(event: str, payload: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+
+# ── Resume uploads ───────────────────────────────────────────────────────────
+
+async def extract_text_from_pdf(file_content: bytes) -> str:
+    """
+    Extract text content from PDF file bytes (worker thread, memoized; see resume_text)
+    """
+    return await resume_text.extract(file_content, resume_text.PDF)
+
+
+async def extract_text_from_docx(file_content: bytes) -> str:
+    """
+    Extract text content from DOCX file bytes (worker thread, memoized; see resume_text)
+    """
+    return await resume_text.extract(file_content, resume_text.DOCX)
+
+
+async def extract_text_from_resume(file_content: bytes, filename: str) -> str:
+    """
+    Extract text from resume file (PDF, DOCX, or DOC)
+    """
+    filename_lower = filename.lower()
+    
+    if filename_lower.endswith('.pdf'):
+        return await extract_text_from_pdf(file_content)
+    elif filename_lower.endswith('.docx'):
+        return await extract_text_from_docx(file_content)
+    elif filename_lower.endswith('.doc'):
+        # For .doc files, we'll try to extract as text or raise an error
+        # In production, you might want to use a library like python-docx2txt or convert DOC to DOCX
+        try:
+            return file_content.decode('utf-8', errors='ignore')
+        except:
+            raise HTTPException(status_code=400, detail="DOC file format is not fully supported. Please use PDF or DOCX format.")
+    else:
+        raise HTTPException(status_code=400, detail="Unsupported file format. Please use PDF, DOC, or DOCX.")
+        try:
+            return file_content.decode('utf-8', errors='ignore')
+        except:
+            return "Unable to extract text from file"
+
+
+# ── Web pages ────────────────────────────────────────────────────────────────
+
+def _extract_page_text(html: bytes) -> str:
+    """Strip scripts/navigation from an HTML page and return whitespace-normalized text."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    
+    # Remove script and style elements
+    for script in soup(["script", "style", "nav", "footer", "header"]):
+        script.decompose()
+    
+    # Extract text content
+    text_content = soup.get_text()
+    
+    # Clean up the text
+    lines = (line.strip() for line in text_content.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return ' '.join(chunk for chunk in chunks if chunk)
+
+
+async def fetch_web_page_content(url: str):
+    """
+    Fetch and extract text content from a web page URL.
+
+    Successful extractions are cached per URL (see page_cache). Fresh entries are
+    returned without any network call; stale entries are revalidated with a
+    conditional GET and only re-downloaded and re-parsed if the page changed.
+    """
+    try:
+        logger.info(f"Fetching web page content from: {url}")
+        
+        # Validate URL format
+        if not url.startswith(('http://', 'https://')):
+            logger.warning(f"Invalid URL format: {url}")
+            return f"Invalid URL format: {url}"
+
+        cached = page_cache.lookup(url)
+        if cached is not None and cached.is_fresh:
+            page_cache.record('fresh_hits')
+            return cached.text
+        
+        # Add headers to mimic a real browser
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+        }
+        if cached is not None:
+            headers.update(cached.conditional_headers())
+        
+        # Make the request with timeout (shared pooled client)
+        response = await http_client.fetch(url, headers=headers, timeout=30)
+
+        if response.status_code == 304 and cached is not None:
+            logger.info(f"Page not modified since last fetch, serving cached content: {url}")
+            page_cache.mark_revalidated(url)
+            page_cache.record('revalidated_hits')
+            return cached.text
+
+        page_cache.record('misses')
+        if not response.ok:
+            logger.error(f"HTTP error fetching web page: {response.status_code} for {url}")
+            return f"HTTP error fetching web page content: {response.status_code} for url: {url}"
+        
+        # Check if content is HTML
+        content_type = response.headers.get('content-type', '').lower()
+        if 'text/html' not in content_type:
+            logger.warning(f"Non-HTML content type: {content_type}")
+            return f"Non-HTML content detected: {content_type}"
+        
+        # Parse the HTML content
+        text = _extract_page_text(response.content)
+        
+        # Check if we got meaningful content
+        if len(text.strip()) < 50:
+            logger.warning(f"Very little content extracted: {len(text)} characters")
+            return f"Very little content extracted from the page. This might not be a valid job posting."
+        
+        # Limit content length to avoid token limits (keep first 8000 characters)
+        if len(text) > 4000:
+            text = text[:4000] + "... [content truncated]"
+        
+        page_cache.store(
+            url,
+            text,
+            etag=response.headers.get('etag'),
+            last_modified=response.headers.get('last-modified'),
+        )
+        
+        logger.info(f"Successfully extracted {len(text)} characters from web page")
+        return text
+        
+    except httpx.TimeoutException:
+        logger.error(f"Timeout fetching web page: {url}")
+        return f"Timeout fetching web page content from: {url}"
+    except (httpx.ConnectError, httpx.RemoteProtocolError):
+        logger.error(f"Connection error fetching web page: {url}")
+        return f"Connection error fetching web page content from: {url}"
+    except httpx.HTTPError as e:
+        logger.error(f"Request error fetching web page: {str(e)}")
+        return f"Request error fetching web page content: {str(e)}"
+    except ImportError as e:
+        logger.error(f"Missing dependency: {str(e)}")
+        return f"Missing dependency for web scraping: {str(e)}"
+    except Exception as e:
+        logger.error(f"Unexpected error parsing web page content: {str(e)}")
+        return f"Unexpected error parsing web page content: {str(e)}"
@@ -0,0 +1,101 @@
+"""
+Progressive sections for streamed structured-output responses.
+
+Structured outputs produce one JSON object whose keys follow the schema order.
+TopLevelMembers consumes the text deltas as they arrive and reports every
+top-level member as soon as its value is closed. SectionAssembler groups those
+members into the resume sections the frontend renders (header, education,
+professional history, projects, skills) and releases a section once all of
+its keys are complete.
+"""
+import json
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Resume sections of CraftResumeResponse, in render order
+CRAFT_RESUME_SECTIONS: Dict[str, Sequence[str]] = {
+    'header': ('full_name', 'email_address', 'phone_number', 'home_address', 'links'),
+    'education': ('education_history',),
+    'professional_history': ('professional_history', 'professional_achievement'),
+    'projects': ('personal_projects', 'professional_projects'),
+    'skills': ('technical_skills',),
+}
+
+
+class TopLevelMembers:
+    """Incremental scanner yielding (key, value) for each completed top-level member."""
+
+    def __init__(self) -> None:
+        self._buffer: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._started = False
+
+    def feed(self, delta: str) -> Iterator[Tuple[str, Any]]:
+        for char in delta:
+            if not self._started:
+                if char == '{':
+                    self._started = True
+                    self._depth = 1
+                continue
+            if self._depth == 0:
+                continue  # trailing text after the object
+
+            if self._in_string:
+                self._buffer.append(char)
+                if self._escaped:
+                    self._escaped = False
+                elif char == '\\':
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in '{[':
+                self._depth += 1
+            elif char in '}]':
+                self._depth -= 1
+
+            if self._depth == 1 and char == ',' or self._depth == 0:
+                member = self._take_member()
+                if member is not None:
+                    yield member
+                continue
+            self._buffer.append(char)
+
+    def _take_member(self) -> Optional[Tuple[str, Any]]:
+        text = ''.join(self._buffer).strip()
+        self._buffer = []
+        if not text:
+            return None
+        parsed = json.loads('{' + text + '}')
+        return next(iter(parsed.items()))
+
+
+class SectionAssembler:
+    """Collects members and returns sections whose keys are all complete."""
+
+    def __init__(self, sections: Dict[str, Sequence[str]] = CRAFT_RESUME_SECTIONS) -> None:
+        self._sections = sections
+        self._values: Dict[str, Any] = {}
+        self._emitted: set = set()
+
+    def add(self, key: str, value: Any) -> List[Tuple[str, Dict[str, Any]]]:
+        self._values[key] = value
+        return self._ready()
+
+    def _ready(self) -> List[Tuple[str, Dict[str, Any]]]:
+        ready = []
+        for name, keys in self._sections.items():
+            if name in self._emitted or not all(key in self._values for key in keys):
+                continue
+            self._emitted.add(name)
+            ready.append((name, {key: self._values[key] for key in keys}))
+        return ready
+
+    def remaining(self, data: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Sections not emitted yet, taken from the final validated object."""
+        self._values.update(data)
+        return self._ready()
@@ -0,0 +1,155 @@
+"""
+Durable background queue for S3 uploads.
+
+Intake endpoints (resume_analysis_lab, instant_mock_interview, flash_chat,
+job_application, referral_application) hand their resume and client_info.json
+writes to enqueue_upload(). Uploads run concurrently on a bounded thread pool,
+so they overlap with the Stripe call instead of blocking the event loop.
+
+Each upload is retried with exponential backoff. If all attempts fail, the
+payload and a JSON record describing the failure are written under
+UPLOAD_DEAD_LETTER_PREFIX so the submission can be replayed by hand.
+
+Lambda may freeze the container as soon as a response is returned. Endpoints
+therefore await wait_for_uploads() before responding, and the Lambda handler
+calls drain_uploads() as a final safety net.
+"""
+import asyncio
+import json
+import threading
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from datetime import datetime
+from typing import Iterable, Optional, Set, Union
+
+import boto3
+from aws_lambda_powertools import Logger
+from botocore.config import Config
+
+logger = Logger()
+
+UPLOAD_BUCKET = 'career-landing-group'
+UPLOAD_DEAD_LETTER_PREFIX = 'upload-dead-letter'
+
+UPLOAD_MAX_WORKERS = 8
+UPLOAD_MAX_ATTEMPTS = 3
+UPLOAD_RETRY_BASE_DELAY = 0.5  # seconds, doubled after every failed attempt
+UPLOAD_FLUSH_TIMEOUT = 30.0  # seconds
+
+_s3 = boto3.client(
+    's3',
+    config=Config(
+        region_name='us-east-1',
+        max_pool_connections=UPLOAD_MAX_WORKERS * 2,
+        retries={'max_attempts': 2, 'mode': 'standard'},
+    ),
+)
+_executor = ThreadPoolExecutor(max_workers=UPLOAD_MAX_WORKERS, thread_name_prefix='s3-upload')
+
+_pending: Set[Future] = set()
+_pending_lock = threading.Lock()
+
+
+def get_s3_client():
+    """The S3 client uploads go through (thread-safe)."""
+    return _s3
+
+
+def _put(bucket: str, key: str, body: Union[bytes, str], content_type: Optional[str]) -> None:
+    kwargs = {'Bucket': bucket, 'Key': key, 'Body': body}
+    if content_type:
+        kwargs['ContentType'] = content_type
+    _s3.put_object(**kwargs)
+
+
+def _write_dead_letter(bucket: str, key: str, body: Union[bytes, str],
+                       content_type: Optional[str], error: Exception) -> None:
+    """Persist a failed upload so it can be replayed; fall back to the log."""
+    dead_letter_id = str(uuid.uuid4())
+    prefix = f"{UPLOAD_DEAD_LETTER_PREFIX}/{datetime.now().strftime('%Y-%m-%d')}/{dead_letter_id}"
+    record = {
+        'dead_letter_id': dead_letter_id,
+        'bucket': bucket,
+        'key': key,
+        'content_type': content_type,
+        'size': len(body),
+        'attempts': UPLOAD_MAX_ATTEMPTS,
+        'error': str(error),
+        'failed_at': datetime.now().isoformat(),
+        'payload_key': f"{prefix}/payload",
+    }
+    try:
+        _put(UPLOAD_BUCKET, record['payload_key'], body, content_type)
+        _put(UPLOAD_BUCKET, f"{prefix}/record.json", json.dumps(record, indent=2), 'application/json')
+        logger.error(f"S3 upload failed, dead-letter record written: {prefix}/record.json", extra=record)
+    except Exception as dlq_error:
+        logger.error(f"S3 upload failed and dead-letter write failed: {str(dlq_error)}", extra=record)
+
+
+def _upload_with_retry(bucket: str, key: str, body: Union[bytes, str], content_type: Optional[str]) -> bool:
+    last_error: Optional[Exception] = None
+    for attempt in range(1, UPLOAD_MAX_ATTEMPTS + 1):
+        try:
+            _put(bucket, key, body, content_type)
+            logger.info(f"Saved to S3: {key}")
+            return True
+        except Exception as e:
+            last_error = e
+            logger.warning(f"S3 upload attempt {attempt}/{UPLOAD_MAX_ATTEMPTS} failed for {key}: {str(e)}")
+            if attempt < UPLOAD_MAX_ATTEMPTS:
+                time.sleep(UPLOAD_RETRY_BASE_DELAY * (2 ** (attempt - 1)))
+    _write_dead_letter(bucket, key, body, content_type, last_error)
+    return False
+
+
+def _discard(future: Future) -> None:
+    with _pending_lock:
+        _pending.discard(future)
+
+
+def enqueue_upload(key: str, body: Union[bytes, str], content_type: Optional[str] = None,
+                   bucket: str = UPLOAD_BUCKET) -> Future:
+    """
+    Start uploading ``body`` to ``s3://bucket/key`` on the worker pool.
+
+    Returns the worker future, which resolves to True on success and False when
+    the upload was dead-lettered. It never raises.
+    """
+    future = _executor.submit(_upload_with_retry, bucket, key, body, content_type)
+    with _pending_lock:
+        _pending.add(future)
+    future.add_done_callback(_discard)
+    return future
+
+
+async def wait_for_uploads(futures: Optional[Iterable[Future]] = None,
+                           timeout: float = UPLOAD_FLUSH_TIMEOUT) -> bool:
+    """
+    Await the given uploads (default: every pending upload) without blocking
+    the event loop. Returns True when all of them finished successfully.
+    """
+    if futures is None:
+        with _pending_lock:
+            futures = list(_pending)
+    futures = list(futures)
+    if not futures:
+        return True
+
+    done, not_done = await asyncio.wait([asyncio.wrap_future(f) for f in futures], timeout=timeout)
+    if not_done:
+        logger.warning(f"{len(not_done)} S3 upload(s) still running after {timeout}s")
+    return not not_done and all(f.result() for f in done)
+
+
+def drain_uploads(timeout: float = UPLOAD_FLUSH_TIMEOUT) -> None:
+    """Block until every pending upload has finished (called before Lambda returns)."""
+    with _pending_lock:
+        futures = list(_pending)
+    if not futures:
+        return
+    logger.info(f"Draining {len(futures)} pending S3 upload(s)")
+    _, not_done = wait_futures(futures, timeout=timeout)
+    if not_done:
+        logger.warning(f"{len(not_done)} S3 upload(s) did not finish before the invocation returned")
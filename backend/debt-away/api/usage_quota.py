@@ -0,0 +1,91 @@
+"""
+Atomic usage quota gate for craft / analysis / download actions.
+
+consume_quota() checks the limit and increments the counter with conditional
+writes on the USAGE item, so concurrent requests cannot both slip past it:
+
+1. One UpdateItem, allowed while the free limit is not reached:
+
+       SET <counter> = if_not_exists(<counter>, 0) + 1
+       IF attribute_not_exists(<counter>) OR <counter> < :limit
+
+2. Only when that fails, a TransactWriteItems that checks the SUBSCRIPTION
+   item is on a paid plan and increments the counter unconditionally.
+
+The plan only matters past the free limit, so it is always read from
+SUBSCRIPTION itself, whoever writes it (upgrades, downgrades and expiries
+happen outside this module). An action is one round trip below the free
+limit and two past it, instead of get SUBSCRIPTION + get USAGE + put USAGE +
+update USAGE.
+"""
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+import app_data_repository as app_data
+from app_data_repository import ConditionalCheckFailed
+
+QUOTA_OK = 'OK'
+LIMIT_EXCEEDED = 'LIMIT_EXCEEDED'
+
+CRAFT = 'craft_count'
+ANALYSIS = 'analysis_count'
+DOWNLOAD = 'download_count'
+
+FREE_PLAN_LIMITS = {
+    CRAFT: 3,
+    ANALYSIS: 3,
+    DOWNLOAD: 3,
+}
+
+
+class QuotaResult(NamedTuple):
+    status: str  # QUOTA_OK | LIMIT_EXCEEDED
+    count: Optional[int] = None  # counter value after the increment, unknown on a paid plan past the free limit
+
+    @property
+    def allowed(self) -> bool:
+        return self.status == QUOTA_OK
+
+
+async def consume_quota(cognito_sub: str, counter: str) -> QuotaResult:
+    """
+    Increment ``counter`` on the user's USAGE item if the action is allowed.
+
+    Returns QuotaResult(LIMIT_EXCEEDED) without touching the counter when a
+    free-plan user has reached FREE_PLAN_LIMITS[counter].
+    """
+    timestamp = datetime.utcnow().isoformat()
+    increment = (
+        'SET #c = if_not_exists(#c, :zero) + :inc, '
+        'updatedAt = :ts, createdAt = if_not_exists(createdAt, :ts)'
+    )
+    values = {':zero': 0, ':inc': 1, ':ts': timestamp}
+
+    try:
+        updated = await app_data.update_item(
+            cognito_sub, 'USAGE',
+            increment,
+            values={**values, ':limit': FREE_PLAN_LIMITS[counter]},
+            names={'#c': counter},
+            condition_expression='attribute_not_exists(#c) OR #c < :limit',
+            return_values='UPDATED_NEW',
+        )
+        return QuotaResult(QUOTA_OK, count=int(updated.get(counter, 0)))
+    except ConditionalCheckFailed:
+        pass
+
+    # Free limit reached: allowed only on a paid plan, checked in the same transaction
+    try:
+        await app_data.update_item_if(
+            cognito_sub, 'USAGE',
+            increment,
+            check_sk='SUBSCRIPTION',
+            check_expression='attribute_exists(#plan) AND #plan <> :free',
+            values=values,
+            names={'#c': counter},
+            check_values={':free': 'free'},
+            check_names={'#plan': 'plan'},
+        )
+    except ConditionalCheckFailed:
+        return QuotaResult(LIMIT_EXCEEDED)
+    return QuotaResult(QUOTA_OK)
@@ -2,11 +2,14 @@ import boto3
 import hashlib
 import json
 import os
+import threading
 import time
 import logging
+import zlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 import requests
-from boto3.dynamodb.conditions import Key, Attr
+from boto3.dynamodb.conditions import Key
 
 try:
     import openai
@@ -39,6 +42,25 @@ TARGET_COMPANIES = [
     "Netflix",
 ]
 OPENAI_MAX_JOBS_PER_POSITION = 5
+MAX_SKILLS_PER_JOB = 15
+
+# ---------------------------------------------------------------------------
+# Fetch scheduling. Each provider gets a bounded worker pool and a token
+# bucket instead of fixed sleeps. JSearch (RapidAPI) additionally honours the
+# X-RateLimit-* response headers and backs off on 429.
+# ---------------------------------------------------------------------------
+JSEARCH_MAX_WORKERS = 4
+JSEARCH_REQUESTS_PER_SECOND = 2.0
+JSEARCH_BURST = 4
+JSEARCH_MAX_RETRIES = 4
+
+OPENAI_MAX_WORKERS = 4
+OPENAI_REQUESTS_PER_SECOND = 1.0
+OPENAI_BURST = 4
+OPENAI_MAX_RETRIES = 4  # handled by the openai client (429 / 5xx with backoff)
+
+RATE_LIMIT_BACKOFF_BASE = 2.0  # seconds, doubled per consecutive 429
+RATE_LIMIT_BACKOFF_MAX = 60.0
 
 dynamodb = boto3.resource("dynamodb")
 table = dynamodb.Table(TABLE_NAME)
@@ -119,6 +141,76 @@ JOB_CATEGORIES = {
 }
 
 
+class TokenBucket:
+    """
+    Thread-safe token bucket. acquire() blocks until a token is available or
+    until a provider-imposed pause (429 / exhausted quota) has elapsed.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for `seconds` (shared by all workers)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+
+
+jsearch_bucket = TokenBucket(JSEARCH_REQUESTS_PER_SECOND, JSEARCH_BURST)
+openai_bucket = TokenBucket(OPENAI_REQUESTS_PER_SECOND, OPENAI_BURST)
+
+# requests.Session is not guaranteed thread-safe; keep one keep-alive session per worker
+_thread_local = threading.local()
+
+
+def _jsearch_session() -> requests.Session:
+    session = getattr(_thread_local, "session", None)
+    if session is None:
+        session = _thread_local.session = requests.Session()
+    return session
+
+
+def _header_float(headers, name: str):
+    try:
+        return float(headers.get(name))
+    except (TypeError, ValueError):
+        return None
+
+
+_openai_client = None
+_openai_client_lock = threading.Lock()
+
+
+def _get_openai_client():
+    """One OpenAI client shared by all workers (the client is thread-safe)."""
+    global _openai_client
+    with _openai_client_lock:
+        if _openai_client is None:
+            _openai_client = openai.OpenAI(api_key=OPENAI_API_KEY, max_retries=OPENAI_MAX_RETRIES)
+        return _openai_client
+
+
 def normalize_position_name(name: str) -> str:
     """Convert a position name to a consistent lowercase_underscore key."""
     return name.strip().lower().replace(" ", "_").replace("/", "_").replace("&", "and")
@@ -139,7 +231,7 @@ def fetch_jobs_from_openai(position_name: str, max_results: int = OPENAI_MAX_JOB
     open job listings for `position_name` at TARGET_COMPANIES.
 
     Returns a list of dicts matching the JSearch structure:
-      {job_id, job_title, company_name, job_url, is_direct_apply}
+      {job_id, job_title, company_name, job_url, is_direct_apply, job_skills}
     is_direct_apply is always True because results link to company career pages.
     """
     if not OPENAI_API_KEY:
@@ -149,7 +241,7 @@ def fetch_jobs_from_openai(position_name: str, max_results: int = OPENAI_MAX_JOB
         logger.warning("openai package not installed — skipping OpenAI job fetch.")
         return []
 
-    client = openai.OpenAI(api_key=OPENAI_API_KEY)
+    client = _get_openai_client()
     companies_str = ", ".join(TARGET_COMPANIES)
 
     prompt = (
@@ -166,6 +258,7 @@ def fetch_jobs_from_openai(position_name: str, max_results: int = OPENAI_MAX_JOB
     )
 
     try:
+        openai_bucket.acquire()
         response = client.responses.create(
             model="gpt-4o-mini",
             tools=[{"type": "web_search_preview"}],
@@ -210,6 +303,7 @@ def fetch_jobs_from_openai(position_name: str, max_results: int = OPENAI_MAX_JOB
                 "company_name":   company,
                 "job_url":        url,
                 "is_direct_apply": True,
+                "job_skills":     [],
             })
 
         logger.info(f"OpenAI returned {len(jobs)} jobs for '{position_name}'")
@@ -223,12 +317,55 @@ def fetch_jobs_from_openai(position_name: str, max_results: int = OPENAI_MAX_JOB
         return []
 
 
+def jsearch_get(headers: dict, params: dict) -> requests.Response:
+    """
+    Rate-limited JSearch GET. Waits on the shared token bucket, pauses every
+    worker when RapidAPI reports the quota is exhausted, and retries 429s with
+    exponential backoff (or the server's Retry-After / reset hint).
+    """
+    for attempt in range(JSEARCH_MAX_RETRIES + 1):
+        jsearch_bucket.acquire()
+        response = _jsearch_session().get(
+            JSEARCH_BASE_URL,
+            headers=headers,
+            params=params,
+            timeout=15,
+        )
+
+        reset = (_header_float(response.headers, "Retry-After")
+                 or _header_float(response.headers, "X-RateLimit-Requests-Reset"))
+        remaining = _header_float(response.headers, "X-RateLimit-Requests-Remaining")
+
+        if response.status_code != 429:
+            if remaining is not None and remaining <= 0 and reset:
+                logger.warning(f"JSearch quota exhausted — pausing requests for {reset:.0f}s")
+                jsearch_bucket.pause(min(reset, RATE_LIMIT_BACKOFF_MAX))
+            return response
+
+        delay = min(reset or RATE_LIMIT_BACKOFF_BASE * (2 ** attempt), RATE_LIMIT_BACKOFF_MAX)
+        logger.warning(f"JSearch 429 for '{params.get('query')}' — backing off {delay:.1f}s (attempt {attempt + 1})")
+        jsearch_bucket.pause(delay)
+
+    return response
+
+
+def _clean_skills(raw_skills) -> list:
+    """JSearch job_required_skills (list or null) -> up to MAX_SKILLS_PER_JOB short strings."""
+    if not isinstance(raw_skills, list):
+        return []
+    skills = []
+    for skill in raw_skills:
+        if isinstance(skill, str) and skill.strip() and len(skill) <= 60:
+            skills.append(skill.strip())
+    return skills[:MAX_SKILLS_PER_JOB]
+
+
 def fetch_jobs_for_query(query: str, max_pages: int = 2) -> list:
     """
     Fetch job listings from JSearch for a given query string.
     Fetches up to max_pages pages (10 results per page).
     Deduplicates by job_id within the result set.
-    Returns a list of dicts: {job_id, job_title, company_name, job_url, is_direct_apply}.
+    Returns a list of dicts: {job_id, job_title, company_name, job_url, is_direct_apply, job_skills}.
     """
     headers = {
         "X-RapidAPI-Key": JSEARCH_API_KEY,
@@ -246,12 +383,7 @@ def fetch_jobs_for_query(query: str, max_pages: int = 2) -> list:
                 "employment_types": "FULLTIME",
                 "date_posted": "all",
             }
-            response = requests.get(
-                JSEARCH_BASE_URL,
-                headers=headers,
-                params=params,
-                timeout=15,
-            )
+            response = jsearch_get(headers, params)
             response.raise_for_status()
             jobs_raw = response.json().get("data", [])
 
@@ -278,10 +410,10 @@ def fetch_jobs_for_query(query: str, max_pages: int = 2) -> list:
                     "company_name": company,
                     "job_url": url,
                     "is_direct_apply": bool(job.get("job_apply_is_direct", False)),
+                    "job_skills": _clean_skills(job.get("job_required_skills")),
                 })
 
             logger.info(f"Page {page} for '{query}': fetched {len(jobs_raw)} raw, kept {len(all_jobs)} total so far.")
-            time.sleep(0.5)  # Respect rate limit between pages
 
         except requests.HTTPError as e:
             logger.error(f"HTTP error on page {page} for '{query}': {e}")
@@ -293,20 +425,78 @@ def fetch_jobs_for_query(query: str, max_pages: int = 2) -> list:
     return all_jobs
 
 
-def write_jobs_to_dynamo(job_type: str, position_name: str, jobs: list, batch_id: str) -> int:
+# Per-partition manifest item: {sk: content_hash} for every listing written by
+# the previous refresh. It has no position_name/company_name, so it never
+# appears in the GSIs the API reads.
+MANIFEST_SK = "#manifest"
+
+
+def content_hash(job_type: str, normalized_pos: str, job: dict) -> str:
+    """Stable hash of everything stored for a listing; unchanged hash => skip write."""
+    payload = json.dumps(
+        [job_type, normalized_pos, job["job_title"], job["company_name"],
+         job["job_url"], bool(job["is_direct_apply"]), job.get("job_skills", [])],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:20]
+
+
+def load_previous_hashes(job_type: str) -> dict:
+    """
+    Load {sk: content_hash} from the previous refresh with a single GetItem.
+    Falls back to a key-only query of the partition when no manifest exists yet
+    (first incremental run); items without a hash are then rewritten once.
     """
-    Batch-write job items into the jobCache table.
+    response = table.get_item(Key={"job_type": job_type, "sk": MANIFEST_SK})
+    if "Item" in response:
+        return dict(response["Item"].get("entries", {}))
+
+    logger.info(f"No manifest for job_type='{job_type}' — loading keys from the partition")
+    previous = {}
+    last_key = None
+    while True:
+        query_kwargs = {
+            "KeyConditionExpression": Key("job_type").eq(job_type),
+            "ProjectionExpression": "sk, content_hash",
+        }
+        if last_key:
+            query_kwargs["ExclusiveStartKey"] = last_key
+        response = table.query(**query_kwargs)
+        for item in response.get("Items", []):
+            if item["sk"] != MANIFEST_SK:
+                previous[item["sk"]] = item.get("content_hash", "")
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            break
+    return previous
+
+
+def write_jobs_to_dynamo(job_type: str, position_name: str, jobs: list, batch_id: str,
+                         previous: dict, entries: dict) -> dict:
+    """
+    Write only new or changed job items into the jobCache table.
     SK format:  {normalized_position_name}#{job_id}
-    Returns the number of items written.
+    Records {sk: content_hash} for every listing in `entries` and returns
+    {"new": n, "changed": n, "unchanged": n}.
     """
     normalized_pos = normalize_position_name(position_name)
+    counts = {"new": 0, "changed": 0, "unchanged": 0}
 
     with table.batch_writer() as batch:
         for job in jobs:
+            sk = f"{normalized_pos}#{job['job_id']}"
+            digest = content_hash(job_type, normalized_pos, job)
+            entries[sk] = digest
+
+            if previous.get(sk) == digest:
+                counts["unchanged"] += 1
+                continue
+            counts["changed" if sk in previous else "new"] += 1
+
             batch.put_item(Item={
                 # Primary key
                 "job_type":        job_type,
-                "sk":              f"{normalized_pos}#{job['job_id']}",
+                "sk":              sk,
                 # GSI keys (must be stored as top-level attributes)
                 "company_name":    job["company_name"],
                 "position_name":   normalized_pos,
@@ -314,47 +504,290 @@ def write_jobs_to_dynamo(job_type: str, position_name: str, jobs: list, batch_id
                 "job_title":       job["job_title"],
                 "job_url":         job["job_url"],
                 "is_direct_apply": job["is_direct_apply"],
+                "job_skills":      job.get("job_skills", []),
                 # Refresh tracking
+                "content_hash":    digest,
                 "batch_id":        batch_id,
             })
 
-    logger.info(f"Wrote {len(jobs)} items — job_type='{job_type}', position='{position_name}'")
-    return len(jobs)
+    logger.info(
+        f"job_type='{job_type}', position='{position_name}': "
+        f"{counts['new']} new, {counts['changed']} changed, {counts['unchanged']} unchanged"
+    )
+    return counts
 
 
-def delete_stale_items(job_type: str, current_batch_id: str):
+def carry_over_entries(previous: dict, entries: dict, position_name: str, source: str) -> int:
     """
-    Remove all items for a job_type whose batch_id differs from the current run.
-    Called after all writes are complete to ensure safe atomic swap.
-    Handles DynamoDB pagination for large result sets.
+    Keep the previous listings of a position whose fetch returned nothing (API
+    error or outage) instead of deleting them. Returns the number kept.
     """
-    stale_keys = []
-    last_key = None
+    prefix = f"{normalize_position_name(position_name)}#"
+    kept = 0
+    for sk, digest in previous.items():
+        if not sk.startswith(prefix):
+            continue
+        is_openai = sk[len(prefix):].startswith("oa_")
+        if is_openai == (source == "openai"):
+            entries[sk] = digest
+            kept += 1
+    return kept
+
+
+def delete_removed_items(job_type: str, removed_keys: list):
+    """Delete exactly the listings that disappeared since the previous refresh."""
+    if not removed_keys:
+        logger.info(f"No removed items to delete for job_type='{job_type}'")
+        return
 
+    with table.batch_writer() as batch:
+        for sk in removed_keys:
+            batch.delete_item(Key={"job_type": job_type, "sk": sk})
+
+    logger.info(f"Deleted {len(removed_keys)} removed items for job_type='{job_type}'")
+
+
+def save_manifest(job_type: str, entries: dict, batch_id: str):
+    table.put_item(Item={
+        "job_type": job_type,
+        "sk":       MANIFEST_SK,
+        "entries":  entries,
+        "batch_id": batch_id,
+    })
+
+
+def save_manifest_without_previous(job_type: str, entries: dict, batch_id: str) -> bool:
+    """
+    Phase 0 could not load the previous manifest, so this run deleted nothing
+    and did not carry over the listings of positions whose fetch came back
+    empty. Writing only this run's keys would drop every older listing from
+    tracking for good (never deleted, still served from position-index).
+    Retry the load and keep the old keys alongside this run's; if it still
+    fails, leave the stored manifest as it is. Returns True when saved.
+    """
+    try:
+        previous = load_previous_hashes(job_type)
+    except Exception as e:
+        logger.error(f"Manifest not saved for job_type='{job_type}', previous keys still unavailable: {e}")
+        return False
+    save_manifest(job_type, {**previous, **entries}, batch_id)
+    logger.info(f"Manifest for job_type='{job_type}' saved with {len(previous)} previous keys kept")
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Base rankings. After the listings are refreshed, every position's pool is
+# ranked once by quality/prestige (independent of any user) and materialized
+# as one snapshot item: zlib-compressed JSON of the ranked listings, tagged
+# with the batch_id. /job-recommendations reads that single item instead of
+# paging through position-index, and only has to rerank by user skills.
+# The "#current" item points at the latest batch, so the API can keep
+# snapshots in memory until the next refresh. Snapshot items live in their
+# own partition and carry no GSI attributes.
+# ---------------------------------------------------------------------------
+RANKING_PARTITION = "#ranking"
+CURRENT_BATCH_SK = "#current"
+RANKING_MAX_JOBS = 200
+RANKING_LLM_TOP = 60
+RANKING_MODEL = "gpt-5-mini"
+
+
+def load_position_pool(normalized_pos: str) -> list:
+    """All listings for a position across job_types, deduplicated by URL."""
+    pool = []
+    seen_urls = set()
+    query_kwargs = {
+        "IndexName": "position-index",
+        "KeyConditionExpression": Key("position_name").eq(normalized_pos),
+        "ProjectionExpression": "job_title, company_name, job_url, is_direct_apply, job_skills",
+    }
     while True:
-        query_kwargs = {
-            "KeyConditionExpression": Key("job_type").eq(job_type),
-            "FilterExpression": Attr("batch_id").ne(current_batch_id),
-            "ProjectionExpression": "job_type, sk",  # Only fetch keys to reduce RCU
+        response = table.query(**query_kwargs)
+        for item in response.get("Items", []):
+            if item.get("job_url") in seen_urls:
+                continue
+            seen_urls.add(item.get("job_url"))
+            pool.append(item)
+        last_key = response.get("LastEvaluatedKey")
+        if not last_key:
+            break
+        query_kwargs["ExclusiveStartKey"] = last_key
+    return pool
+
+
+def _company_tier(company_name: str) -> int:
+    """Position of the company in TARGET_COMPANIES, or len(TARGET_COMPANIES) if absent."""
+    name = (company_name or "").lower()
+    for tier, company in enumerate(TARGET_COMPANIES):
+        if company.lower() in name:
+            return tier
+    return len(TARGET_COMPANIES)
+
+
+def fallback_order(pool: list) -> list:
+    """Deterministic prestige order: target companies first, then direct-apply listings."""
+    return sorted(
+        range(len(pool)),
+        key=lambda i: (_company_tier(pool[i].get("company_name")), not pool[i].get("is_direct_apply"), i),
+    )
+
+
+def rank_pool_with_openai(position_name: str, pool: list) -> list:
+    """
+    Ask the LLM for the best RANKING_LLM_TOP listings by company reputation and
+    listing quality. Returns validated indices (possibly empty on failure).
+    """
+    if not OPENAI_API_KEY or openai is None:
+        return []
+
+    job_list_text = "\n".join(
+        f"{i}: {job.get('job_title', '')} @ {job.get('company_name', '')}"
+        for i, job in enumerate(pool)
+    )
+    prompt = (
+        f'Below is a numbered list of job listings for the position "{position_name}".\n'
+        f"Select the {RANKING_LLM_TOP} best listings, prioritising:\n"
+        "1. Company reputation and prestige (FAANG, top-tier tech companies, top trading firms, "
+        "well-funded startups, unicorns)\n"
+        "2. Listings that clearly match the position (not unrelated or mislabelled roles)\n"
+        "3. Variety — avoid returning many listings from the same company\n\n"
+        "Return ONLY a JSON array of the selected indices (0-based integers), best first, "
+        "with no markdown fences and no explanation.\n\n"
+        f"Job listings:\n{job_list_text}"
+    )
+
+    try:
+        openai_bucket.acquire()
+        response = _get_openai_client().responses.create(model=RANKING_MODEL, input=prompt)
+        text_content = (getattr(response, "output_text", "") or "").strip()
+        if text_content.startswith("```"):
+            lines = text_content.splitlines()
+            text_content = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
+        raw_indices = json.loads(text_content)
+    except Exception as e:
+        logger.error(f"Base ranking failed for '{position_name}': {e}")
+        return []
+
+    if not isinstance(raw_indices, list):
+        return []
+    seen = set()
+    indices = []
+    for idx in raw_indices:
+        if isinstance(idx, int) and 0 <= idx < len(pool) and idx not in seen:
+            seen.add(idx)
+            indices.append(idx)
+    return indices
+
+
+def build_ranked_jobs(pool: list, llm_indices: list) -> list:
+    """LLM-selected listings first, then the rest in fallback order, capped at RANKING_MAX_JOBS."""
+    seen = set(llm_indices)
+    order = list(llm_indices) + [i for i in fallback_order(pool) if i not in seen]
+    return [
+        {
+            "job_title":    pool[i].get("job_title", ""),
+            "company_name": pool[i].get("company_name", ""),
+            "job_url":      pool[i].get("job_url", ""),
+            "job_skills":   pool[i].get("job_skills", []),
         }
-        if last_key:
-            query_kwargs["ExclusiveStartKey"] = last_key
+        for i in order[:RANKING_MAX_JOBS]
+    ]
+
+
+def save_snapshot(normalized_pos: str, ranked_jobs: list, pool_size: int, batch_id: str):
+    payload = json.dumps(ranked_jobs, ensure_ascii=False, separators=(",", ":")).encode()
+    table.put_item(Item={
+        "job_type":  RANKING_PARTITION,
+        "sk":        normalized_pos,
+        "snapshot":  zlib.compress(payload, 9),
+        "encoding":  "zlib+json",
+        "pool_size": pool_size,
+        "batch_id":  batch_id,
+    })
+
+
+def save_current_batch(batch_id: str):
+    """Flip the API over to this batch's snapshots (written after all of them)."""
+    table.put_item(Item={
+        "job_type": RANKING_PARTITION,
+        "sk":       CURRENT_BATCH_SK,
+        "batch_id": batch_id,
+    })
 
+
+def delete_obsolete_rankings(current_positions):
+    """Remove ranking items for positions that are no longer configured."""
+    obsolete = []
+    query_kwargs = {
+        "KeyConditionExpression": Key("job_type").eq(RANKING_PARTITION),
+        "ProjectionExpression": "sk",
+    }
+    while True:
         response = table.query(**query_kwargs)
-        stale_keys.extend(response.get("Items", []))
+        obsolete.extend(
+            item["sk"] for item in response.get("Items", [])
+            if item["sk"] not in current_positions and item["sk"] != CURRENT_BATCH_SK
+        )
         last_key = response.get("LastEvaluatedKey")
         if not last_key:
             break
-
-    if not stale_keys:
-        logger.info(f"No stale items to delete for job_type='{job_type}'")
-        return
+        query_kwargs["ExclusiveStartKey"] = last_key
 
     with table.batch_writer() as batch:
-        for key in stale_keys:
-            batch.delete_item(Key={"job_type": key["job_type"], "sk": key["sk"]})
+        for sk in obsolete:
+            batch.delete_item(Key={"job_type": RANKING_PARTITION, "sk": sk})
+    if obsolete:
+        logger.info(f"Deleted {len(obsolete)} obsolete ranking items")
+
+
+def build_base_rankings(unique_positions: dict, batch_id: str) -> dict:
+    """
+    Rank every position's pool, store one snapshot item per position and
+    point "#current" at this batch.
+    Pools are read on this thread; LLM ranking calls run on a bounded pool.
+    Returns {"ranked": n, "llm_ranked": n, "failed": [...]}.
+    """
+    pools = {}
+    summary = {"ranked": 0, "llm_ranked": 0, "failed": []}
+    for key in unique_positions:
+        try:
+            pools[key] = load_position_pool(key)
+        except Exception as e:
+            logger.error(f"Loading pool failed for '{key}': {e}")
+            summary["failed"].append(key)
+
+    with ThreadPoolExecutor(max_workers=OPENAI_MAX_WORKERS, thread_name_prefix="ranking") as ranking_pool:
+        futures = {
+            ranking_pool.submit(rank_pool_with_openai, unique_positions[key], pool): key
+            for key, pool in pools.items() if pool
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            pool = pools[key]
+            llm_indices = future.result()
+            try:
+                save_snapshot(key, build_ranked_jobs(pool, llm_indices), len(pool), batch_id)
+            except Exception as e:
+                logger.error(f"Saving ranking failed for '{key}': {e}")
+                summary["failed"].append(key)
+                continue
+            summary["ranked"] += 1
+            if llm_indices:
+                summary["llm_ranked"] += 1
+
+    delete_obsolete_rankings(set(pools))
+    if summary["ranked"]:
+        save_current_batch(batch_id)
+    return summary
+
 
-    logger.info(f"Deleted {len(stale_keys)} stale items for job_type='{job_type}'")
+def _unique_positions() -> dict:
+    """Map normalized position name -> display name, deduplicated across categories."""
+    unique = {}
+    for positions in JOB_CATEGORIES.values():
+        for position_name in positions:
+            unique.setdefault(normalize_position_name(position_name), position_name)
+    return unique
 
 
 def lambda_handler(event, context):
@@ -363,126 +796,165 @@ def lambda_handler(event, context):
     month at 03:00 UTC) or manually via the AWS console / CLI.
 
     Workflow:
-      Phase 1 — Fetch all job listings from JSearch and write to DynamoDB
-                 under the new batch_id. Duplicate API queries (same position
-                 name across categories) are served from an in-memory cache.
-      Phase 2 — Delete items from previous runs whose batch_id differs from
-                 the current one, completing the atomic data refresh.
+      Phase 0 — Load the previous refresh's {sk: content_hash} manifest for
+                 each job_type (one GetItem per partition).
+      Phase 1 — Fetch job listings for every unique position from JSearch and
+                 from OpenAI web search (company-targeted) at the same time.
+                 Each provider has its own bounded worker pool and token
+                 bucket; duplicate positions across categories are fetched
+                 once. As each fetch completes, only listings that are new or
+                 whose content hash changed are written.
+      Phase 2 — Delete exactly the keys that were in the previous manifest but
+                 not in this run, then save the new manifest. Partitions whose
+                 manifest could not be loaded delete nothing and keep their
+                 old keys (see save_manifest_without_previous).
+      Phase 3 — Precompute the user-independent base ranking of every
+                 position's pool (see build_base_rankings).
     """
+    started = time.monotonic()
     batch_id = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
     logger.info(f"Job listing cache refresh started — batch_id={batch_id}")
 
-    # In-memory API result cache keyed by normalized position name.
-    # Prevents duplicate JSearch calls for positions shared across categories
-    # (e.g., "AI engineer" in Software Engineering and AI & Machine Learning).
+    unique_positions = _unique_positions()
+
+    # Result caches keyed by normalized position name (one API call per position per provider)
     api_cache: dict = {}
+    openai_cache: dict = {}
 
-    total_written = 0
+    counts = {"new": 0, "changed": 0, "unchanged": 0}
+    openai_written = 0
+    carried_over = 0
     failed_positions: list = []
 
     # ------------------------------------------------------------------
-    # Phase 1: Fetch from JSearch and write new data
+    # Phase 0: previous key set per job_type. When it cannot be loaded the
+    # partition is fully rewritten and nothing is deleted this run.
     # ------------------------------------------------------------------
-    for job_type, positions in JOB_CATEGORIES.items():
-        logger.info(f"--- Processing job_type: '{job_type}' ({len(positions)} positions) ---")
-
-        for position_name in positions:
-            cache_key = normalize_position_name(position_name)
-
-            if cache_key not in api_cache:
-                logger.info(f"API call: '{position_name}'")
-                jobs = fetch_jobs_for_query(position_name, max_pages=2)
-                api_cache[cache_key] = jobs
-                time.sleep(0.3)  # Gentle rate limiting between distinct queries
-            else:
-                logger.info(f"Cache hit: '{position_name}' (reusing {len(api_cache[cache_key])} results)")
-                jobs = api_cache[cache_key]
-
-            if not jobs:
-                logger.warning(f"No jobs returned for '{position_name}' — skipping write.")
-                continue
-
-            try:
-                count = write_jobs_to_dynamo(job_type, position_name, jobs, batch_id)
-                total_written += count
-            except Exception as e:
-                logger.error(f"DynamoDB write failed — job_type='{job_type}', position='{position_name}': {e}")
-                failed_positions.append(f"{job_type}/{position_name}")
-
-    logger.info(f"Phase 1 complete — {total_written} items written, {len(failed_positions)} failed.")
+    previous_by_type: dict = {}
+    entries_by_type: dict = {job_type: {} for job_type in JOB_CATEGORIES}
+    for job_type in JOB_CATEGORIES:
+        try:
+            previous_by_type[job_type] = load_previous_hashes(job_type)
+        except Exception as e:
+            logger.error(f"Loading previous keys failed for job_type='{job_type}': {e}")
+            previous_by_type[job_type] = None
+    logger.info(
+        "Phase 0: loaded previous keys — "
+        + ", ".join(f"{jt}={len(prev) if prev is not None else 'n/a'}" for jt, prev in previous_by_type.items())
+    )
 
     # ------------------------------------------------------------------
-    # Phase 1b: Fetch company-targeted jobs via OpenAI web search and
-    #           write them to DynamoDB alongside JSearch results.
-    #
-    # For each unique position name, the OpenAI Responses API uses its
-    # web_search_preview tool to find up to OPENAI_MAX_JOBS_PER_POSITION
-    # open roles at TARGET_COMPANIES. Results share the same batch_id and
-    # DynamoDB schema as Phase 1 data so Phase 2 stale-deletion handles
-    # cleanup automatically. job_ids are prefixed with "oa_" to avoid
-    # collisions with JSearch IDs.
+    # Phase 1: JSearch and OpenAI fetches run concurrently. DynamoDB writes
+    # stay on this thread (boto3 resources are not thread-safe) and happen
+    # as each fetch completes.
     # ------------------------------------------------------------------
-    logger.info("Phase 1b: Fetching company-targeted jobs via OpenAI web search...")
-    openai_cache: dict = {}  # keyed by normalized position name, same dedup logic as JSearch
-    openai_written = 0
-
-    for job_type, positions in JOB_CATEGORIES.items():
-        logger.info(f"--- OpenAI: Processing job_type: '{job_type}' ({len(positions)} positions) ---")
-
-        for position_name in positions:
-            cache_key = normalize_position_name(position_name)
-
-            if cache_key not in openai_cache:
-                logger.info(f"OpenAI API call: '{position_name}'")
-                oa_jobs = fetch_jobs_from_openai(position_name)
-                openai_cache[cache_key] = oa_jobs
-                time.sleep(1.0)  # Respect OpenAI rate limits between queries
-            else:
-                logger.info(
-                    f"OpenAI cache hit: '{position_name}' "
-                    f"(reusing {len(openai_cache[cache_key])} results)"
-                )
-                oa_jobs = openai_cache[cache_key]
-
-            if not oa_jobs:
-                logger.warning(f"No OpenAI jobs for '{position_name}' — skipping write.")
-                continue
-
+    logger.info(
+        f"Phase 1: fetching {len(unique_positions)} unique positions from JSearch "
+        f"and OpenAI web search concurrently..."
+    )
+    with ThreadPoolExecutor(max_workers=JSEARCH_MAX_WORKERS, thread_name_prefix="jsearch") as jsearch_pool, \
+            ThreadPoolExecutor(max_workers=OPENAI_MAX_WORKERS, thread_name_prefix="openai") as openai_pool:
+        futures = {}
+        for key, position_name in unique_positions.items():
+            futures[jsearch_pool.submit(fetch_jobs_for_query, position_name, 2)] = ("jsearch", key)
+            futures[openai_pool.submit(fetch_jobs_from_openai, position_name)] = ("openai", key)
+
+        for future in as_completed(futures):
+            source, key = futures[future]
             try:
-                count = write_jobs_to_dynamo(job_type, position_name, oa_jobs, batch_id)
-                openai_written += count
-                total_written += count
+                jobs = future.result()
             except Exception as e:
-                logger.error(
-                    f"DynamoDB write failed (OpenAI) — "
-                    f"job_type='{job_type}', position='{position_name}': {e}"
-                )
-                failed_positions.append(f"openai:{job_type}/{position_name}")
-
+                logger.error(f"{source} fetch failed for '{unique_positions[key]}': {e}")
+                jobs = []
+            (api_cache if source == "jsearch" else openai_cache)[key] = jobs
+
+            # Same result set is stored under every job_type listing this position
+            for job_type, positions in JOB_CATEGORIES.items():
+                previous = previous_by_type[job_type] or {}
+                entries = entries_by_type[job_type]
+                for position_name in positions:
+                    if normalize_position_name(position_name) != key:
+                        continue
+                    if not jobs:
+                        kept = carry_over_entries(previous, entries, position_name, source)
+                        carried_over += kept
+                        logger.warning(
+                            f"No {source} jobs returned for '{position_name}' — "
+                            f"keeping {kept} existing items in job_type='{job_type}'."
+                        )
+                        continue
+                    try:
+                        written = write_jobs_to_dynamo(job_type, position_name, jobs, batch_id, previous, entries)
+                        for field, value in written.items():
+                            counts[field] += value
+                        if source == "openai":
+                            openai_written += written["new"] + written["changed"]
+                    except Exception as e:
+                        logger.error(
+                            f"DynamoDB write failed ({source}) — "
+                            f"job_type='{job_type}', position='{position_name}': {e}"
+                        )
+                        prefix = "openai:" if source == "openai" else ""
+                        failed_positions.append(f"{prefix}{job_type}/{position_name}")
+                        # Keys may be partially written; an empty hash forces a
+                        # rewrite (or a delete) on the next run.
+                        normalized_pos = normalize_position_name(position_name)
+                        for job in jobs:
+                            entries.setdefault(f"{normalized_pos}#{job['job_id']}", "")
+
+    total_written = counts["new"] + counts["changed"]
     logger.info(
-        f"Phase 1b complete — {openai_written} OpenAI items written, "
-        f"{len(openai_cache)} unique API calls made."
+        f"Phase 1 complete in {time.monotonic() - started:.1f}s — {counts['new']} new, "
+        f"{counts['changed']} changed, {counts['unchanged']} unchanged "
+        f"({openai_written} written from OpenAI), {len(failed_positions)} failed."
     )
 
     # ------------------------------------------------------------------
-    # Phase 2: Delete stale data from previous batch
+    # Phase 2: Delete listings that disappeared, then save the manifest
     # ------------------------------------------------------------------
-    logger.info("Phase 2: Deleting stale items from previous batch...")
-    for job_type in JOB_CATEGORIES.keys():
+    logger.info("Phase 2: Deleting removed items and saving manifests...")
+    removed_total = 0
+    for job_type, entries in entries_by_type.items():
+        previous = previous_by_type[job_type]
         try:
-            delete_stale_items(job_type, batch_id)
+            if previous is not None:
+                removed_keys = [sk for sk in previous if sk not in entries]
+                delete_removed_items(job_type, removed_keys)
+                removed_total += len(removed_keys)
+                save_manifest(job_type, entries, batch_id)
+            else:
+                save_manifest_without_previous(job_type, entries, batch_id)
         except Exception as e:
-            logger.error(f"Stale item deletion failed for job_type='{job_type}': {e}")
+            logger.error(f"Removed item cleanup failed for job_type='{job_type}': {e}")
+
+    # ------------------------------------------------------------------
+    # Phase 3: Base rankings for /job-recommendations
+    # ------------------------------------------------------------------
+    logger.info("Phase 3: Building base rankings...")
+    try:
+        rankings = build_base_rankings(unique_positions, batch_id)
+    except Exception as e:
+        logger.error(f"Base ranking build failed: {e}")
+        rankings = {"ranked": 0, "llm_ranked": 0, "failed": list(unique_positions)}
 
     result = {
         "status": "success" if not failed_positions else "partial",
         "batch_id": batch_id,
         "total_jobs_written": total_written,
+        "items_new": counts["new"],
+        "items_changed": counts["changed"],
+        "items_unchanged": counts["unchanged"],
+        "items_removed": removed_total,
+        "items_carried_over": carried_over,
         "categories_processed": len(JOB_CATEGORIES),
         "jsearch_unique_api_calls": len(api_cache),
         "openai_unique_api_calls": len(openai_cache),
         "openai_jobs_written": openai_written,
         "failed_positions": failed_positions,
+        "positions_ranked": rankings["ranked"],
+        "positions_llm_ranked": rankings["llm_ranked"],
+        "failed_rankings": rankings["failed"],
+        "duration_seconds": round(time.monotonic() - started, 1),
     }
     logger.info(f"Refresh complete: {result}")
     return result
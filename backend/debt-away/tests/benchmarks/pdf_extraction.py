@@ -0,0 +1,110 @@
+"""
+Resume PDF text extraction: time, peak memory and output size per backend.
+
+Runs every PDF_BACKENDS entry of resume_text over the sample resumes in
+resume_corpus/ (regenerate them with make_resume_corpus.py), or over any
+directory of PDFs given with --corpus:
+
+    python tests/benchmarks/pdf_extraction.py --runs 20
+    python tests/benchmarks/pdf_extraction.py --corpus ~/resumes
+
+Each backend runs in its own process. "RSS +KB" is the growth of that
+process's peak RSS since import, cumulative down the file list; it includes
+PDFium's native allocations, which tracemalloc does not see. "py peak KB" is
+tracemalloc's peak for one extraction of the file.
+"""
+import argparse
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+
+API_DIR = os.environ.get('LAMBDA_TASK_ROOT', os.path.join(os.path.dirname(__file__), '..', '..', 'api'))
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resume_corpus')
+
+
+def _corpus(directory: str):
+    return sorted(os.path.join(directory, name) for name in os.listdir(directory) if name.lower().endswith('.pdf'))
+
+
+def _max_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def worker(backend: str, corpus: str, runs: int) -> None:
+    """Measure one backend over the corpus and print one JSON row per file."""
+    os.environ.setdefault('POWERTOOLS_LOG_LEVEL', 'ERROR')
+    sys.path.insert(0, API_DIR)
+    import resume_text
+
+    baseline_rss = _max_rss_kb()
+    for path in _corpus(corpus):
+        with open(path, 'rb') as f:
+            file_content = f.read()
+        row = {'file': os.path.basename(path), 'backend': backend}
+        try:
+            text = resume_text._read_pages(backend, file_content, resume_text.MAX_PDF_PAGES,
+                                           resume_text.MAX_TEXT_CHARS)
+        except Exception as e:
+            print(json.dumps({**row, 'error': str(e)}), flush=True)
+            continue
+
+        tracemalloc.start()
+        resume_text._read_pages(backend, file_content, resume_text.MAX_PDF_PAGES, resume_text.MAX_TEXT_CHARS)
+        python_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        timings = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            resume_text._read_pages(backend, file_content, resume_text.MAX_PDF_PAGES, resume_text.MAX_TEXT_CHARS)
+            timings.append((time.perf_counter() - started) * 1000)
+
+        print(json.dumps({
+            **row,
+            'median_ms': statistics.median(timings),
+            'min_ms': min(timings),
+            'python_peak_kb': python_peak / 1024,
+            'rss_growth_kb': _max_rss_kb() - baseline_rss,
+            'chars': len(text),
+            'words': len(text.split()),
+        }), flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', default=CORPUS_DIR)
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--backend', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.backend:
+        worker(args.backend, args.corpus, args.runs)
+        return
+
+    sys.path.insert(0, API_DIR)
+    os.environ.setdefault('POWERTOOLS_LOG_LEVEL', 'ERROR')
+    import resume_text
+
+    print(f"corpus: {args.corpus} ({len(_corpus(args.corpus))} PDFs); runs: {args.runs}; "
+          f"default backend: {resume_text.PDF_BACKEND}")
+    print(f"{'file':<18} {'backend':<8} {'median ms':>10} {'min ms':>8} {'py peak KB':>11} "
+          f"{'RSS +KB':>8} {'chars':>7} {'words':>6}")
+    for backend in resume_text.PDF_BACKENDS:
+        result = subprocess.run([sys.executable, __file__, '--backend', backend, '--corpus', args.corpus,
+                                 '--runs', str(args.runs)], capture_output=True, text=True, check=True)
+        for line in result.stdout.splitlines():
+            row = json.loads(line)
+            if 'error' in row:
+                print(f"{row['file']:<18} {backend:<8} failed: {row['error']}")
+                continue
+            print(f"{row['file']:<18} {backend:<8} {row['median_ms']:>10.2f} {row['min_ms']:>8.2f} "
+                  f"{row['python_peak_kb']:>11.1f} {row['rss_growth_kb']:>8} {row['chars']:>7} {row['words']:>6}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from api import app_data_repository as app_data  # noqa: E402
+
+TABLE = app_data.APP_DATA_TABLE
+
+
+class ThrottledClient:
+    """batch_get_item that leaves one key unprocessed on each of the first ``throttled`` calls."""
+
+    def __init__(self, throttled):
+        self.throttled = throttled
+        self.calls = []
+
+    def batch_get_item(self, RequestItems):
+        keys = RequestItems[TABLE]["Keys"]
+        self.calls.append(len(keys))
+        if len(self.calls) <= self.throttled:
+            keys, unprocessed = keys[:-1], {TABLE: {"Keys": keys[-1:]}}
+        else:
+            unprocessed = {}
+        items = [{**key, "data": {"S": key["SK"]["S"].lower()}} for key in keys]
+        return {"Responses": {TABLE: items}, "UnprocessedKeys": unprocessed}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    def make(throttled):
+        fake = ThrottledClient(throttled)
+        monkeypatch.setattr(app_data, "_client", fake)
+        monkeypatch.setattr(app_data, "BATCH_GET_RETRY_BASE_DELAY", 0)
+        return fake
+    return make
+
+
+def _batch_get():
+    return asyncio.run(app_data.batch_get_user_items("sub-1", ["PROFILE#MAIN", "USAGE", "USAGE"]))
+
+
+def test_unprocessed_keys_are_retried(client):
+    fake = client(throttled=2)
+
+    items = _batch_get()
+
+    assert {sk: item["data"] for sk, item in items.items()} == {"PROFILE#MAIN": "profile#main", "USAGE": "usage"}
+    assert fake.calls == [2, 1, 1]
+
+
+def test_retries_stop_after_max_attempts(client):
+    fake = client(throttled=app_data.BATCH_GET_MAX_ATTEMPTS)
+
+    with pytest.raises(app_data.UnprocessedKeys):
+        _batch_get()
+    assert len(fake.calls) == app_data.BATCH_GET_MAX_ATTEMPTS
@@ -0,0 +1,75 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+for _dependency in ("fastapi", "aws_lambda_powertools", "boto3"):
+    pytest.importorskip(_dependency)
+
+from api.routers import chat as chat_router  # noqa: E402
+
+CHAT = {"evaluation": None, "messages": [{"role": "user", "content": "hi"}],
+        "email": "ada@example.com", "career_focus": "software-engineering"}
+
+
+def _chunk(content=None, tool_name=None, tool_args=None, index=0):
+    tool_calls = None
+    if tool_name is not None or tool_args is not None:
+        tool_calls = [SimpleNamespace(index=index, function=SimpleNamespace(name=tool_name, arguments=tool_args))]
+    return SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=content, tool_calls=tool_calls))])
+
+
+class FakeLLM:
+    """A streamed chat completion yielding the given chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        assert kwargs["stream"] is True
+
+        async def stream():
+            for chunk in self.chunks:
+                yield chunk
+        return stream()
+
+
+def _events(chunks):
+    async def collect():
+        return [event async for event in chat_router._stream_ai_chat(dict(CHAT), FakeLLM(chunks))]
+
+    parsed = []
+    for event in asyncio.run(collect()):
+        name, data = event.strip().split("\n")
+        parsed.append((name[len("event: "):], json.loads(data[len("data: "):])))
+    return parsed
+
+
+def test_tokens_stream_before_done():
+    events = _events([_chunk("Add "), SimpleNamespace(choices=[]), _chunk("metrics.")])
+
+    assert events == [
+        ("token", {"text": "Add "}),
+        ("token", {"text": "metrics."}),
+        ("done", {"status": "success", "reply": "Add metrics."}),
+    ]
+
+
+def test_tool_call_arrives_only_in_done():
+    events = _events([
+        _chunk(tool_name="show_pricing", tool_args='{"reply": "Here are'),
+        _chunk(tool_args=' our plans."}'),
+        _chunk(tool_name="ask_resume_intent", index=1),  # only the first tool call is acted on
+    ])
+
+    assert events == [("done", {"status": "success", "reply": "Here are our plans.",
+                                "action": {"type": "show_pricing"}})]
+
+
+def test_failure_ends_the_stream_with_an_error_event():
+    events = _events([_chunk("Partial"), None])
+
+    assert [name for name, _ in events] == ["token", "error"]
+    assert events[-1][1]["status"] == "error"
@@ -0,0 +1,84 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+yaml = pytest.importorskip("yaml")
+for _dependency in ("fastapi", "mangum", "boto3", "aws_lambda_powertools"):
+    pytest.importorskip(_dependency)
+
+from api import analysis_api, app, chat_api, read_api  # noqa: E402
+
+ROOT = os.path.join(os.path.dirname(__file__), "..", "..")
+ENTRY_POINTS = {
+    "ReadApiFunction": read_api,
+    "ChatApiFunction": chat_api,
+    "AnalysisApiFunction": analysis_api,
+}
+
+
+class _TemplateLoader(yaml.SafeLoader):
+    """Reads CloudFormation short-form intrinsics (!Ref, !Sub, ...) as plain values."""
+
+
+def _intrinsic(loader, suffix, node):
+    if isinstance(node, yaml.ScalarNode):
+        return loader.construct_scalar(node)
+    if isinstance(node, yaml.SequenceNode):
+        return loader.construct_sequence(node)
+    return loader.construct_mapping(node)
+
+
+_TemplateLoader.add_multi_constructor("!", _intrinsic)
+
+
+@pytest.fixture(scope="module")
+def resources():
+    with open(os.path.join(ROOT, "template.yaml")) as f:
+        return yaml.load(f, Loader=_TemplateLoader)["Resources"]
+
+
+def _routes(module):
+    return {(path, method.upper()) for path, methods in module.app.openapi()["paths"].items() for method in methods}
+
+
+def _api_events(function):
+    return {(event["Properties"]["Path"], event["Properties"]["Method"])
+            for event in function["Properties"].get("Events", {}).values() if event["Type"] == "Api"}
+
+
+@pytest.mark.parametrize("name", sorted(ENTRY_POINTS))
+def test_function_routes_match_its_entry_point(resources, name):
+    assert _api_events(resources[name]) == _routes(ENTRY_POINTS[name])
+
+
+def test_entry_points_split_the_app_without_overlap(resources):
+    groups = [_routes(module) for module in ENTRY_POINTS.values()]
+    claimed = set().union(*groups)
+
+    assert sum(len(group) for group in groups) == len(claimed)
+    assert claimed < _routes(app)
+    assert ("/{proxy+}", "ANY") in _api_events(resources["UnifiedApiFunction"])
+
+
+def test_read_api_leaves_llm_and_document_code_out():
+    api_dir = os.path.join(ROOT, "api")
+    result = subprocess.run([sys.executable, "-c", "import sys, read_api; print(' '.join(sys.modules))"],
+                            cwd=api_dir, env={**os.environ, "PYTHONPATH": api_dir, "POWERTOOLS_LOG_LEVEL": "ERROR"},
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr[-2000:]
+    loaded = set(result.stdout.split())
+
+    assert loaded.isdisjoint({"llm_gateway", "llm_cache", "latex_engine", "routers.analysis",
+                              "routers.crafting", "routers.chat", "routers.pdf", "openai", "numpy"})
+
+
+def test_public_stream_function_serves_only_chat(resources):
+    command = resources["AiChatStreamFunction"]["Properties"]["ImageConfig"]["Command"]
+    module_name, _, attribute = command[0].partition(":")
+
+    assert (module_name, attribute) == ("chat_api", "app")
+    assert _routes(chat_api) == {("/ai-chat", "POST")}
+    with open(os.path.join(ROOT, "api", "Dockerfile")) as f:
+        assert 'CMD [ "chat_api:app",' in f.read()
@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+for _dependency in ("fastapi", "httpx", "aws_lambda_powertools", "boto3"):
+    pytest.importorskip(_dependency)
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from api import app_factory  # noqa: E402
+from api.routers import jobs  # noqa: E402
+
+# The module as app_factory and the routers import it (api/ is on sys.path)
+http_client = jobs.http_client
+
+
+class FakeClient:
+    def __init__(self):
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.fixture
+def built(monkeypatch):
+    clients = []
+
+    def build():
+        clients.append(FakeClient())
+        return clients[-1]
+
+    monkeypatch.setattr(http_client, "_build_client", build)
+    monkeypatch.setattr(http_client, "_client", None)
+    monkeypatch.setattr(http_client, "_client_loop", None)
+    return clients
+
+
+async def _get_client():
+    client = http_client.get_http_client()
+    await asyncio.sleep(0)  # let the aclose() of a replaced client run
+    return client
+
+
+def test_client_of_a_previous_loop_is_closed_on_rebuild(built):
+    first = asyncio.run(_get_client())
+    second = asyncio.run(_get_client())
+
+    assert second is not first
+    assert first.closed and not second.closed
+
+
+def test_lifespan_closes_the_client_on_shutdown(built, monkeypatch):
+    monkeypatch.setattr(app_factory.resources, "WARM_RESOURCES", app_factory.resources.OFF)
+    app = app_factory.create_app(jobs)
+
+    @app.get("/_client")
+    async def open_client():
+        http_client.get_http_client()
+
+    with TestClient(app) as client:
+        client.get("/_client")
+        assert not built[0].closed
+
+    assert built[0].closed and http_client._client is None
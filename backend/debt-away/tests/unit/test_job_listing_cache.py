@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+pytest.importorskip("boto3")
+pytest.importorskip("requests")
+
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+from job_listing_cache import handler  # noqa: E402
+
+JOB_TYPE = "Software Engineering"
+POSITION = handler.normalize_position_name("backend engineer")
+OLD_KEYS = {f"{POSITION}#old_listing": "h-old", f"{POSITION}#oa_old_listing": "h-oa-old"}
+NEW_KEYS = {f"{POSITION}#new_listing": "h-new"}
+
+
+@pytest.fixture
+def refresh(monkeypatch):
+    """One job type, one position; JSearch returns one listing, OpenAI nothing."""
+    calls = {"saved": [], "deleted": [], "loads": 0}
+
+    monkeypatch.setattr(handler, "JOB_CATEGORIES", {JOB_TYPE: ["backend engineer"]})
+    monkeypatch.setattr(handler, "fetch_jobs_for_query", lambda query, max_pages=2: [{"job_id": "new_listing"}])
+    monkeypatch.setattr(handler, "fetch_jobs_from_openai", lambda position_name: [])
+
+    def write(job_type, position_name, jobs, batch_id, previous, entries):
+        entries[f"{POSITION}#{jobs[0]['job_id']}"] = "h-new"
+        return {"new": 1, "changed": 0, "unchanged": 0}
+
+    monkeypatch.setattr(handler, "write_jobs_to_dynamo", write)
+    monkeypatch.setattr(handler, "delete_removed_items", lambda job_type, keys: calls["deleted"].extend(keys))
+    monkeypatch.setattr(handler, "save_manifest", lambda job_type, entries, batch_id: calls["saved"].append(entries))
+    monkeypatch.setattr(handler, "build_base_rankings",
+                        lambda positions, batch_id: {"ranked": 0, "llm_ranked": 0, "failed": []})
+
+    def load_with(*outcomes):
+        def load(job_type):
+            outcome = outcomes[min(calls["loads"], len(outcomes) - 1)]
+            calls["loads"] += 1
+            if isinstance(outcome, Exception):
+                raise outcome
+            return dict(outcome)
+        monkeypatch.setattr(handler, "load_previous_hashes", load)
+        handler.lambda_handler({}, None)
+        return calls
+
+    return load_with
+
+
+def test_previous_keys_drive_deletes_and_carry_over(refresh):
+    calls = refresh(OLD_KEYS)
+
+    # The OpenAI listing is kept because that fetch came back empty
+    assert calls["deleted"] == [f"{POSITION}#old_listing"]
+    assert calls["saved"] == [{**NEW_KEYS, f"{POSITION}#oa_old_listing": "h-oa-old"}]
+
+
+def test_phase_0_failure_keeps_previous_keys_in_the_manifest(refresh):
+    calls = refresh(ConnectionError("throttled"), OLD_KEYS)
+
+    assert calls["deleted"] == []
+    assert calls["saved"] == [{**OLD_KEYS, **NEW_KEYS}]
+
+
+def test_manifest_is_left_alone_while_previous_keys_are_unavailable(refresh):
+    calls = refresh(ConnectionError("throttled"))
+
+    assert calls["loads"] == 2
+    assert calls["deleted"] == [] and calls["saved"] == []
@@ -0,0 +1,145 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from api import job_ranking
+
+
+def _job(title, company, skills=None):
+    return {
+        "job_title": title,
+        "company_name": company,
+        "job_url": f"https://jobs.example.com/{company}/{title}",
+        "job_skills": skills or [],
+    }
+
+
+def _top(jobs, user_skills, career_focus="", limit=job_ranking.RECOMMENDATION_LIMIT):
+    """What /job-recommendations returns for a pool, without the LLM tie-break."""
+    index = job_ranking.build_index(jobs)
+    ranking = job_ranking.rank(index, user_skills, career_focus)
+    return [job_ranking.public_job(index.jobs[i]) for i in ranking.order[:limit]]
+
+
+def test_skill_match_lifts_listing_above_base_order():
+    ranked = [
+        _job("Backend Engineer, Payments", "Stripe"),
+        _job("Backend Engineer - Python, Kubernetes", "Uber"),
+        _job("Backend Engineer", "Google"),
+    ]
+
+    result = _top(ranked, ["Python", "Kubernetes"], limit=3)
+
+    assert [job["company_name"] for job in result] == ["Uber", "Stripe", "Google"]
+    assert set(result[0]) == {"job_title", "company_name", "job_url"}
+
+
+def test_required_skills_count_towards_match():
+    ranked = [
+        _job("Software Engineer", "Acme"),
+        _job("Software Engineer", "Initech", skills=["Rust", "gRPC"]),
+    ]
+
+    result = _top(ranked, ["rust"], limit=2)
+
+    assert result[0]["company_name"] == "Initech"
+
+
+def test_company_tier_from_target_companies():
+    assert job_ranking.company_score("Google LLC") == 1.0
+    assert job_ranking.company_score("Stripe, Inc.") == 0.85
+    assert job_ranking.company_score("Cleanlab") == job_ranking.UNLISTED_COMPANY_SCORE
+
+    ranked = [_job("Data Engineer", "Small Startup"), _job("Data Engineer", "Meta")]
+    assert _top(ranked, [], limit=2)[0]["company_name"] == "Meta"
+
+
+def test_without_profile_base_order_is_kept():
+    ranked = [_job(f"Engineer {i}", f"Company {i}") for i in range(30)]
+
+    result = _top(ranked, [], "")
+
+    assert [job["job_url"] for job in result] == [job["job_url"] for job in ranked[:20]]
+
+
+def test_diversity_penalty_interleaves_companies():
+    ranked = [_job(f"Engineer {i}", "Google") for i in range(5)] + [_job("Engineer", "Meta")]
+
+    result = _top(ranked, [], limit=4)
+
+    assert [job["company_name"] for job in result] == ["Google", "Meta", "Google", "Google"]
+
+
+def test_tie_window_around_cutoff():
+    ranking = job_ranking.Ranking(
+        order=np.arange(6),
+        scores=np.array([0.9, 0.8, 0.5, 0.5, 0.5, 0.1], dtype=np.float32),
+    )
+
+    assert job_ranking.tie_window(ranking, limit=3) == (2, 5)
+    assert job_ranking.tie_window(ranking, limit=2) == (0, 0)
+
+
+def test_index_is_cached_per_batch():
+    jobs = [_job("Engineer", "Acme")]
+
+    first = job_ranking.get_index("backend_engineer", "2026-10-01T03:00:00Z", jobs)
+
+    assert job_ranking.get_index("backend_engineer", "2026-10-01T03:00:00Z", jobs) is first
+    assert job_ranking.get_index("backend_engineer", "2026-10-15T03:00:00Z", jobs) is not first
+
+
+@pytest.fixture
+def jobs_router():
+    for dependency in ("fastapi", "aws_lambda_powertools", "boto3"):
+        pytest.importorskip(dependency)
+    from api.routers import jobs
+
+    return jobs
+
+
+def _recommend(jobs_router, body):
+    class FakeRequest:
+        async def json(self):
+            return body
+
+    return asyncio.run(jobs_router.get_job_recommendations(FakeRequest(), llm=None))
+
+
+def test_recommendations_rank_the_stored_snapshot(jobs_router, monkeypatch):
+    pool = [_job(f"Backend Engineer {i}", f"Company {i}") for i in range(25)]
+    pool.append(_job("Backend Engineer - Rust", "Initech", skills=["Rust"]))
+
+    async def get_snapshot(position):
+        assert position == "backend_engineer"
+        return jobs_router.job_snapshots.PositionSnapshot(position, "2026-10-15T03:00:00Z", pool)
+
+    monkeypatch.setattr(jobs_router.job_snapshots, "get_snapshot", get_snapshot)
+
+    result = _recommend(jobs_router, {"position_name": "Backend Engineer", "user_skills": ["rust"]})
+
+    assert result["success"] and len(result["jobs"]) == job_ranking.RECOMMENDATION_LIMIT
+    assert result["jobs"][0] == job_ranking.public_job(pool[-1])
+
+
+def test_recommendations_fall_back_to_the_live_pool(jobs_router, monkeypatch):
+    async def no_snapshot(position):
+        return None
+
+    pages = [{"Items": [{"job_title": {"S": "Data Engineer"}, "company_name": {"S": "Meta"},
+                         "job_url": {"S": "https://jobs.example.com/meta"}, "job_skills": {"L": []}}]},
+             {"Items": [{"job_title": {"S": "Data Engineer"}, "company_name": {"S": "Small Startup"},
+                         "job_url": {"S": "https://jobs.example.com/startup"}}]}]
+
+    class FakeClient:
+        def get_paginator(self, operation):
+            assert operation == "query"
+            return type("Paginator", (), {"paginate": lambda self, **kwargs: iter(pages)})()
+
+    monkeypatch.setattr(jobs_router.job_snapshots, "get_snapshot", no_snapshot)
+    monkeypatch.setattr(jobs_router, "get_dynamodb_client", lambda: FakeClient())
+
+    result = _recommend(jobs_router, {"position_name": "Data Engineer"})
+
+    assert [job["company_name"] for job in result["jobs"]] == ["Meta", "Small Startup"]
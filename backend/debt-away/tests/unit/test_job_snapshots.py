@@ -0,0 +1,65 @@
+import asyncio
+import json
+import zlib
+
+import pytest
+
+pytest.importorskip("aws_lambda_powertools")
+pytest.importorskip("boto3")
+
+from api import job_snapshots  # noqa: E402
+
+JOBS = [{"job_title": "Backend Engineer", "company_name": "Initech"}]
+
+
+class FakeClient:
+    """Low-level DynamoDB client answering get_item from a dict keyed by sort key."""
+
+    def __init__(self, items):
+        self.items = items
+        self.requests = []
+
+    def get_item(self, **params):
+        self.requests.append(params)
+        item = self.items.get(params["Key"]["sk"]["S"])
+        return {"Item": item} if item is not None else {}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    fake = FakeClient({
+        job_snapshots.CURRENT_BATCH_SK: {"batch_id": {"S": "batch-1"}},
+        "backend_engineer": {"snapshot": {"B": zlib.compress(json.dumps(JOBS).encode())},
+                             "batch_id": {"S": "batch-1"}},
+    })
+    monkeypatch.setattr(job_snapshots, "get_dynamodb_client", lambda: fake)
+    monkeypatch.setattr(job_snapshots, "_snapshots", job_snapshots.OrderedDict())
+    monkeypatch.setattr(job_snapshots, "_current_batch", {"batch_id": None, "checked_at": 0.0})
+    return fake
+
+
+def test_get_snapshot_reads_the_current_batch_once(client):
+    snapshot = asyncio.run(job_snapshots.get_snapshot("backend_engineer"))
+    assert asyncio.run(job_snapshots.get_snapshot("backend_engineer")) is snapshot
+
+    assert (snapshot.batch_id, snapshot.jobs) == ("batch-1", JOBS)
+    current, position = client.requests
+    assert current == {
+        "TableName": "jobCache",
+        "Key": {"job_type": {"S": "#ranking"}, "sk": {"S": "#current"}},
+        "ProjectionExpression": "batch_id",
+    }
+    # SNAPSHOT is a reserved word, so it must go through ExpressionAttributeNames
+    assert position == {
+        "TableName": "jobCache",
+        "Key": {"job_type": {"S": "#ranking"}, "sk": {"S": "backend_engineer"}},
+        "ProjectionExpression": "#snap, jobs, batch_id",
+        "ExpressionAttributeNames": {"#snap": "snapshot"},
+    }
+
+
+def test_missing_snapshot_is_cached_as_none(client):
+    assert asyncio.run(job_snapshots.get_snapshot("data_engineer")) is None
+    assert asyncio.run(job_snapshots.get_snapshot("data_engineer")) is None
+
+    assert len(client.requests) == 2
@@ -0,0 +1,18 @@
+import pytest
+
+pytest.importorskip("aws_lambda_powertools")
+
+from api import latex_engine  # noqa: E402
+
+
+def test_rerun_only_when_log_asks():
+    assert not latex_engine.needs_rerun("Output written on resume.pdf (1 page, 41234 bytes).")
+    assert latex_engine.needs_rerun("LaTeX Warning: Label(s) may have changed. Rerun to get cross-references right.")
+    assert latex_engine.needs_rerun("Package rerunfilecheck Warning: File `resume.out' has changed.\n(rerunfilecheck) Rerun")
+
+
+def test_split_preamble():
+    body = "\\begin{document}\nHi\n\\end{document}\n"
+
+    assert latex_engine.split_preamble(latex_engine.RESUME_PREAMBLE + body) == body
+    assert latex_engine.split_preamble("\\documentclass{article}\n" + body) is None
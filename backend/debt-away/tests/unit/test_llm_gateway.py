@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aws_lambda_powertools")
+pytest.importorskip("httpx")
+
+from api import llm_gateway  # noqa: E402
+
+
+class FakeClient:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def built(monkeypatch):
+    clients = []
+
+    def build():
+        clients.append(FakeClient())
+        return clients[-1]
+
+    monkeypatch.setattr(llm_gateway, "_build_client", build)
+    monkeypatch.setattr(llm_gateway, "_client", None)
+    monkeypatch.setattr(llm_gateway, "_client_loop", None)
+    return clients
+
+
+async def _get_client():
+    client = llm_gateway.get_llm_client()
+    await asyncio.sleep(0)  # let the close() of a replaced client run
+    return client
+
+
+def test_client_is_reused_on_the_same_loop(built):
+    async def twice():
+        return llm_gateway.get_llm_client(), llm_gateway.get_llm_client()
+
+    first, second = asyncio.run(twice())
+
+    assert first is second and len(built) == 1
+
+
+def test_client_of_a_previous_loop_is_closed_on_rebuild(built):
+    first = asyncio.run(_get_client())
+    second = asyncio.run(_get_client())
+
+    assert second is not first
+    assert first.closed and not second.closed
+
+    asyncio.run(llm_gateway.close_llm_client())
+    assert second.closed and llm_gateway._client is None
@@ -0,0 +1,92 @@
+import asyncio
+
+import httpx
+import pytest
+
+for _dependency in ("aws_lambda_powertools", "fastapi", "bs4"):
+    pytest.importorskip(_dependency)
+
+from api.routers import shared  # noqa: E402
+
+# The modules as fetch_web_page_content imports them (api/ is on sys.path)
+page_cache = shared.page_cache
+http_client = shared.http_client
+
+URL = "https://jobs.example.com/posting/42"
+PAGE = b"<html><body><h1>Backend Engineer</h1><p>" + b"Build and run the payments API. " * 4 + b"</p></body></html>"
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(page_cache, "_entries", page_cache.OrderedDict())
+    monkeypatch.setattr(page_cache, "_stats", {"fresh_hits": 0, "revalidated_hits": 0, "misses": 0, "stores": 0})
+
+
+@pytest.fixture
+def server(monkeypatch):
+    """Answers fetches with the queued (status, headers) responses and records the request headers."""
+    responses, requests = [], []
+
+    async def fetch(url, headers=None, timeout=None):
+        requests.append(headers)
+        status, response_headers = responses.pop(0)
+        return http_client.FetchResult(status, httpx.Headers(response_headers), PAGE if status == 200 else b"", url)
+
+    monkeypatch.setattr(http_client, "fetch", fetch)
+    return responses, requests
+
+
+def _expire(url):
+    page_cache.lookup(url).validated_at -= page_cache.PAGE_CACHE_FRESH_SECONDS + 1
+
+
+def test_fresh_stale_and_revalidated_paths(server):
+    responses, requests = server
+    responses.append((200, {"content-type": "text/html", "etag": '"v1"'}))
+
+    text = asyncio.run(shared.fetch_web_page_content(URL))
+    assert "Backend Engineer" in text
+
+    # Fresh: served from memory, no request
+    assert asyncio.run(shared.fetch_web_page_content(URL)) == text
+    assert len(requests) == 1
+
+    # Stale: conditional GET, and a 304 makes the entry fresh again
+    _expire(URL)
+    responses.append((304, {}))
+    assert asyncio.run(shared.fetch_web_page_content(URL)) == text
+    assert requests[1]["If-None-Match"] == '"v1"'
+    assert page_cache.lookup(URL).is_fresh
+
+    assert page_cache.stats() == {"fresh_hits": 1, "revalidated_hits": 1, "misses": 1, "stores": 1,
+                                  "entries": 1, "hit_rate": round(2 / 3, 4)}
+
+
+def test_changed_page_is_downloaded_and_stored_again(server):
+    responses, requests = server
+    page_cache.store(URL, "old text", etag='"v1"', last_modified="Wed, 01 Oct 2025 00:00:00 GMT")
+    _expire(URL)
+    responses.append((200, {"content-type": "text/html", "etag": '"v2"'}))
+
+    assert "Backend Engineer" in asyncio.run(shared.fetch_web_page_content(URL))
+    assert requests[0]["If-Modified-Since"] == "Wed, 01 Oct 2025 00:00:00 GMT"
+    assert page_cache.lookup(URL).etag == '"v2"'
+
+
+def test_least_recently_used_entries_are_evicted(monkeypatch):
+    monkeypatch.setattr(page_cache, "PAGE_CACHE_MAX_ENTRIES", 2)
+    for name in ("a", "b"):
+        page_cache.store(name, name, None, None)
+    page_cache.lookup("a")
+    page_cache.store("c", "c", None, None)
+
+    assert page_cache.lookup("b") is None
+    assert page_cache.lookup("a").text == "a" and page_cache.lookup("c").text == "c"
+
+
+def test_entries_never_revalidated_expire():
+    page_cache.store(URL, "text", None, None)
+    page_cache.lookup(URL).validated_at -= page_cache.PAGE_CACHE_MAX_AGE_SECONDS + 1
+
+    assert page_cache.lookup(URL) is None
+    assert page_cache.stats()["entries"] == 0
@@ -0,0 +1,39 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aws_lambda_powertools")
+pytest.importorskip("boto3")
+
+from api import pdf_render_cache  # noqa: E402
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    uploads = []
+    monkeypatch.setattr(pdf_render_cache, "LOCAL_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(pdf_render_cache, "LOCAL_CACHE_MAX_ENTRIES", 2)
+    monkeypatch.setattr(pdf_render_cache, "_local", pdf_render_cache.OrderedDict())
+    monkeypatch.setattr(pdf_render_cache, "enqueue_upload", lambda key, body, content_type: uploads.append(key))
+    monkeypatch.setattr(pdf_render_cache, "_s3_get", lambda key: None)
+    return uploads
+
+
+def test_render_key_depends_only_on_latex():
+    assert pdf_render_cache.render_key("\\begin{document}") == pdf_render_cache.render_key("\\begin{document}")
+    assert pdf_render_cache.render_key("\\begin{document}") != pdf_render_cache.render_key("\\begin{document} ")
+
+
+def test_put_then_get_from_local_lru(cache):
+    pdf_render_cache.put("a", b"%PDF-a")
+
+    assert asyncio.run(pdf_render_cache.get("a")) == b"%PDF-a"
+    assert cache == ["resume-pdf-cache/a.pdf"]
+
+
+def test_local_lru_evicts_oldest(cache):
+    for key in ("a", "b", "c"):
+        pdf_render_cache.put(key, f"%PDF-{key}".encode())
+
+    assert asyncio.run(pdf_render_cache.get("a")) is None
+    assert asyncio.run(pdf_render_cache.get("c")) == b"%PDF-c"
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+for _dependency in ("fastapi", "mangum", "boto3", "aws_lambda_powertools"):
+    pytest.importorskip(_dependency)
+
+from fastapi import APIRouter  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from api import app_factory  # noqa: E402
+
+# The registry as app_factory and the routers import it (api/ is on sys.path)
+resources = app_factory.resources
+
+
+@pytest.fixture
+def warmers(monkeypatch):
+    """Replaces the registry with fakes that record the thread and loop they ran on."""
+    calls = {}
+
+    def blocking(connect):
+        calls["blocking"] = threading.get_ident()
+
+    async def on_loop(connect):
+        calls["on_loop"] = asyncio.get_running_loop()
+
+    def failing(connect):
+        raise ConnectionError("unreachable")
+
+    monkeypatch.setattr(resources, "WARMERS", {"blocking": blocking, "on_loop": on_loop, "failing": failing})
+    return calls
+
+
+def _router_module(*names):
+    return SimpleNamespace(router=APIRouter(), RESOURCES=names)
+
+
+def test_required_merges_router_declarations(warmers):
+    assert resources.required([_router_module("on_loop", "blocking"), _router_module("blocking"),
+                                SimpleNamespace(router=APIRouter())]) == ("blocking", "on_loop")
+    with pytest.raises(ValueError):
+        resources.required([_router_module("dynamo")])
+
+
+def test_warm_async_reports_failures_without_raising(warmers):
+    timings = asyncio.run(resources.warm_async(["blocking", "failing", "on_loop"], connect=False))
+
+    assert timings["failing"] is None
+    assert all(timings[name] is not None for name in ("blocking", "on_loop"))
+    # Blocking warmers run in a worker thread, where WARM_TIMEOUT can bound them
+    assert warmers["blocking"] != threading.get_ident()
+
+
+def test_create_handler_warms_on_the_loop_mangum_serves_on(warmers, monkeypatch):
+    monkeypatch.setattr(resources, "WARM_RESOURCES", resources.INIT)
+
+    app_factory.create_handler(app_factory.create_app(_router_module("on_loop")))
+
+    assert warmers["on_loop"] is asyncio.get_event_loop()
+    assert "blocking" not in warmers
+
+
+def test_nothing_is_warmed_outside_lambda(warmers, monkeypatch):
+    monkeypatch.setattr(resources, "WARM_RESOURCES", resources.OFF)
+
+    app = app_factory.create_app(_router_module("on_loop"))
+    app_factory.create_handler(app)
+    with TestClient(app):
+        pass
+
+    assert warmers == {}
+
+
+def test_handlers_receive_clients_through_dependencies():
+    from api.routers import landing
+
+    saved = []
+    table = SimpleNamespace(load=lambda: None, put_item=lambda **kwargs: saved.append(kwargs["Item"]))
+    app = app_factory.create_app(landing)
+    app.dependency_overrides[resources.dynamodb_resource] = lambda: SimpleNamespace(Table=lambda name: table)
+
+    with TestClient(app) as client:
+        assert client.post("/lead_sign_up", json={"email": "not-an-email"}).status_code == 400
+        response = client.post("/lead_sign_up", json={"email": "ada@example.com"})
+
+    assert response.status_code == 200
+    assert [item["email"] for item in saved] == ["ada@example.com"]
+
+
+def test_stream_image_warms_only_what_chat_uses():
+    from api import chat_api
+
+    assert chat_api.app.state.resources == ("dynamodb", "html", "openai")
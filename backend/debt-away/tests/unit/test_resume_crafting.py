@@ -0,0 +1,105 @@
+from api import resume_crafting
+
+
+def _project(name, **overrides):
+    project = {
+        "projectName": name,
+        "projectDescription": {"overview": f"{name} overview", "techAndTeamwork": "", "achievement": "Cut latency 40%"},
+        "projectStartMonth": "Jan",
+        "projectStartYear": "2024",
+        "projectEndMonth": "",
+        "projectEndYear": "",
+        "selectedTechnologies": ["Python"],
+        "selectedFrameworks": ["FastAPI"],
+    }
+    project.update(overrides)
+    return project
+
+
+def test_header_from_basic_info():
+    header = resume_crafting.header({
+        "firstName": "Jordan", "middleName": "", "lastName": "Lee",
+        "email": "jordan@lee.dev", "phone": "",
+        "addressStreet": "1 Main St", "addressState": "WA", "addressZip": "98101",
+        "links": [{"name": "GitHub", "url": "github.com/jlee"}, {"name": "Empty", "url": ""}],
+    })
+
+    assert header == {
+        "full_name": "Jordan Lee",
+        "email_address": "jordan@lee.dev",
+        "phone_number": None,
+        "home_address": "1 Main St, WA 98101",
+        "links": ["GitHub: github.com/jlee"],
+    }
+
+
+def test_history_is_most_recent_first():
+    education = resume_crafting.education_history([{
+        "collegeName": "UW", "location": "Seattle, WA",
+        "degrees": [
+            {"degree": "B.S.", "major": "CS", "startMonth": "Sep", "startYear": "2014",
+             "endMonth": "Jun", "endYear": "2018", "coursework": "Algorithms, Databases"},
+            {"degree": "M.S.", "major": "CS", "startMonth": "Sep", "startYear": "2018",
+             "endMonth": "", "endYear": "", "coursework": ""},
+        ],
+    }])
+    history = resume_crafting.professional_history([
+        {"companyName": "Acme", "jobTitle": "SWE", "startMonth": "Jan", "startYear": "2019",
+         "endMonth": "Mar", "endYear": "2021", "isPresent": False},
+        {"companyName": "Initech", "jobTitle": "SWE II", "startMonth": "Apr", "startYear": "2021",
+         "endMonth": "", "endYear": "", "isPresent": True, "location": "Remote"},
+    ])
+
+    assert [entry["degree"] for entry in education] == ["M.S.", "B.S."]
+    assert education[1]["coursework"] == ["Algorithms", "Databases"]
+    assert education[1]["start_date"] == "Sep 2014"
+    assert [entry["company_name"] for entry in history] == ["Initech", "Acme"]
+    assert history[0]["end_date"] == "Present"
+
+
+def test_merge_project_content_keeps_input_fields():
+    projects = [_project("Ledger"), _project("Relay")]
+    contents = [{
+        "overview_content": "Built a ledger.",
+        "tech_content": [{"content": "a"}, {"content": "b"}, {"content": "c"}],
+        "achievement_content": "Faster.",
+        "technologies": ["Go"],
+    }]
+
+    merged = resume_crafting.merge_project_content(projects, contents)
+
+    assert merged[0]["project_name"] == "Ledger"
+    assert merged[0]["start_date"] == "Jan 2024"
+    assert len(merged[0]["tech_content"]) == 2
+    # The model left out the second project: its input text is used
+    assert merged[1]["overview_content"] == "Relay overview"
+    assert merged[1]["technologies"] == ["Python", "FastAPI"]
+
+
+def test_professional_projects_and_technology_dedupe():
+    personal = resume_crafting.merge_project_content([_project("Ledger")], [])
+    professional = resume_crafting.merge_project_content(
+        [_project("Billing", selectedWorkExperience="Acme - SWE", selectedTechnologies=["python", "Kafka"])],
+        [],
+        professional=True,
+    )
+
+    resume_crafting.dedupe_technologies(personal, professional)
+
+    assert professional[0]["work_experience"] == "Acme - SWE"
+    assert "start_date" not in professional[0]
+    assert professional[0]["technologies"] == ["Kafka"]
+
+
+def test_project_technologies_already_in_technical_skills_are_dropped():
+    members = {
+        "personal_projects": [{"technologies": ["Go", "Redis", "gRPC"]}],
+        "professional_projects": [{"technologies": ["redis", "Kafka", "PostgreSQL "]}],
+        "technical_skills": {"Languages": ["Go"], "Frameworks": [], "Tools": ["postgresql"]},
+    }
+
+    resume_crafting.dedupe_crafted_technologies(members)
+
+    assert members["personal_projects"][0]["technologies"] == ["Redis", "gRPC"]
+    assert members["professional_projects"][0]["technologies"] == ["Kafka"]
+    assert members["technical_skills"]["Languages"] == ["Go"]
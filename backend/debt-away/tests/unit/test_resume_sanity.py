@@ -0,0 +1,93 @@
+from types import SimpleNamespace as NS
+
+from api import resume_sanity
+
+
+def _resume(**overrides):
+    resume = dict(
+        name="Jordan Lee",
+        contact_fields=[
+            NS(label="Email", value="jordan@lee.dev"),
+            NS(label="Phone", value="+1 (415) 555-0199"),
+            NS(label="Location", value="Seattle, WA"),
+            NS(label="GitHub", value="github.com/jlee"),
+        ],
+        professional_experiences=[
+            NS(company="Acme", job_titles=[
+                NS(title="Software Engineer", date="Jun 2022 - Present | Seattle, WA",
+                   bullets=["Built a billing service handling 2M requests per day."]),
+            ]),
+        ],
+        education=[
+            NS(university="University of Washington", date="2018 - 2022 | Seattle, WA", degrees=[
+                NS(degree="B.S. Computer Science", description="GPA: 3.8; Coursework: Algorithms, Databases"),
+            ]),
+        ],
+        projects_established=[
+            NS(name="Ledger", date="2023 | Remote", description="",
+               bullets=["Designed a double-entry ledger."], technologies=["Go", "Postgres", "Redis", "Docker"]),
+        ],
+        projects_expanding=[],
+        skills=[NS(topic="Languages", keywords="Go, Python, SQL")],
+    )
+    resume.update(overrides)
+    return NS(**resume)
+
+
+def _rules(req):
+    return [issue["rule"] for issue in resume_sanity.run_local_rules(req)]
+
+
+def test_clean_resume_has_no_local_issues():
+    assert _rules(_resume()) == []
+
+
+def test_placeholder_contact_fields():
+    req = _resume(name="Your Name", contact_fields=[
+        NS(label="Email", value="your.email@example.com"),
+        NS(label="Phone", value="+1 (555) 123-4567"),
+        NS(label="Location", value="City, State, Country"),
+    ])
+
+    assert _rules(req) == ["H1", "H2", "H4", "H5"]
+
+
+def test_invalid_email_and_long_link():
+    fields = _resume().contact_fields
+    fields[0] = NS(label="Email", value="jordan@lee")
+    fields[3] = NS(label="LinkedIn", value="https://www.linkedin.com/in/jordan-lee-1234567890")
+
+    assert _rules(_resume(contact_fields=fields)) == ["H3", "M2"]
+
+
+def test_date_fields_without_location_or_year():
+    req = _resume()
+    req.professional_experiences[0].job_titles[0].date = "Jun 2022 - Present"
+    req.projects_established[0].date = "Remote"
+
+    issues = resume_sanity.run_local_rules(req)
+
+    assert [issue["rule"] for issue in issues] == ["H7", "H12"]
+    assert issues[0]["message"] == (
+        "The work experience 'Software Engineer' at 'Acme' is missing a location city, please add it."
+    )
+
+
+def test_project_and_skill_rules():
+    project = NS(name="Ledger", date="2023 | Remote", description="Ledger  service",
+                 bullets=["word " * 31] + ["ok"] * 5, technologies=["Go", "go", "Redis"])
+    req = _resume(projects_established=[project],
+                  skills=[NS(topic="Languages", keywords="Go, Python"), NS(topic="Backend", keywords="python, gRPC")])
+
+    issues = resume_sanity.sort_issues(resume_sanity.run_local_rules(req))
+
+    assert [issue["rule"] for issue in issues] == ["H15", "M3", "M4", "M5", "M6", "M7"]
+    assert issues[3]["message"].endswith("recommend removing duplicates: Python.")
+
+
+def test_missing_education_details():
+    req = _resume(education=[NS(university="MIT", date="2019 - 2023 | Cambridge, MA",
+                                degrees=[NS(degree="Degree Name", description="")])])
+
+    assert _rules(req) == ["H20", "M1", "L1"]
+    assert _rules(_resume(education=[])) == ["H13"]
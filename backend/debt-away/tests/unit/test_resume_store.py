@@ -0,0 +1,73 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("aws_lambda_powertools")
+pytest.importorskip("boto3")
+from pydantic import BaseModel  # noqa: E402
+
+from api import resume_store  # noqa: E402
+
+
+class Parsed(BaseModel):
+    name: str
+    score: float
+
+
+class FakeTable:
+    def __init__(self):
+        self.items = {}
+        self.reads = 0
+
+    async def get_resume(self, owner, content_hash):
+        self.reads += 1
+        return self.items.get((owner, content_hash))
+
+    async def save_resume_text(self, owner, content_hash, text, filename, timestamp):
+        self.items.setdefault((owner, content_hash), {})["text"] = text
+
+    async def save_resume_parse(self, owner, content_hash, attribute, data, timestamp):
+        self.items.setdefault((owner, content_hash), {})[attribute] = data
+
+
+@pytest.fixture
+def table(monkeypatch):
+    table = FakeTable()
+    for name in ("get_resume", "save_resume_text", "save_resume_parse"):
+        monkeypatch.setattr(resume_store.app_data, name, getattr(table, name))
+    return table
+
+
+def test_second_upload_reuses_text_and_parse(table):
+    extracted, parsed = [], []
+
+    async def extract(content, filename):
+        extracted.append(filename)
+        return content.decode()
+
+    async def produce():
+        parsed.append(1)
+        return Parsed(name="Jordan Lee", score=8.5)
+
+    async def upload():
+        resume = await resume_store.open_resume("sub-1", b"Jordan Lee resume", "cv.pdf", extract)
+        return await resume_store.parse(resume, resume_store.PARSE_RESUME_DATA, Parsed, produce)
+
+    first = asyncio.run(upload())
+    second = asyncio.run(upload())
+
+    assert first == second == Parsed(name="Jordan Lee", score=8.5)
+    assert extracted == ["cv.pdf"] and parsed == [1]
+    stored = table.items[("sub-1", resume_store.content_hash(b"Jordan Lee resume"))]
+    assert stored["parse_resume_parsed_data"]["score"] == Decimal("8.5")
+
+
+def test_without_owner_nothing_is_stored(table):
+    async def extract(content, filename):
+        return "text"
+
+    resume = asyncio.run(resume_store.open_resume(None, b"x", "cv.pdf", extract))
+
+    assert resume.text == "text"
+    assert table.items == {} and table.reads == 0
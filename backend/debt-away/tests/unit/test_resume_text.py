@@ -0,0 +1,89 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("aws_lambda_powertools")
+PyPDF2 = pytest.importorskip("PyPDF2")
+
+from api import resume_text  # noqa: E402
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), "..", "benchmarks", "resume_corpus")
+
+
+class _Page:
+    def __init__(self, text, read):
+        self._text = text
+        self._read = read
+
+    def extract_text(self):
+        self._read.append(self._text)
+        return self._text
+
+
+def _fake_reader(monkeypatch, texts):
+    read = []
+    pages = [_Page(text, read) for text in texts]
+    monkeypatch.setattr(PyPDF2, "PdfReader", lambda stream: SimpleNamespace(pages=pages))
+    return read
+
+
+def test_pdf_page_cap(monkeypatch):
+    read = _fake_reader(monkeypatch, [f"page {i}" for i in range(15)])
+
+    text = resume_text.pdf_text(b"%PDF", max_pages=10, backend=resume_text.PYPDF2)
+
+    assert len(read) == 10
+    assert text.endswith("page 9")
+
+
+def test_pdf_stops_early_past_character_cap(monkeypatch):
+    read = _fake_reader(monkeypatch, ["x" * 400] * 5)
+
+    text = resume_text.pdf_text(b"%PDF", max_chars=1000, backend=resume_text.PYPDF2)
+
+    assert len(read) == 3
+    assert len(text) == 1000
+
+
+def test_failing_backend_falls_back_to_pypdf2(monkeypatch):
+    _fake_reader(monkeypatch, ["Jordan Lee"])
+
+    def broken(file_content, max_pages):
+        raise RuntimeError("unsupported")
+
+    monkeypatch.setitem(resume_text.PDF_BACKENDS, resume_text.PDFIUM, broken)
+
+    assert resume_text.pdf_text(b"%PDF", backend=resume_text.PDFIUM) == "Jordan Lee"
+
+
+def test_pdfium_keeps_word_gaps_of_per_word_text_runs():
+    pytest.importorskip("pypdfium2")
+    with open(os.path.join(CORPUS_DIR, "glyph_runs.pdf"), "rb") as f:
+        text = resume_text.pdf_text(f.read(), backend=resume_text.PDFIUM)
+
+    assert text.startswith("Jordan Lee\n")
+    assert "handling 2M requests per day with Python" in text
+
+
+def test_extraction_is_memoized_and_shared(monkeypatch):
+    calls = []
+
+    def slow_extract(file_content):
+        calls.append(file_content)
+        return file_content.decode()
+
+    monkeypatch.setitem(resume_text._EXTRACTORS, resume_text.PDF, slow_extract)
+    monkeypatch.setattr(resume_text, "_texts", resume_text.OrderedDict())
+
+    async def run():
+        first = await asyncio.gather(*(resume_text.extract(b"Jordan Lee", resume_text.PDF) for _ in range(3)))
+        again = await resume_text.extract(b"Jordan Lee", resume_text.PDF)
+        other = await resume_text.extract(b"Sam Park", resume_text.PDF)
+        return first, again, other
+
+    first, again, other = asyncio.run(run())
+
+    assert first == ["Jordan Lee"] * 3 and again == "Jordan Lee" and other == "Sam Park"
+    assert calls == [b"Jordan Lee", b"Sam Park"]
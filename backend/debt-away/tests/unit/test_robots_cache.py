@@ -0,0 +1,43 @@
+from api import robots_cache
+
+
+ROBOTS_TXT = """
+# example
+User-agent: Googlebot
+Disallow: /
+
+User-agent: *
+Disallow: /jobs/internal/
+Allow: /jobs/internal/public
+Disallow: /*.pdf$
+"""
+
+
+def test_star_group_rules():
+    rules = robots_cache.parse_robots(ROBOTS_TXT)
+
+    assert rules.check("/jobs/12345") == (False, "")
+    assert rules.check("/jobs/internal/42")[0] is True
+    # Longer Allow rule wins over the shorter Disallow prefix
+    assert rules.check("/jobs/internal/public/42") == (False, "")
+    assert rules.check("/files/offer.pdf")[0] is True
+    assert rules.check("/files/offer.pdf?x=1") == (False, "")
+
+
+def test_other_agent_groups_ignored():
+    rules = robots_cache.parse_robots("User-agent: Googlebot\nDisallow: /\n")
+
+    assert rules.check("/anything") == (False, "")
+
+
+def test_captcha_marks_everything_blocked():
+    rules = robots_cache.parse_robots("# requires reCAPTCHA verification\nUser-agent: *\n")
+
+    assert rules.check("/") == (True, "Website requires captcha verification")
+
+
+def test_negative_results_are_cached():
+    robots_cache.put_negative("https://no-robots.example.com")
+
+    assert robots_cache.get("https://no-robots.example.com") is robots_cache.ALLOW_ALL
+    assert robots_cache.get("https://unknown.example.com") is None
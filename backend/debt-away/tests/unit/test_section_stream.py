@@ -0,0 +1,62 @@
+import json
+
+from api import section_stream
+
+
+RESUME = {
+    "full_name": "Jordan \"JL\" Lee",
+    "email_address": "jordan@lee.dev",
+    "phone_number": None,
+    "home_address": "Seattle, WA",
+    "links": ["github.com/jlee"],
+    "education_history": [{"college_name": "UW", "coursework": ["Algorithms, {advanced}"]}],
+    "professional_history": [],
+    "professional_achievement": [],
+    "personal_projects": [{"project_name": "Ledger", "tech_content": [{"content": "Go, [gRPC]"}]}],
+    "professional_projects": [],
+    "technical_skills": {"Languages": ["Go"], "Frameworks": [], "Tools": []},
+}
+
+
+def _chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_members_are_reported_when_closed():
+    scanner = section_stream.TopLevelMembers()
+    members = []
+    for chunk in _chunks(json.dumps(RESUME, indent=2), 7):
+        members.extend(scanner.feed(chunk))
+
+    assert dict(members) == RESUME
+    assert [key for key, _ in members] == list(RESUME)
+
+
+def test_sections_released_in_order_as_soon_as_complete():
+    scanner = section_stream.TopLevelMembers()
+    assembler = section_stream.SectionAssembler()
+    released = []
+    seen_keys = []
+    for chunk in _chunks(json.dumps(RESUME), 5):
+        for key, value in scanner.feed(chunk):
+            seen_keys.append(key)
+            for name, data in assembler.add(key, value):
+                released.append((name, len(seen_keys)))
+
+    assert released == [
+        ("header", 5),
+        ("education", 6),
+        ("professional_history", 8),
+        ("projects", 10),
+        ("skills", 11),
+    ]
+
+
+def test_remaining_sections_from_final_object():
+    assembler = section_stream.SectionAssembler()
+    assembler.add("full_name", "Jordan")
+
+    names = [name for name, _ in assembler.remaining(RESUME)]
+
+    assert names == ["header", "education", "professional_history", "projects", "skills"]
+    assert assembler.remaining(RESUME) == []
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aws_lambda_powertools")
+pytest.importorskip("boto3")
+
+from api import usage_quota  # noqa: E402
+from api.usage_quota import CRAFT, FREE_PLAN_LIMITS, LIMIT_EXCEEDED, QUOTA_OK  # noqa: E402
+
+
+class FakeTable:
+    """The USAGE and SUBSCRIPTION items of one user, with the conditions consume_quota() sends."""
+
+    def __init__(self, usage, plan):
+        self.usage = usage
+        self.subscription = {} if plan is None else {'plan': plan}
+        self.calls = []
+
+    def _increment(self):
+        self.usage[CRAFT] = self.usage.get(CRAFT, 0) + 1
+        return {CRAFT: self.usage[CRAFT]}
+
+    async def update_item(self, pk, sk, update_expression, values=None, names=None,
+                          condition_expression=None, return_values='NONE'):
+        self.calls.append('update_item')
+        count = self.usage.get(CRAFT)
+        if condition_expression and not (count is None or count < values[':limit']):
+            raise usage_quota.ConditionalCheckFailed('condition failed')
+        return self._increment()
+
+    async def update_item_if(self, pk, sk, update_expression, check_sk, check_expression, values=None,
+                             names=None, check_values=None, check_names=None):
+        self.calls.append('update_item_if')
+        assert check_sk == 'SUBSCRIPTION'
+        if self.subscription.get('plan', check_values[':free']) == check_values[':free']:
+            raise usage_quota.ConditionalCheckFailed('transaction cancelled')
+        self._increment()
+
+
+@pytest.fixture
+def table(monkeypatch):
+    def make(usage, plan='free'):
+        fake = FakeTable(usage, plan)
+        monkeypatch.setattr(usage_quota.app_data, 'update_item', fake.update_item)
+        monkeypatch.setattr(usage_quota.app_data, 'update_item_if', fake.update_item_if)
+        return fake
+    return make
+
+
+def _consume():
+    return asyncio.run(usage_quota.consume_quota('sub-1', CRAFT))
+
+
+def test_user_under_the_limit_is_one_update(table):
+    fake = table({CRAFT: 0}, plan='pro')
+
+    assert _consume() == (QUOTA_OK, 1)
+    assert fake.calls == ['update_item']
+
+
+@pytest.mark.parametrize("plan", ['free', None])
+def test_free_user_at_the_limit_is_refused_without_incrementing(table, plan):
+    fake = table({CRAFT: FREE_PLAN_LIMITS[CRAFT]}, plan=plan)
+
+    assert _consume().status == LIMIT_EXCEEDED
+    assert fake.usage[CRAFT] == FREE_PLAN_LIMITS[CRAFT]
+
+
+def test_paid_user_past_the_limit_is_checked_against_subscription(table):
+    fake = table({CRAFT: 10}, plan='pro')
+
+    assert _consume() == (QUOTA_OK, None)
+    assert fake.usage[CRAFT] == 11
+    assert fake.calls == ['update_item', 'update_item_if']
+
+
+def test_downgrade_written_elsewhere_applies_on_the_next_call(table):
+    fake = table({CRAFT: 10, 'plan': 'pro'}, plan='pro')
+    assert _consume().allowed
+
+    fake.subscription['plan'] = 'free'  # e.g. an expiry written by the billing webhook
+
+    assert _consume().status == LIMIT_EXCEEDED
+    assert fake.usage[CRAFT] == 11